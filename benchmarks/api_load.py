@@ -0,0 +1,164 @@
+"""
+Load test for the HTTP read API.
+
+Starts `python -m src.main serve` in a separate process (or targets
+--url), optionally loads --jobs synthetic postings first, then sends a
+mix of requests from --concurrency threads, each over its own
+keep-alive connection, and reports requests/s and p50/p95/p99 per
+endpoint. Request arguments follow the corpus's Zipf distributions.
+
+    python benchmarks/api_load.py --jobs 10000 --concurrency 1,16,64
+    python benchmarks/api_load.py --url http://127.0.0.1:8080 --duration 30
+"""
+import argparse
+import gzip
+import http.client
+import json
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict
+from urllib.parse import urlencode, urlsplit
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from load_test import load_corpus, run_load
+from synthetic import SKILLS, STATES, Zipf
+
+from src.db.connection import Database
+
+ROOT = Path(__file__).parent.parent
+
+
+class Client:
+    """One keep-alive connection per thread."""
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.local = threading.local()
+
+    def get(self, path: str, headers: Dict[str, str] = None) -> http.client.HTTPResponse:
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        connection.request("GET", path, headers={"Accept-Encoding": "gzip", **(headers or {})})
+        response = connection.getresponse()
+        response.body = response.read()
+        if response.status not in (200, 304):
+            raise RuntimeError(f"{path}: HTTP {response.status}")
+        return response
+
+
+def scenarios(client: Client, high_job_id: int) -> Dict[str, Callable[[random.Random], None]]:
+    skills = Zipf(SKILLS)
+    states = Zipf(STATES)
+    etags: Dict[str, str] = {}
+
+    def search(rng):
+        query = [("skill", name) for name in skills.sample(rng, rng.randint(1, 2))]
+        if rng.random() < 0.5:
+            query.append(("state", states.draw(rng)))
+        query.append(("limit", "50"))
+        client.get("/jobs?" + urlencode(query))
+
+    def paginate(rng):
+        path = "/jobs?" + urlencode({"skill": skills.draw(rng), "limit": 50})
+        response = client.get(path)
+        for _ in range(3):
+            after = json.loads(_decode(response))["next"]
+            if after is None:
+                return
+            response = client.get(f"{path}&after={after}")
+
+    def conditional(rng):
+        path = f"/skills?limit={rng.choice([10, 20])}"
+        response = client.get(path, {"If-None-Match": etags.get(path, "")})
+        etags[path] = response.getheader("ETag")
+
+    return {
+        "search": search,
+        "paginate 3 pages": paginate,
+        "job detail": lambda rng: _detail(client, rng, high_job_id),
+        "skills": lambda rng: client.get("/skills?limit=20"),
+        "companies": lambda rng: client.get("/companies?" + urlencode({"prefix": rng.choice("ABCDEFGHIKLMNOPQRSTVZ")})),
+        "conditional GET": conditional,
+    }
+
+
+def _detail(client: Client, rng: random.Random, high_job_id: int) -> None:
+    # Ids can have gaps (deleted duplicates, dropped partitions); a 404 there is not an error.
+    try:
+        client.get(f"/jobs/{rng.randint(1, high_job_id)}")
+    except RuntimeError as e:
+        if "HTTP 404" not in str(e):
+            raise
+
+
+def _decode(response) -> bytes:
+    return gzip.decompress(response.body) if response.getheader("Content-Encoding") == "gzip" else response.body
+
+
+def start_server(port: int, pool: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.main", "serve", "--port", str(port), "--pool", str(pool)], cwd=ROOT
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("server exited during startup")
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="target a running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--pool", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=0, help="synthetic jobs to load first")
+    parser.add_argument("--concurrency", default="1,16,64")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario and concurrency")
+    parser.add_argument("--duration", type=float, help="seconds per scenario instead of --requests")
+    args = parser.parse_args()
+
+    if args.jobs:
+        load_corpus(args.jobs, 500, seed=0)
+    with Database.get_cursor() as cursor:
+        cursor.execute("SELECT COUNT(*), MAX(job_id) FROM jobs")
+        count, high = cursor.fetchone()
+    Database.close_pool()
+    print(f"{count} jobs in the database")
+
+    server = None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        host, port = "127.0.0.1", args.port
+        server = start_server(port, args.pool)
+    try:
+        client = Client(host, port)
+        available = scenarios(client, high or 1)
+        for name, operation in available.items():
+            operation(random.Random(0))  # warm-up: index load, statement cache, result cache
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                ops = None if args.duration else args.requests
+                print(run_load(name, operation, concurrency, ops, args.duration).summary())
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
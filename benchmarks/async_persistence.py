@@ -0,0 +1,94 @@
+"""
+Sync vs async persistence under concurrent load.
+
+Saves the same number of generated jobs twice against the configured
+Oracle database, in the same batches of `batch` jobs: once with
+`concurrency` threads calling save_jobs on the blocking pool, once with
+`concurrency` coroutines calling save_jobs_async on the async pool. Both
+pools get the same size, so the difference is the concurrency model
+alone, not batching.
+
+    python benchmarks/async_persistence.py --jobs 2000 --concurrency 100 --pool 4
+"""
+import argparse
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synthetic import Corpus
+
+from src.db.connection import AsyncDatabase, Database
+from src.pipeline import save_jobs, save_jobs_async
+
+
+def make_jobs(count: int, tag: str):
+    # No reposts: every job is a new row in both runs.
+    return list(Corpus(seed=count, tag=f"{tag}-", repost_rate=0).jobs(count))
+
+
+def batches_of(jobs, batch_size: int):
+    return [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+
+def run_sync(jobs, concurrency: int, pool: int, batch_size: int) -> float:
+    Database.init_pool(min_connections=pool, max_connections=pool)
+    peak_threads = 0
+
+    def worker(batch):
+        nonlocal peak_threads
+        peak_threads = max(peak_threads, threading.active_count())
+        save_jobs(batch)
+
+    batches = batches_of(jobs, batch_size)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, batches))
+    elapsed = time.perf_counter() - start
+    Database.close_pool()
+    print(f"sync   {len(jobs) / elapsed:8.0f} jobs/s  {elapsed:6.2f}s  threads={peak_threads}")
+    return elapsed
+
+
+async def run_async(jobs, concurrency: int, pool: int, batch_size: int) -> float:
+    AsyncDatabase.init_pool(min_connections=pool, max_connections=pool)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(batch):
+        async with semaphore:
+            await save_jobs_async(batch)
+
+    batches = batches_of(jobs, batch_size)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(batch) for batch in batches))
+    elapsed = time.perf_counter() - start
+    await AsyncDatabase.close_pool()
+    print(f"async  {len(jobs) / elapsed:8.0f} jobs/s  {elapsed:6.2f}s  threads={threading.active_count()}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--pool", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=20, help="jobs per save_jobs / save_jobs_async call")
+    args = parser.parse_args()
+
+    tag = uuid.uuid4().hex[:8]
+    sync_jobs = make_jobs(args.jobs, f"sync-{tag}")
+    async_jobs = make_jobs(args.jobs, f"async-{tag}")
+
+    sync_time = run_sync(sync_jobs, args.concurrency, args.pool, args.batch)
+    async_time = asyncio.run(run_async(async_jobs, args.concurrency, args.pool, args.batch))
+    print(f"speedup {sync_time / async_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Browser startup latency: cold vs warm vs standby launches.
+
+Times --launches launches per mode, from the call until about:blank
+has loaded, then quits each browser:
+
+    cold     uc.Chrome() as before: fetch and patch chromedriver, fresh profile
+    warm     cached patched driver + cloned template profile (src/scraper/launcher.py)
+    standby  take from a pool of --standby pre-started browsers, --gap seconds apart
+
+The first warm launch fills the cache and is reported on its own line.
+Needs Chrome installed; cold launches also need network access.
+
+    python benchmarks/browser_startup.py --launches 5
+    python benchmarks/browser_startup.py --modes warm,standby --standby 2 --gap 3
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper import launcher
+
+
+def timed(start_browser) -> float:
+    start = time.perf_counter()
+    driver = start_browser()
+    driver.get("about:blank")
+    elapsed = time.perf_counter() - start
+    launcher.quit_browser(driver)
+    return elapsed
+
+
+def report(mode: str, times) -> None:
+    print(
+        f"{mode:<8} median {statistics.median(times):6.2f}s  min {min(times):6.2f}s  max {max(times):6.2f}s  "
+        f"({len(times)} launches)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--launches", type=int, default=5)
+    parser.add_argument("--modes", default="cold,warm,standby")
+    parser.add_argument("--standby", type=int, default=2, help="pool size for the standby mode")
+    parser.add_argument("--gap", type=float, default=5.0, help="seconds between standby takes (work per browser)")
+    args = parser.parse_args()
+    modes = args.modes.split(",")
+
+    print(f"Chrome {launcher.chrome_version()}")
+    if "cold" in modes:
+        report("cold", [timed(launcher.launch_cold) for _ in range(args.launches)])
+
+    if "warm" in modes or "standby" in modes:
+        start = time.perf_counter()
+        launcher._warm.prepare()
+        print(f"cache    filled in {time.perf_counter() - start:.2f}s (once per Chrome version)")
+    if "warm" in modes:
+        report("warm", [timed(launcher.launch_warm) for _ in range(args.launches)])
+
+    if "standby" in modes:
+        pool = launcher.StandbyPool(args.standby)
+        time.sleep(args.gap)
+        times = []
+        for _ in range(args.launches):
+            times.append(timed(pool.take))
+            time.sleep(args.gap)
+        pool.close()
+        report("standby", times)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Bulk insert throughput: trigger-assigned ids vs cached sequence defaults.
+
+Creates two scratch tables shaped like `jobs`, one with the Phase 3
+BEFORE INSERT trigger over an uncached sequence and one with a
+DEFAULT seq.NEXTVAL column over a CACHE 1000 sequence, loads the same
+rows into each with executemany + RETURNING, then drops them.
+
+    python benchmarks/bulk_load.py --rows 100000 --batch 1000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.connection import Database
+
+VARIANTS = {
+    "trigger": [
+        "CREATE SEQUENCE bench_trg_seq START WITH 1 INCREMENT BY 1",
+        """
+        CREATE TABLE bench_trg_jobs (
+            job_id NUMBER PRIMARY KEY,
+            title VARCHAR2(255) NOT NULL,
+            company_id NUMBER,
+            location_id NUMBER,
+            post_date DATE
+        )
+        """,
+        """
+        CREATE OR REPLACE TRIGGER bench_trg_id
+        BEFORE INSERT ON bench_trg_jobs
+        FOR EACH ROW
+        WHEN (NEW.job_id IS NULL)
+        BEGIN
+            SELECT bench_trg_seq.NEXTVAL INTO :NEW.job_id FROM dual;
+        END;
+        """,
+    ],
+    "sequence_default": [
+        "CREATE SEQUENCE bench_seq_seq START WITH 1 INCREMENT BY 1 CACHE 1000",
+        """
+        CREATE TABLE bench_seq_jobs (
+            job_id NUMBER DEFAULT bench_seq_seq.NEXTVAL PRIMARY KEY,
+            title VARCHAR2(255) NOT NULL,
+            company_id NUMBER,
+            location_id NUMBER,
+            post_date DATE
+        )
+        """,
+    ],
+}
+
+TABLES = {"trigger": ("bench_trg_jobs", "bench_trg_seq"), "sequence_default": ("bench_seq_jobs", "bench_seq_seq")}
+
+
+def drop(cursor, variant: str) -> None:
+    table, seq = TABLES[variant]
+    for statement in [f"DROP TABLE {table} PURGE", f"DROP SEQUENCE {seq}"]:
+        try:
+            cursor.execute(statement)
+        except Exception as e:
+            if "ORA-00942" not in str(e) and "ORA-02289" not in str(e):
+                raise
+
+
+def load(variant: str, rows: int, batch: int) -> float:
+    table, _ = TABLES[variant]
+    with Database.get_cursor() as cursor:
+        drop(cursor, variant)
+        for statement in VARIANTS[variant]:
+            cursor.execute(statement)
+
+    start = time.perf_counter()
+    with Database.get_connection() as connection:
+        cursor = connection.cursor()
+        for offset in range(0, rows, batch):
+            size = min(batch, rows - offset)
+            id_var = cursor.var(int, arraysize=size)
+            cursor.setinputsizes(id=id_var)
+            cursor.executemany(
+                f"""
+                INSERT INTO {table} (title, company_id, location_id)
+                VALUES (:title, :company_id, :location_id)
+                RETURNING job_id INTO :id
+                """,
+                [
+                    {"title": f"Job {offset + i}", "company_id": i % 500, "location_id": i % 50}
+                    for i in range(size)
+                ],
+            )
+            assert id_var.getvalue(size - 1)[0] is not None
+            connection.commit()
+        cursor.close()
+    elapsed = time.perf_counter() - start
+
+    with Database.get_cursor() as cursor:
+        drop(cursor, variant)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = {}
+    for variant in VARIANTS:
+        results[variant] = load(variant, args.rows, args.batch)
+        print(f"{variant:<17} {args.rows / results[variant]:10.0f} rows/s  {results[variant]:6.2f}s")
+    print(f"speedup {results['trigger'] / results['sequence_default']:.1f}x")
+    Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
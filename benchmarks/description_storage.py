@@ -0,0 +1,183 @@
+"""
+Description storage: one CLOB per job vs hashed, compressed, shared bodies.
+
+Loads the same synthetic corpus into two pairs of scratch tables — jobs
+with an inline CLOB column, and jobs referencing a content-addressed
+descriptions table of zlib-compressed BLOBs — then reports segment
+sizes, listing latency and per-job detail latency (LOB locator reads vs
+fetch_lobs=False), and drops the tables.
+
+    python benchmarks/description_storage.py --jobs 50000 --unique 15000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import oracledb
+from synthetic import Corpus
+
+from src.db.connection import Database
+from src.db.repository import compress_description, decompress_description, description_hash
+
+SCHEMA = {
+    "clob": [
+        "CREATE TABLE bench_desc_clob (job_id NUMBER PRIMARY KEY, title VARCHAR2(255), description CLOB)",
+    ],
+    "hashed": [
+        """
+        CREATE TABLE bench_desc_bodies (
+            desc_hash VARCHAR2(64) PRIMARY KEY, raw_length NUMBER NOT NULL, body BLOB NOT NULL
+        ) LOB (body) STORE AS SECUREFILE
+        """,
+        """
+        CREATE TABLE bench_desc_jobs (
+            job_id NUMBER PRIMARY KEY, title VARCHAR2(255),
+            desc_hash VARCHAR2(64) REFERENCES bench_desc_bodies(desc_hash)
+        )
+        """,
+    ],
+}
+TABLES = {"clob": ["bench_desc_clob"], "hashed": ["bench_desc_jobs", "bench_desc_bodies"]}
+
+
+def drop(cursor, variant: str) -> None:
+    for table in TABLES[variant]:
+        try:
+            cursor.execute(f"DROP TABLE {table} CASCADE CONSTRAINTS PURGE")
+        except Exception as e:
+            if "ORA-00942" not in str(e):
+                raise
+
+
+def load(variant: str, jobs: list, batch: int) -> None:
+    with Database.get_cursor() as cursor:
+        drop(cursor, variant)
+        for statement in SCHEMA[variant]:
+            cursor.execute(statement)
+
+    with Database.get_connection() as connection:
+        cursor = connection.cursor()
+        stored = set()
+        for offset in range(0, len(jobs), batch):
+            chunk = jobs[offset:offset + batch]
+            if variant == "clob":
+                cursor.setinputsizes(description=oracledb.DB_TYPE_CLOB)
+                cursor.executemany(
+                    "INSERT INTO bench_desc_clob VALUES (:job_id, :title, :description)",
+                    [{"job_id": job_id, "title": title, "description": text} for job_id, title, text in chunk],
+                )
+            else:
+                bodies = {}
+                for _, _, text in chunk:
+                    desc_hash = description_hash(text)
+                    if desc_hash not in stored:
+                        bodies[desc_hash] = text
+                if bodies:
+                    cursor.setinputsizes(body=oracledb.DB_TYPE_BLOB)
+                    cursor.executemany(
+                        "INSERT INTO bench_desc_bodies VALUES (:desc_hash, :raw_length, :body)",
+                        [
+                            {"desc_hash": h, "raw_length": len(text), "body": compress_description(text)}
+                            for h, text in bodies.items()
+                        ],
+                    )
+                    stored.update(bodies)
+                cursor.executemany(
+                    "INSERT INTO bench_desc_jobs VALUES (:1, :2, :3)",
+                    [(job_id, title, description_hash(text)) for job_id, title, text in chunk],
+                )
+            connection.commit()
+        cursor.close()
+
+
+def storage_mb(variant: str) -> float:
+    tables = [t.upper() for t in TABLES[variant]]
+    binds = {f"t{i}": t for i, t in enumerate(tables)}
+    names = ", ".join(f":{key}" for key in binds)
+    with Database.get_cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT NVL(SUM(bytes), 0) FROM user_segments WHERE segment_name IN (
+                SELECT table_name FROM user_tables WHERE table_name IN ({names})
+                UNION ALL SELECT index_name FROM user_indexes WHERE table_name IN ({names})
+                UNION ALL SELECT segment_name FROM user_lobs WHERE table_name IN ({names})
+            )
+            """,
+            binds,
+        )
+        return cursor.fetchone()[0] / 1024 / 1024
+
+
+def time_listing(variant: str) -> float:
+    table = TABLES[variant][0]
+    with Database.get_cursor() as cursor:
+        cursor.arraysize = 1000
+        start = time.perf_counter()
+        cursor.execute(f"SELECT job_id, title FROM {table}")
+        cursor.fetchall()
+        return time.perf_counter() - start
+
+
+def time_details(variant: str, ids: list) -> list:
+    timings = []
+    with Database.get_cursor() as cursor:
+        for job_id in ids:
+            start = time.perf_counter()
+            if variant == "clob":
+                cursor.execute("SELECT description FROM bench_desc_clob WHERE job_id = :1", [job_id])
+                text = cursor.fetchone()[0].read()
+            else:
+                cursor.execute(
+                    """
+                    SELECT d.body FROM bench_desc_jobs j JOIN bench_desc_bodies d ON j.desc_hash = d.desc_hash
+                    WHERE j.job_id = :1
+                    """,
+                    [job_id],
+                    fetch_lobs=False,
+                )
+                text = decompress_description(cursor.fetchone()[0])
+            assert text
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--unique", type=int, default=15_000, help="distinct description texts to draw from")
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=500, help="single-job detail fetches to time")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Popular bodies (boilerplate reposts) repeat most, as they do in scraped data.
+    descriptions = Corpus(seed=42).descriptions(args.jobs, unique=args.unique)
+    jobs = [(i, f"Job {i}", text) for i, text in enumerate(descriptions, 1)]
+    raw_mb = sum(len(text) for text in descriptions) / 1024 / 1024
+    ids = rng.sample(range(1, args.jobs + 1), min(args.lookups, args.jobs))
+    print(f"{args.jobs} jobs, {len(set(descriptions))} distinct descriptions, {raw_mb:.0f} MB of raw text")
+
+    print(f"{'variant':<8} {'storage MB':>11} {'listing s':>10} {'detail ms':>10} {'p95 ms':>8}")
+    for variant in SCHEMA:
+        load(variant, jobs, args.batch)
+        size = storage_mb(variant)
+        listing = time_listing(variant)
+        details = time_details(variant, ids)
+        p95 = statistics.quantiles(details, n=20)[-1]
+        print(
+            f"{variant:<8} {size:>11.1f} {listing:>10.2f} "
+            f"{statistics.mean(details) * 1000:>10.2f} {p95 * 1000:>8.2f}"
+        )
+        with Database.get_cursor() as cursor:
+            drop(cursor, variant)
+    Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Import budget for CLI entry points.
+
+Runs each entry point in a fresh interpreter, records sys.modules as it
+exits, and fails if it imported a module it must not load. Checking
+which modules are loaded rather than how long the imports took gives
+the same answer on every machine and every run. Commands that need the
+database are run for real; if no database is reachable they fail after
+their imports, which is all that is checked.
+
+    python benchmarks/import_budget.py            # exit status 1 on any violation
+    python benchmarks/import_budget.py --verbose  # also list every module each entry point loads
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Set
+
+ROOT = Path(__file__).parent.parent
+
+BROWSER = ["selenium", "undetected_chromedriver", "src.scraper.base"]
+ANALYTICS = ["numpy", "scipy", "src.job_index", "src.similarity"]
+DRIVER = ["oracledb", "dotenv", "src.db.connection"]
+# Scrape-and-save machinery that commands reading or maintaining the database never need.
+PIPELINE = ["src.pipeline", "src.db.async_repository", "src.checkpoint", "src.scraper.filters"]
+
+# (label, interpreter arguments, modules (and their submodules) that must not be imported)
+CHECKS = [
+    ("src.main --help", ["-m", "src.main", "--help"], BROWSER + ANALYTICS + DRIVER + PIPELINE),
+    ("src.main view --help", ["-m", "src.main", "view", "--help"], BROWSER + ANALYTICS + DRIVER + PIPELINE),
+    ("import queries.query_db", ["-c", "import queries.query_db"], BROWSER + ANALYTICS + DRIVER + PIPELINE),
+    ("src.main view", ["-m", "src.main", "view"], BROWSER + ANALYTICS + PIPELINE),
+    ("src.main close-stale", ["-m", "src.main", "close-stale"], BROWSER + ANALYTICS + PIPELINE),
+    ("src.main enqueue", ["-m", "src.main", "enqueue", "plan.example.yaml"], BROWSER + ANALYTICS + PIPELINE),
+]
+
+# Runs `-m module args...` or `-c code` and writes sys.modules to IMPORT_PROBE_OUT on exit, however it exits.
+PROBE = """
+import atexit, json, os, runpy, sys
+atexit.register(lambda: open(os.environ["IMPORT_PROBE_OUT"], "w").write(json.dumps(sorted(sys.modules))))
+mode, target, *rest = sys.argv[1:]
+if mode == "-m":
+    sys.argv = [target, *rest]
+    runpy.run_module(target, run_name="__main__", alter_sys=True)
+else:
+    sys.argv = ["-c", *rest]
+    exec(compile(target, "<string>", "exec"), {"__name__": "__main__"})
+"""
+
+
+def imported_modules(args: List[str]) -> Set[str]:
+    """Names in sys.modules when an interpreter running `args` exits."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "modules.json"
+        subprocess.run(
+            [sys.executable, "-c", PROBE, *args],
+            cwd=ROOT, capture_output=True, text=True,
+            env=dict(os.environ, IMPORT_PROBE_OUT=str(out), PYTHONDONTWRITEBYTECODE="1"),
+        )
+        if not out.exists():
+            raise RuntimeError(f"no module list from {' '.join(args)}")
+        return set(json.loads(out.read_text()))
+
+
+def leaks(imported: Set[str], forbidden: List[str]) -> List[str]:
+    return sorted(name for name in forbidden if any(m == name or m.startswith(name + ".") for m in imported))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbose", action="store_true", help="list the modules each entry point loads")
+    args = parser.parse_args()
+
+    baseline = imported_modules(["-c", "pass"])
+    failures = 0
+    print(f"{'entry point':<26} {'modules':>7}  result")
+    for label, command, forbidden in CHECKS:
+        imported = imported_modules(command) - baseline
+        leaked = leaks(imported, forbidden)
+        failures += bool(leaked)
+        print(f"{label:<26} {len(imported):>7}  {'FAIL imports ' + ', '.join(leaked) if leaked else 'ok'}")
+        if args.verbose:
+            print("    " + " ".join(sorted(imported)))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Query latency of the in-memory job index.
+
+Builds a JobIndex from generated jobs (no database needed; skills,
+companies and locations follow the Zipf mix of synthetic.py) and times
+a few boolean skill/state/date filters.
+
+    python benchmarks/job_index.py --jobs 1000000
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from synthetic import SKILLS, location_names, zipf_weights
+
+from src.job_index import JobIndex
+
+QUERIES = {
+    "Python AND AWS": dict(all_skills=["Python", "AWS"]),
+    "Python AND AWS AND NOT Java in CA": dict(all_skills=["Python", "AWS"], not_skills=["Java"], states=["CA"]),
+    "... posted this month": dict(
+        all_skills=["Python", "AWS"], not_skills=["Java"], states=["CA"], posted_since=date.today().replace(day=1)
+    ),
+    "(Go OR Rust) in NY or WA, open": dict(any_skills=["Go", "Rust"], states=["NY", "WA"], active_only=True),
+}
+
+
+def zipf_probabilities(count: int) -> np.ndarray:
+    weights = np.diff(zipf_weights(count, 1.1), prepend=0.0)
+    return weights / weights.sum()
+
+
+def build(count: int, batch: int) -> JobIndex:
+    """Index `count` jobs with the synthetic corpus's Zipf skill, company and location mix.
+
+    Drawn with NumPy rather than through Corpus.job(), which would spend
+    minutes rendering descriptions the index never sees.
+    """
+    rng = np.random.default_rng(0)
+    index = JobIndex()
+    today = date.today()
+    skill_p = zipf_probabilities(len(SKILLS))
+    locations = location_names(3_000)
+    location_p = zipf_probabilities(len(locations))
+    company_p = zipf_probabilities(20_000)
+    for start in range(1, count + 1, batch):
+        ids = list(range(start, min(start + batch, count + 1)))
+        picks = rng.choice(len(SKILLS), size=(len(ids), 5), p=skill_p)
+        skills = {(job_id, SKILLS[j]) for job_id, row in zip(ids, picks.tolist()) for j in row}
+        index.append(
+            ids,
+            (rng.choice(len(company_p), len(ids), p=company_p) + 1).tolist(),
+            [locations[i][1] for i in rng.choice(len(locations), len(ids), p=location_p)],
+            [today - timedelta(days=int(d)) for d in np.minimum(rng.exponential(20, len(ids)), 365)],
+            (rng.random(len(ids)) < 0.8).tolist(),
+            sorted(skills),
+        )
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100_000, help="jobs per append, as refresh() would load them")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = build(args.jobs, args.batch)
+    bitset_mb = sum(bits.nbytes for bits in (*index.skills.values(), *index.states.values())) / 1024 / 1024
+    print(f"built {len(index)} jobs in {time.perf_counter() - start:.1f}s, bitsets {bitset_mb:.1f} MB")
+
+    for name, filters in QUERIES.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            matches = index.query(**filters)
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<38} {len(matches):>8} jobs  p50 {statistics.median(timings) * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
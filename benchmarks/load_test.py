@@ -0,0 +1,196 @@
+"""
+Database load test on a synthetic corpus.
+
+Optionally loads --jobs generated postings (see synthetic.py), then
+drives each scenario from --concurrency threads sharing a --pool sized
+connection pool and reports throughput and p50/p95/p99 latency per
+operation. Scenarios cover the write path (save_job, batched
+save_jobs), repository lookups and every QueryTool query; arguments
+are drawn from the same Zipf distributions as the corpus, so hot
+companies and skills are hit as often as they would be in real use.
+
+    python benchmarks/load_test.py --jobs 100000                      # load, then run everything
+    python benchmarks/load_test.py --scenarios search_by_skill,find_jobs --concurrency 1,8,32
+    python benchmarks/load_test.py --scenarios save_job --pool 8 --duration 30
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synthetic import SKILLS, Corpus, Zipf
+
+from queries.query_db import QueryTool
+from src.db.connection import Database
+from src.db.repository import CompanyRepository, DescriptionRepository, JobRepository
+from src.pipeline import save_job, save_jobs
+
+
+@dataclass
+class LoadResult:
+    name: str
+    concurrency: int
+    elapsed: float = 0.0
+    errors: int = 0
+    latencies: List[float] = field(default_factory=list)
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def summary(self) -> str:
+        ops = len(self.latencies)
+        return (
+            f"{self.name:<20} c={self.concurrency:<3} {ops:>7} ops {ops / self.elapsed:>9.1f} ops/s  "
+            f"p50 {self.percentile(50) * 1000:8.2f}  p95 {self.percentile(95) * 1000:8.2f}  "
+            f"p99 {self.percentile(99) * 1000:8.2f} ms  errors {self.errors}"
+        )
+
+
+def run_load(
+    name: str,
+    operation: Callable[[random.Random], None],
+    concurrency: int,
+    ops: Optional[int] = None,
+    duration: Optional[float] = None,
+) -> LoadResult:
+    """Call operation(rng) from `concurrency` threads until `ops` calls are done or `duration` passes."""
+    result = LoadResult(name, concurrency)
+    lock = threading.Lock()
+    remaining = [ops if ops is not None else float("inf")]
+    deadline = time.perf_counter() + duration if duration else float("inf")
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        latencies, errors = [], 0
+        while time.perf_counter() < deadline:
+            with lock:
+                if remaining[0] <= 0:
+                    break
+                remaining[0] -= 1
+            start = time.perf_counter()
+            try:
+                operation(rng)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+        with lock:
+            result.latencies.extend(latencies)
+            result.errors += errors
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def load_corpus(count: int, batch: int, seed: int) -> None:
+    corpus = Corpus(seed=seed, tag=f"{uuid.uuid4().hex[:6]}-")
+    start = time.perf_counter()
+    saved = 0
+    with redirect_stdout(open(os.devnull, "w")):
+        for jobs in corpus.batches(count, batch):
+            saved += save_jobs(jobs)
+    elapsed = time.perf_counter() - start
+    print(f"loaded {saved} jobs in {elapsed:.1f}s ({saved / elapsed:.0f} jobs/s, batches of {batch})")
+
+
+def scenarios(batch: int) -> Dict[str, Callable[[random.Random], None]]:
+    """Scenario name -> operation taking a per-thread rng."""
+    corpus = Corpus(seed=99, tag=f"{uuid.uuid4().hex[:6]}-")
+    corpus_lock = threading.Lock()
+    skills = Zipf(SKILLS)
+    tool = QueryTool()
+
+    with Database.get_cursor() as cursor:
+        cursor.execute("SELECT MIN(job_id), MAX(job_id) FROM jobs")
+        low, high = cursor.fetchone()
+        cursor.execute("SELECT desc_hash FROM descriptions SAMPLE (1) FETCH FIRST 1000 ROWS ONLY")
+        hashes = [row[0] for row in cursor] or [""]
+    low, high = low or 1, high or 1
+
+    def new_jobs(count: int):
+        # Generation is cheap next to a round trip, but the corpus is not thread-safe.
+        with corpus_lock:
+            return list(corpus.jobs(count))
+
+    def company(rng):
+        return corpus.companies.draw(rng)
+
+    def location(rng):
+        city, state, _ = corpus.locations.draw(rng)
+        return city if rng.random() < 0.5 else state
+
+    return {
+        "save_job": lambda rng: save_job(new_jobs(1)[0]),
+        "save_jobs": lambda rng: save_jobs(new_jobs(batch)),
+        "find_company": lambda rng: CompanyRepository.find_by_name(company(rng)),
+        "find_by_title": lambda rng: JobRepository.find_by_title(corpus.roles.draw(rng)),
+        "get_description": lambda rng: DescriptionRepository.get(rng.choice(hashes)),
+        "list_jobs": lambda rng: tool.list_jobs(active_only=True, days=7),
+        "job_details": lambda rng: tool.job_details(rng.randint(low, high)),
+        "search_by_skill": lambda rng: tool.search_by_skill(skills.draw(rng)),
+        "search_by_location": lambda rng: tool.search_by_location(location(rng)),
+        "search_by_company": lambda rng: tool.search_by_company(company(rng)),
+        "top_skills": lambda rng: tool.top_skills(10),
+        "find_jobs": lambda rng: tool.find_jobs(skills.sample(rng, 2), states=[corpus.locations.draw(rng)[1]], days=30),
+        "similar_jobs": lambda rng: tool.similar_jobs(rng.randint(low, high)),
+        "related_skills": lambda rng: tool.related_skills(skills.draw(rng)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=0, help="synthetic jobs to load first (0: use what is there)")
+    parser.add_argument("--load-batch", type=int, default=500, help="jobs per save_jobs call while loading")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scenarios", help="comma-separated subset (default: all)")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated thread counts")
+    parser.add_argument("--ops", type=int, default=200, help="operations per scenario and concurrency")
+    parser.add_argument("--duration", type=float, help="seconds per scenario instead of --ops")
+    parser.add_argument("--pool", type=int, default=10, help="connection pool size")
+    parser.add_argument("--batch", type=int, default=25, help="jobs per save_jobs operation")
+    args = parser.parse_args()
+
+    Database.init_pool(min_connections=args.pool, max_connections=args.pool)
+    if args.jobs:
+        load_corpus(args.jobs, args.load_batch, args.seed)
+
+    available = scenarios(args.batch)
+    names = args.scenarios.split(",") if args.scenarios else list(available)
+    unknown = set(names) - set(available)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))} (choose from {', '.join(available)})")
+
+    results = []
+    # QueryTool prints its results; keep them out of the report.
+    with redirect_stdout(open(os.devnull, "w")):
+        for name in names:
+            available[name](random.Random(args.seed))  # warm-up: caches, indexes, statement cache
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                results.append(run_load(name, available[name], concurrency, None if args.duration else args.ops, args.duration))
+                print(results[-1].summary(), file=sys.stderr)
+    for result in results:
+        print(result.summary())
+    Database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
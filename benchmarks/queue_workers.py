@@ -0,0 +1,106 @@
+"""
+Throughput and correctness of the scrape_tasks queue with several local workers.
+
+Enqueues a batch of simulated page tasks, runs K worker processes
+against it (SimulatedScraper instead of Chrome, jobs saved to Oracle as
+usual) and checks that no task was claimed by two workers at once and
+that every task ended DONE. Use a scratch schema: workers also pick up
+any other claimable task in scrape_tasks.
+
+    python benchmarks/queue_workers.py --workers 4 --tasks 200
+    python benchmarks/queue_workers.py --workers 4 --fail-rate 0.1   # exercises retries
+"""
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrape_memory import SimulatedScraper
+
+from src.db.connection import Database
+from src.db.models import init_schema
+from src.db.task_queue import TASK_INSERT, TaskQueue
+from src.worker import run_worker
+
+
+class FlakyScraper(SimulatedScraper):
+    page_size = 10
+    fail_rate = 0.0
+
+    def scrape_page(self, keywords, location, page):
+        if random.random() < self.fail_rate:
+            raise RuntimeError("simulated page failure")
+        return super().scrape_page(keywords, location, page)
+
+
+class RecordingQueue(TaskQueue):
+    """Remembers every claim so the parent can look for double claims."""
+
+    def __init__(self, claims):
+        super().__init__(lease=30)
+        self.claims = claims
+
+    def claim(self):
+        task = super().claim()
+        if task:
+            self.claims.put((task.task_id, task.attempts, self.worker, time.monotonic()))
+        return task
+
+
+def work(claims, fail_rate: float) -> None:
+    FlakyScraper.fail_rate = fail_rate
+    queue = RecordingQueue(claims)
+    run_worker(idle_exit=3, poll_interval=0.2, scraper_factory=lambda source: FlakyScraper, queue=queue)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    init_schema()
+    batch = f"bench-{int(time.time())}"
+    with Database.get_cursor() as cursor:
+        cursor.executemany(TASK_INSERT, [
+            {"batch": batch, "source": "simulated", "keywords": f"query {i // 5}", "location": "Anywhere", "page": i % 5}
+            for i in range(args.tasks)
+        ])
+    Database.close_pool()  # workers open their own pools after fork
+
+    claims = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=work, args=(claims, args.fail_rate)) for _ in range(args.workers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    records = []
+    while not claims.empty():
+        records.append(claims.get())
+    per_attempt = Counter((task_id, attempt) for task_id, attempt, _, _ in records)
+    double = [key for key, count in per_attempt.items() if count > 1]
+    per_worker = Counter(worker for _, _, worker, _ in records)
+
+    status = TaskQueue.status(batch)
+    print(f"{args.workers} workers, {args.tasks} tasks in {elapsed:.1f}s "
+          f"({args.tasks / elapsed:.1f} tasks/s, idle exit included)")
+    print(f"claims per worker: {', '.join(str(n) for n in sorted(per_worker.values()))}")
+    for (_, state), (tasks, saved) in status.items():
+        print(f"  {state:<8} {tasks:>6} tasks {saved:>8} jobs")
+    print(f"double claims: {len(double)}")
+    sys.exit(1 if double else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Memory benchmark for streaming scrape results.
+
+Simulates a crawl without a browser and prints resident memory every
+1000 jobs, once with jobs consumed as they are yielded and once with
+them collected into a list the way scrape_jobs used to return them
+(sampled while the list grows).
+
+    python benchmarks/scrape_memory.py --jobs 10000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from synthetic import Corpus
+
+from src.config.settings import scraper_config
+from src.scraper.base import BaseScraper
+from src.scraper.parser import ParsedJob
+
+
+class FakeDriver:
+    def __init__(self, page_size: int):
+        self.page_size = page_size
+
+    def find_elements(self, by, selector):
+        return list(range(self.page_size))
+
+    def quit(self):
+        pass
+
+
+class SimulatedScraper(BaseScraper):
+    """Runs BaseScraper.scrape_jobs against generated cards instead of Chrome."""
+
+    source = "simulated"
+    page_size = 25
+
+    def __init__(self, seed: int = 0):
+        super().__init__()
+        self.corpus = Corpus(seed=seed)
+
+    def _init_driver(self) -> None:
+        if self.driver is None:
+            self.driver = FakeDriver(self.page_size)
+
+    def _navigate(self, url: str) -> bool:
+        return True
+
+    def _page_url(self, keywords: str, location: str, page: int) -> str:
+        return ""
+
+    def _parse_job_card(self, card) -> ParsedJob:
+        return self.corpus.job()
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(mode: str, jobs: int) -> None:
+    scraper = SimulatedScraper()
+    scraper_config.max_pages = jobs // scraper.page_size + 1
+    # Sampled as jobs arrive: in list mode while the list is being built, since
+    # sampling afterwards would only show the finished list's size, 1000 times over.
+    collected = []
+    samples = []
+    for count, job in enumerate(scraper.scrape_jobs("software engineer", max_jobs=jobs), 1):
+        if mode == "list":
+            collected.append(job)
+        if count % 1000 == 0:
+            samples.append(f"{rss_mb():.0f}")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:<7} RSS MB per 1k jobs: {' '.join(samples)} | peak {peak:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--mode", choices=["stream", "list"], help="run a single mode in this process")
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.jobs)
+        return
+
+    # Each mode runs in a fresh interpreter so peak RSS is not shared.
+    for mode in ["stream", "list"]:
+        subprocess.run([sys.executable, __file__, "--mode", mode, "--jobs", str(args.jobs)], check=True)
+
+
+if __name__ == "__main__":
+    main()
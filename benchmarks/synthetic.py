@@ -0,0 +1,226 @@
+"""
+Synthetic job corpus for benchmarks and load tests.
+
+Generates ParsedJob records shaped like scraped postings at any scale:
+companies, locations, titles and skills are drawn from Zipf
+distributions (a few are everywhere, most are rare), description
+lengths follow a log-normal fitted to real postings (median ~3.5k
+characters, long tail past 10k), post dates skew recent, and a share
+of jobs are reposts that keep an earlier job's identity. Output is
+deterministic for a seed and streams, so millions of jobs never sit in
+memory at once.
+
+    from synthetic import Corpus
+    for job in Corpus(seed=1).jobs(1_000_000): ...
+"""
+import bisect
+import itertools
+import math
+import random
+import sys
+from collections import deque
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scraper.parser import ParsedJob, extract_skills
+
+SKILLS = [
+    "Python", "SQL", "AWS", "Java", "JavaScript", "Docker", "Kubernetes", "Git", "React", "Agile",
+    "Azure", "REST", "TypeScript", "CI/CD", "GCP", "Terraform", "Microservices", "PostgreSQL", "Go",
+    "Node.js", "Spring", "Scrum", "C++", "MySQL", "Jenkins", "Redis", "C#", "MongoDB", "Angular",
+    "GraphQL", "Django", "Oracle", "Flask", "Vue", "GitHub Actions", "Rust",
+]
+ROLES = [
+    "Software Engineer", "Data Engineer", "Backend Engineer", "Full Stack Developer", "DevOps Engineer",
+    "Frontend Developer", "Data Scientist", "Site Reliability Engineer", "Machine Learning Engineer",
+    "Cloud Engineer", "QA Engineer", "Platform Engineer", "Security Engineer", "Mobile Developer",
+    "Solutions Architect", "Database Administrator", "Engineering Manager", "Analytics Engineer",
+]
+LEVELS = ["", "Senior ", "Staff ", "Junior ", "Lead ", "Principal ", "Associate "]
+METROS = [
+    ("New York", "NY"), ("San Francisco", "CA"), ("Remote", None), ("Seattle", "WA"), ("Austin", "TX"),
+    ("Boston", "MA"), ("Chicago", "IL"), ("Los Angeles", "CA"), ("Washington", "DC"), ("Atlanta", "GA"),
+    ("Denver", "CO"), ("Dallas", "TX"), ("San Jose", "CA"), ("Raleigh", "NC"), ("Phoenix", "AZ"),
+    ("Miami", "FL"), ("Minneapolis", "MN"), ("Portland", "OR"), ("Salt Lake City", "UT"), ("Pittsburgh", "PA"),
+]
+STATES = [
+    "AL", "AZ", "CA", "CO", "CT", "FL", "GA", "IL", "IN", "MA", "MD", "MI", "MN", "MO", "NC",
+    "NJ", "NY", "OH", "OR", "PA", "TN", "TX", "UT", "VA", "WA", "WI",
+]
+COMPANY_PREFIXES = [
+    "Acme", "Apex", "Blue", "Bright", "Cedar", "Clear", "Delta", "Echo", "First", "Forge", "Granite", "Harbor",
+    "Iron", "Keystone", "Lumen", "Maple", "Nova", "Nimbus", "Orbit", "Peak", "Pioneer", "Quantum", "Summit",
+    "Silver", "Stellar", "Terra", "True", "Vertex", "Vista", "Zenith",
+]
+COMPANY_SUFFIXES = [
+    "Analytics", "Systems", "Labs", "Health", "Financial", "Logistics", "Software", "Networks", "Energy",
+    "Robotics", "Media", "Capital", "Bio", "Retail", "Security", "Cloud", "Data", "Mobility", "Insurance", "Group",
+]
+
+# Boilerplate a posting is mostly made of; skill sentences are mixed in per job.
+SENTENCES = [
+    "We are looking for a {role} to join our {team} team.",
+    "You will design, build and operate services used by millions of customers.",
+    "Collaborate with product, design and data partners to ship features end to end.",
+    "Mentor engineers, review code and raise the bar for quality and reliability.",
+    "Our benefits include {benefit}, {benefit2} and a generous learning budget.",
+    "{company} is an equal opportunity employer and values diversity at every level.",
+    "You care about clean interfaces, observability and pragmatic testing.",
+    "This role reports to the head of {team} and works across several time zones.",
+    "Bachelor's degree in computer science or equivalent practical experience.",
+    "We offer flexible hours, a home office stipend and {benefit}.",
+    "Participate in an on-call rotation and help us improve incident response.",
+    "Write design documents, estimate work and communicate trade-offs clearly.",
+]
+SKILL_SENTENCES = [
+    "Experience with {skill} is required.",
+    "Hands-on {skill} experience in production.",
+    "Familiarity with {skill} is a plus.",
+    "You have shipped systems built on {skill}.",
+]
+TEAMS = ["platform", "payments", "search", "growth", "infrastructure", "data", "identity", "mobile", "ads"]
+BENEFITS = ["health insurance", "401k matching", "remote work", "equity", "parental leave", "tuition support"]
+
+
+def zipf_weights(count: int, exponent: float) -> List[float]:
+    """Cumulative Zipf weights for ranks 1..count."""
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+class Zipf:
+    """Draws items by rank with probability proportional to 1 / rank^exponent."""
+
+    def __init__(self, items: Sequence, exponent: float = 1.1):
+        self.items = items
+        self.cumulative = zipf_weights(len(items), exponent)
+        self.total = self.cumulative[-1]
+
+    def draw(self, rng: random.Random):
+        return self.items[bisect.bisect(self.cumulative, rng.random() * self.total)]
+
+    def sample(self, rng: random.Random, k: int) -> list:
+        """k distinct items (fewer if there are not that many)."""
+        k = min(k, len(self.items))
+        picked = {}
+        while len(picked) < k:
+            item = self.draw(rng)
+            picked[item] = None
+        return list(picked)
+
+
+def company_names(count: int) -> List[str]:
+    combos = [f"{prefix} {suffix}" for prefix in COMPANY_PREFIXES for suffix in COMPANY_SUFFIXES]
+    names = combos[:count]
+    for i in range(len(names), count):
+        names.append(f"{combos[i % len(combos)]} {i // len(combos) + 1}")
+    return names
+
+
+def location_names(count: int) -> List[Tuple[str, str, str]]:
+    """(city, state, country); real metros first, then a long tail of smaller towns."""
+    locations = [(city, state or "Unknown", "USA") for city, state in METROS[:count]]
+    for i in range(len(locations), count):
+        locations.append((f"Town {i}", STATES[i % len(STATES)], "USA"))
+    return locations
+
+
+class Corpus:
+    def __init__(
+        self,
+        seed: int = 0,
+        companies: int = 20_000,
+        locations: int = 3_000,
+        exponent: float = 1.1,
+        repost_rate: float = 0.05,
+        days: int = 365,
+        tag: str = "",
+    ):
+        self.rng = random.Random(seed)
+        self.companies = Zipf(company_names(companies), exponent)
+        self.locations = Zipf(location_names(locations), exponent)
+        self.skills = Zipf(SKILLS, exponent)
+        self.roles = Zipf(ROLES, exponent)
+        self.levels = Zipf(LEVELS, exponent)
+        self.repost_rate = repost_rate
+        self.days = days
+        self.tag = tag
+        self.today = date.today()
+        self._recent: deque = deque(maxlen=10_000)
+        self._requisition = itertools.count(1)
+        # Pre-rendered boilerplate, so a description costs a join rather than dozens of format() calls.
+        self._sentences = [self._render(self.rng.choice(SENTENCES)) for _ in range(5_000)]
+
+    def _render(self, template: str) -> str:
+        return template.format(
+            role=self.roles.draw(self.rng),
+            team=self.rng.choice(TEAMS),
+            benefit=self.rng.choice(BENEFITS),
+            benefit2=self.rng.choice(BENEFITS),
+            company=self.companies.draw(self.rng),
+        )
+
+    def description_length(self) -> int:
+        """Characters in a posting: log-normal around 3.5k, clipped to 300..20k."""
+        return int(min(20_000, max(300, self.rng.lognormvariate(math.log(3_500), 0.55))))
+
+    def description(self, skills: Sequence[str] = ()) -> str:
+        target = self.description_length()
+        parts = [self.rng.choice(SKILL_SENTENCES).format(skill=skill) for skill in skills]
+        size = sum(len(part) + 1 for part in parts)
+        while size < target:
+            sentence = self.rng.choice(self._sentences)
+            parts.append(sentence)
+            size += len(sentence) + 1
+        self.rng.shuffle(parts)
+        return " ".join(parts)
+
+    def descriptions(self, count: int, unique: Optional[int] = None) -> List[str]:
+        """count descriptions drawn from `unique` distinct bodies, popular bodies repeating most."""
+        bodies = [self.description(self.skills.sample(self.rng, self.rng.randint(2, 8))) for _ in range(unique or count)]
+        if unique is None:
+            return bodies
+        pool = Zipf(bodies, 0.8)
+        return [pool.draw(self.rng) for _ in range(count)]
+
+    def job(self) -> ParsedJob:
+        if self._recent and self.rng.random() < self.repost_rate:
+            # Same title, company and location as an earlier posting, so the same job_key.
+            earlier = self.rng.choice(self._recent)
+            title, company, (city, state, country) = earlier
+        else:
+            title = f"{self.levels.draw(self.rng)}{self.roles.draw(self.rng)} (R{self.tag}{next(self._requisition)})"
+            company = self.companies.draw(self.rng)
+            city, state, country = self.locations.draw(self.rng)
+            self._recent.append((title, company, (city, state, country)))
+
+        description = self.description(self.skills.sample(self.rng, self.rng.randint(2, 8)))
+        age = min(self.days, int(self.rng.expovariate(1 / 20)))
+        # Scrapers store fully remote postings under the Unknown place (see src/scraper/locations.py).
+        remote = city == "Remote"
+        return ParsedJob(
+            title=title,
+            company=company,
+            city="Unknown" if remote else city,
+            state=state,
+            country=country,
+            description=description,
+            skills=extract_skills(description),
+            post_date=self.today - timedelta(days=age),
+            work_mode="remote" if remote else None,
+        )
+
+    def jobs(self, count: int) -> Iterator[ParsedJob]:
+        for _ in range(count):
+            yield self.job()
+
+    def batches(self, count: int, size: int) -> Iterator[List[ParsedJob]]:
+        jobs = self.jobs(count)
+        while True:
+            batch = list(itertools.islice(jobs, size))
+            if not batch:
+                return
+            yield batch
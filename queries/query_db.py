@@ -1,15 +1,32 @@
 """
 Database query tool for LinkedIn job scraper.
 Interactive CLI for querying the normalized database.
+
+With --query it runs named queries instead of the menu and streams their
+rows as CSV or NDJSON, for scripts and reporting jobs:
+
+    python queries/query_db.py --list
+    python queries/query_db.py --query jobs since=2024-01-01 status=OPEN > jobs.csv
+    python queries/query_db.py --format ndjson --query top-skills limit=50 \
+        --query skill skill=Python -o "export/{query}.ndjson"
+
+All queries share one connection, and each statement is prepared once
+however often it runs. Rows are fetched --arraysize at a time and written
+as they arrive, so result size does not bound memory. Progress goes to
+stderr, leaving stdout to the data.
 """
+import argparse
+import csv
+import json
 import sys
+import time
+from datetime import date, datetime
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import logging
-from src.db.connection import Database
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,9 +40,26 @@ class QueryTool:
         """Initialize using shared database pool."""
         logger.info("Connected to Oracle database")
 
+    def _cursor(self):
+        """Pooled cursor. The DB stack is imported on the first query, not before the menu shows."""
+        from src.db.connection import Database
+
+        return Database.get_cursor()
+
+    def _rows(self, name, params, tables, sql, binds=()):
+        """Rows of a read query, served from the shared result cache until one of `tables` changes."""
+        from src.query_cache import shared_cache
+
+        def run():
+            with self._cursor() as cursor:
+                cursor.execute(sql, binds)
+                return cursor.fetchall()
+
+        return shared_cache().get(name, params, tables, run)
+
     def list_tables(self):
         """List all tables in the database."""
-        with Database.get_cursor() as cursor:
+        with self._cursor() as cursor:
             cursor.execute("""
                 SELECT table_name FROM user_tables 
                 WHERE table_name IN ('COMPANIES', 'LOCATIONS', 'SKILLS', 'JOBS', 'JOB_SKILLS')
@@ -39,7 +73,7 @@ class QueryTool:
 
     def describe_table(self, table_name):
         """Describe the structure of a specific table."""
-        with Database.get_cursor() as cursor:
+        with self._cursor() as cursor:
             cursor.execute(
                 "SELECT column_name, data_type FROM user_tab_columns WHERE table_name = UPPER(:1)",
                 (table_name,)
@@ -51,76 +85,125 @@ class QueryTool:
             return columns
 
     def count_records(self, table_name):
-        """Count the number of records in a table."""
-        with Database.get_cursor() as cursor:
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            count = cursor.fetchone()[0]
-            print(f"\nRecords in '{table_name}': {count}")
-            return count
-
-    def list_jobs(self):
-        """List all jobs with company and location details."""
-        with Database.get_cursor() as cursor:
-            cursor.execute("""
+        """Count the number of records in a table.
+
+        Only tables with a data version are counted through the cache; any
+        other table (data_versions, scrape_tasks) is counted afresh.
+        """
+        from src.db.versions import VERSIONED_TABLES
+
+        table = table_name.lower()
+        sql = f"SELECT COUNT(*) FROM {table}"
+        if table in VERSIONED_TABLES:
+            count = self._rows("count_records", (table,), (table,), sql)[0][0]
+        else:
+            with self._cursor() as cursor:
+                cursor.execute(sql)
+                count = cursor.fetchone()[0]
+        print(f"\nRecords in '{table_name}': {count}")
+        return count
+
+    def list_jobs(self, active_only=False, days=None):
+        """List all jobs with company and location details.
+
+        `days` limits the listing to jobs first seen in the last N days.
+        Such jobs were also last seen in that window, and saying so lets
+        Oracle prune the monthly (last_seen) partitions of jobs.
+        """
+        from datetime import date, timedelta
+
+        filters, binds = [], {}
+        if active_only:
+            filters.append("j.status = 'OPEN'")
+        if days:
+            filters.append("j.first_seen >= :since AND j.last_seen >= :since")
+            binds["since"] = date.today() - timedelta(days=days)
+        jobs = self._rows(
+            "list_jobs",
+            (active_only, binds.get("since")),
+            ("jobs", "companies", "locations"),
+            f"""
                 SELECT j.job_id, j.title, c.name AS company_name, 
                        l.city, l.state, l.country, j.post_date
                 FROM jobs j
                 JOIN companies c ON j.company_id = c.company_id
                 JOIN locations l ON j.location_id = l.location_id
+                {"WHERE " + " AND ".join(filters) if filters else ""}
                 ORDER BY j.job_id DESC
-            """)
-            jobs = cursor.fetchall()
-            
-            print("\nJobs in Database:")
-            print("=" * 80)
-            for job in jobs:
-                location = ', '.join(filter(None, [job[3], job[4], job[5]]))
-                date_str = job[6].strftime('%Y-%m-%d') if job[6] else 'N/A'
-                print(f"  [{job[0]}] {job[1]} at {job[2]} ({location}) - {date_str}")
-            
-            return jobs
-
-    def job_details(self, job_id):
-        """Get detailed information about a specific job."""
-        with Database.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT j.job_id, j.title, c.name AS company_name,
-                       l.city, l.state, l.country, j.description, j.post_date
-                FROM jobs j
-                JOIN companies c ON j.company_id = c.company_id
-                JOIN locations l ON j.location_id = l.location_id
-                WHERE j.job_id = :1
-            """, (job_id,))
-            job = cursor.fetchone()
-            
-            if not job:
-                print(f"No job found with ID {job_id}")
-                return None
-            
-            cursor.execute("""
-                SELECT s.skill_name
-                FROM job_skills js
-                JOIN skills s ON js.skill_id = s.skill_id
-                WHERE js.job_id = :1
-            """, (job_id,))
-            skills = [row[0] for row in cursor.fetchall()]
-            
-            print("\nJob Details:")
-            print("=" * 80)
-            print(f"Title: {job[1]}")
-            print(f"Company: {job[2]}")
+            """,
+            binds,
+        )
+
+        print("\nJobs in Database:")
+        print("=" * 80)
+        for job in jobs:
             location = ', '.join(filter(None, [job[3], job[4], job[5]]))
-            print(f"Location: {location}")
-            print(f"Posted: {job[7]}")
-            print(f"\nSkills: {', '.join(skills) if skills else 'None listed'}")
-            print(f"\nDescription:\n{'-' * 40}\n{job[6] or 'No description'}")
-            
-            return job
+            date_str = job[6].strftime('%Y-%m-%d') if job[6] else 'N/A'
+            print(f"  [{job[0]}] {job[1]} at {job[2]} ({location}) - {date_str}")
+
+        return jobs
+
+    def job_details(self, job_id, show_description=True):
+        """Get detailed information about a specific job.
+
+        The description body is only read when asked for, in a second
+        query against the descriptions table.
+        """
+        rows = self._rows("job_details", (job_id,), ("jobs", "companies", "locations"), """
+            SELECT j.job_id, j.title, c.name AS company_name,
+                   l.city, l.state, l.country, j.desc_hash, j.post_date
+            FROM jobs j
+            JOIN companies c ON j.company_id = c.company_id
+            JOIN locations l ON j.location_id = l.location_id
+            WHERE j.job_id = :1
+        """, (job_id,))
+        if not rows:
+            print(f"No job found with ID {job_id}")
+            return None
+        job = rows[0]
+
+        skills = [row[0] for row in self._rows("job_skills", (job_id,), ("job_skills", "skills"), """
+            SELECT s.skill_name
+            FROM job_skills js
+            JOIN skills s ON js.skill_id = s.skill_id
+            WHERE js.job_id = :1
+        """, (job_id,))]
+
+        print("\nJob Details:")
+        print("=" * 80)
+        print(f"Title: {job[1]}")
+        print(f"Company: {job[2]}")
+        location = ', '.join(filter(None, [job[3], job[4], job[5]]))
+        print(f"Location: {location}")
+        print(f"Posted: {job[7]}")
+        print(f"\nSkills: {', '.join(skills) if skills else 'None listed'}")
+        if show_description:
+            print(f"\nDescription:\n{'-' * 40}\n{self.description(job[6]) or 'No description'}")
+
+        return job
+
+    def description(self, desc_hash):
+        """Fetch one description body as a string, without a LOB round trip."""
+        from src.db.repository import decompress_description
+
+        if not desc_hash:
+            return None
+        with self._cursor() as cursor:
+            cursor.execute(
+                "SELECT body FROM descriptions WHERE desc_hash = :1",
+                (desc_hash,),
+                fetch_lobs=False,
+            )
+            row = cursor.fetchone()
+            return decompress_description(row[0]) if row else None
 
     def search_by_skill(self, skill):
         """Search for jobs requiring a specific skill."""
-        with Database.get_cursor() as cursor:
-            cursor.execute("""
+        jobs = self._rows(
+            "search_by_skill",
+            (skill.upper(),),
+            ("jobs", "companies", "locations", "job_skills", "skills"),
+            """
                 SELECT j.job_id, j.title, c.name AS company_name, 
                        l.city, l.state
                 FROM jobs j
@@ -129,88 +212,387 @@ class QueryTool:
                 JOIN job_skills js ON j.job_id = js.job_id
                 JOIN skills s ON js.skill_id = s.skill_id
                 WHERE UPPER(s.skill_name) LIKE UPPER(:1)
-            """, (f"%{skill}%",))
-            jobs = cursor.fetchall()
-            
-            print(f"\nJobs requiring '{skill}':")
-            print("=" * 60)
-            if jobs:
-                for job in jobs:
-                    loc = ', '.join(filter(None, [job[3], job[4]]))
-                    print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
-            else:
-                print(f"  No jobs found requiring '{skill}'")
-            return jobs
+            """,
+            (f"%{skill}%",),
+        )
+
+        print(f"\nJobs requiring '{skill}':")
+        print("=" * 60)
+        if jobs:
+            for job in jobs:
+                loc = ', '.join(filter(None, [job[3], job[4]]))
+                print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
+        else:
+            print(f"  No jobs found requiring '{skill}'")
+        return jobs
 
     def search_by_location(self, location):
-        """Search for jobs in a specific location."""
-        with Database.get_cursor() as cursor:
-            pattern = f"%{location}%"
-            cursor.execute("""
+        """Search for jobs in a specific location.
+
+        Input is normalised like scraped locations ("Austin, Texas", "NYC",
+        "Remote"), so known places match canonical rows by equality on the
+        indexed columns; anything else falls back to a substring search.
+        """
+        from src.scraper.locations import UNKNOWN, normalize_location
+
+        place = normalize_location(location)
+        conditions, binds = [], {}
+        if place.state != UNKNOWN:
+            conditions.append("l.state = :state AND l.country = :country")
+            binds.update(state=place.state, country=place.country)
+            if place.city != UNKNOWN:
+                conditions.append("l.city = :city")
+                binds["city"] = place.city
+        if place.work_mode:
+            conditions.append("j.work_mode = :work_mode")
+            binds["work_mode"] = place.work_mode
+        if not conditions:
+            conditions.append("(UPPER(l.city) LIKE UPPER(:pattern) OR UPPER(l.state) LIKE UPPER(:pattern))")
+            binds["pattern"] = f"%{location.strip()}%"
+
+        jobs = self._rows(
+            "search_by_location",
+            tuple(sorted(binds.items())),
+            ("jobs", "companies", "locations"),
+            f"""
                 SELECT j.job_id, j.title, c.name AS company_name, 
                        l.city, l.state
                 FROM jobs j
                 JOIN companies c ON j.company_id = c.company_id
                 JOIN locations l ON j.location_id = l.location_id
-                WHERE UPPER(l.city) LIKE UPPER(:1) 
-                    OR UPPER(l.state) LIKE UPPER(:2)
-            """, (pattern, pattern))
-            jobs = cursor.fetchall()
-        
-            print(f"\nJobs in '{location}':")
-            print("=" * 60)
-            if jobs:
-                for job in jobs:
-                    loc = ', '.join(filter(None, [job[3], job[4]]))
-                    print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
-            else:
-                print(f"  No jobs found in '{location}'")
-            return jobs
+                WHERE {" AND ".join(conditions)}
+            """,
+            binds,
+        )
+
+        print(f"\nJobs in '{location}':")
+        print("=" * 60)
+        if jobs:
+            for job in jobs:
+                loc = ', '.join(filter(None, [job[3], job[4]]))
+                print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
+        else:
+            print(f"  No jobs found in '{location}'")
+        return jobs
 
     def search_by_company(self, company):
         """Search for jobs at a specific company."""
-        with Database.get_cursor() as cursor:
-            cursor.execute("""
+        jobs = self._rows(
+            "search_by_company",
+            (company.upper(),),
+            ("jobs", "companies", "locations"),
+            """
                 SELECT j.job_id, j.title, c.name AS company_name, 
                        l.city, l.state
                 FROM jobs j
                 JOIN companies c ON j.company_id = c.company_id
                 JOIN locations l ON j.location_id = l.location_id
                 WHERE UPPER(c.name) LIKE UPPER(:1)
-            """, (f"%{company}%",))
-            jobs = cursor.fetchall()
-            
-            print(f"\nJobs at '{company}':")
-            print("=" * 60)
-            if jobs:
-                for job in jobs:
-                    loc = ', '.join(filter(None, [job[3], job[4]]))
-                    print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
-            else:
-                print(f"  No jobs found at '{company}'")
-            return jobs
+            """,
+            (f"%{company}%",),
+        )
+
+        print(f"\nJobs at '{company}':")
+        print("=" * 60)
+        if jobs:
+            for job in jobs:
+                loc = ', '.join(filter(None, [job[3], job[4]]))
+                print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
+        else:
+            print(f"  No jobs found at '{company}'")
+        return jobs
 
     def top_skills(self, limit=10):
         """List the most in-demand skills."""
-        with Database.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT s.skill_name, COUNT(js.job_id) as job_count
-                FROM skills s
-                JOIN job_skills js ON s.skill_id = js.skill_id
-                GROUP BY s.skill_name
-                ORDER BY job_count DESC
-                FETCH FIRST :1 ROWS ONLY
-            """, (limit,))
-            skills = cursor.fetchall()
-            
-            print(f"\nTop {limit} In-Demand Skills:")
-            print("=" * 40)
-            for i, skill in enumerate(skills, 1):
-                print(f"  {i}. {skill[0]} ({skill[1]} jobs)")
-            return skills
-
-
-def main():
+        skills = self._rows("top_skills", (limit,), ("skills", "job_skills"), """
+            SELECT s.skill_name, COUNT(js.job_id) as job_count
+            FROM skills s
+            JOIN job_skills js ON s.skill_id = js.skill_id
+            GROUP BY s.skill_name
+            ORDER BY job_count DESC
+            FETCH FIRST :1 ROWS ONLY
+        """, (limit,))
+
+        print(f"\nTop {limit} In-Demand Skills:")
+        print("=" * 40)
+        for i, skill in enumerate(skills, 1):
+            print(f"  {i}. {skill[0]} ({skill[1]} jobs)")
+        return skills
+
+    def find_jobs(self, skills=(), exclude=(), any_skills=(), states=(), days=None, active_only=False, limit=50):
+        """Boolean skill/state/date search against the in-memory job index.
+
+        e.g. find_jobs(["Python", "AWS"], exclude=["Java"], states=["CA"], days=30)
+        The index is loaded on first use and picks up new jobs on each call.
+        """
+        from datetime import date, timedelta
+        from src.job_index import shared_index
+
+        index = shared_index()
+        job_ids = index.query(
+            all_skills=skills,
+            any_skills=any_skills,
+            not_skills=exclude,
+            states=states,
+            posted_since=date.today() - timedelta(days=days) if days else None,
+            active_only=active_only,
+        )
+        # Newest first; only the rows that get printed are read from the database.
+        shown = [int(job_id) for job_id in job_ids[::-1][:limit]]
+
+        print(f"\n{len(job_ids)} of {len(index)} jobs match")
+        print("=" * 60)
+        if shown:
+            binds = {f"id{i}": job_id for i, job_id in enumerate(shown)}
+            with self._cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT j.job_id, j.title, c.name AS company_name, l.city, l.state
+                    FROM jobs j
+                    JOIN companies c ON j.company_id = c.company_id
+                    JOIN locations l ON j.location_id = l.location_id
+                    WHERE j.job_id IN ({", ".join(":" + name for name in binds)})
+                    ORDER BY j.job_id DESC
+                """, binds)
+                for job in cursor.fetchall():
+                    loc = ', '.join(filter(None, [job[3], job[4]]))
+                    print(f"  [{job[0]}] {job[1]} at {job[2]} ({loc})")
+        return job_ids
+
+    def similar_jobs(self, job_id, limit=10):
+        """Jobs whose skill profile is closest to job_id's (TF-IDF cosine)."""
+        from src.similarity import shared_engine
+
+        matches = shared_engine().similar_jobs(job_id, limit)
+        print(f"\nJobs similar to [{job_id}]:")
+        print("=" * 60)
+        if not matches:
+            print("  No similar jobs (unknown job or no skills)")
+            return matches
+        scores = dict(matches)
+        binds = {f"id{i}": similar_id for i, similar_id in enumerate(scores)}
+        with self._cursor() as cursor:
+            cursor.execute(f"""
+                SELECT j.job_id, j.title, c.name AS company_name
+                FROM jobs j
+                JOIN companies c ON j.company_id = c.company_id
+                WHERE j.job_id IN ({", ".join(":" + name for name in binds)})
+            """, binds)
+            titles = {row[0]: row[1:] for row in cursor.fetchall()}
+        for similar_id, score in matches:
+            title, company = titles.get(similar_id, ("?", "?"))
+            print(f"  {score:.2f}  [{similar_id}] {title} at {company}")
+        return matches
+
+    def related_skills(self, skill, limit=10):
+        """Skills most often listed together with `skill`."""
+        from src.similarity import shared_engine
+
+        related = shared_engine().co_skills(skill, limit)
+        print(f"\nSkills that appear with '{skill}':")
+        print("=" * 40)
+        if not related:
+            print(f"  No co-occurring skills found for '{skill}'")
+        for name, count, share in related:
+            print(f"  {name} ({count} jobs, {share:.0%})")
+        return related
+
+
+def _state(value):
+    from src.scraper.locations import normalize_state
+
+    return normalize_state(value)
+
+
+_LISTING = """
+    SELECT j.job_id, j.title, c.name AS company, l.city, l.state, l.country, j.work_mode, j.status, j.post_date
+    FROM jobs j
+    JOIN companies c ON j.company_id = c.company_id
+    JOIN locations l ON j.location_id = l.location_id
+"""
+
+# name -> (SQL, {parameter: (cast, default)}); parameters without a default are required.
+# `since` bounds first_seen; the implied last_seen bound lets Oracle read only the monthly partitions it needs.
+BATCH_QUERIES = {
+    "jobs": ("""
+        SELECT j.job_id, j.job_key, j.title, c.name AS company, l.city, l.state, l.country,
+               j.work_mode, j.status, j.post_date, j.first_seen, j.last_seen
+        FROM jobs j
+        JOIN companies c ON j.company_id = c.company_id
+        JOIN locations l ON j.location_id = l.location_id
+        WHERE j.first_seen >= :since AND j.last_seen >= :since AND (:status IS NULL OR j.status = :status)
+        ORDER BY j.job_id
+    """, {"since": (date.fromisoformat, date(1970, 1, 1)), "status": (str.upper, None)}),
+    "job-skills": ("""
+        SELECT js.job_id, s.skill_name
+        FROM jobs j
+        JOIN job_skills js ON js.job_id = j.job_id
+        JOIN skills s ON js.skill_id = s.skill_id
+        WHERE j.first_seen >= :since AND j.last_seen >= :since
+        ORDER BY js.job_id
+    """, {"since": (date.fromisoformat, date(1970, 1, 1))}),
+    "skill": (_LISTING + """
+        WHERE j.job_id IN (
+            SELECT js.job_id FROM job_skills js JOIN skills s ON js.skill_id = s.skill_id
+            WHERE UPPER(s.skill_name) = UPPER(:skill)
+        )
+        ORDER BY j.job_id
+    """, {"skill": (str, ...)}),
+    "company": (_LISTING + """
+        WHERE UPPER(c.name) LIKE UPPER(:company)
+        ORDER BY j.job_id
+    """, {"company": (lambda value: f"%{value}%", ...)}),
+    "state": (_LISTING + """
+        WHERE l.state = :state
+          AND (:city IS NULL OR l.city = :city)
+          AND (:work_mode IS NULL OR j.work_mode = :work_mode)
+        ORDER BY j.job_id
+    """, {"state": (_state, ...), "city": (str, None), "work_mode": (str.lower, None)}),
+    "companies": ("""
+        SELECT c.company_id, c.name AS company, COUNT(*) AS jobs,
+               COUNT(CASE WHEN j.status = 'OPEN' THEN 1 END) AS open_jobs
+        FROM jobs j
+        JOIN companies c ON j.company_id = c.company_id
+        WHERE j.first_seen >= :since AND j.last_seen >= :since
+        GROUP BY c.company_id, c.name
+        ORDER BY jobs DESC
+    """, {"since": (date.fromisoformat, date(1970, 1, 1))}),
+    "top-skills": ("""
+        SELECT s.skill_name, COUNT(js.job_id) AS jobs
+        FROM skills s
+        JOIN job_skills js ON s.skill_id = js.skill_id
+        GROUP BY s.skill_name
+        ORDER BY jobs DESC
+        FETCH FIRST :limit ROWS ONLY
+    """, {"limit": (int, 10)}),
+}
+
+
+def batch_params(name, pairs):
+    """Bind values for a named query from key=value strings, with defaults filled in."""
+    if name not in BATCH_QUERIES:
+        raise ValueError(f"Unknown query '{name}' (known: {', '.join(BATCH_QUERIES)})")
+    spec = BATCH_QUERIES[name][1]
+    given = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or key not in spec:
+            raise ValueError(f"Bad parameter '{pair}' for {name} (accepts: {', '.join(spec) or 'none'})")
+        given[key] = spec[key][0](value)
+    binds = {}
+    for key, (_, default) in spec.items():
+        if key not in given and default is ...:
+            raise ValueError(f"Query {name} needs {key}=...")
+        binds[key] = given.get(key, default)
+    return binds
+
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+class CsvWriter:
+    """Header row per query; several queries in one stream are separated by a blank line."""
+
+    def __init__(self, out, shared):
+        self.writer = csv.writer(out)
+        self.started = False
+
+    def begin(self, name, columns):
+        if self.started:
+            self.writer.writerow([])
+        self.started = True
+        self.writer.writerow(columns)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+
+class NdjsonWriter:
+    """One JSON object per row; rows of several queries in one stream carry a "query" field."""
+
+    def __init__(self, out, shared):
+        self.out = out
+        self.shared = shared
+
+    def begin(self, name, columns):
+        self.columns = (["query"] if self.shared else []) + columns
+        self.prefix = [name] if self.shared else []
+
+    def write(self, rows):
+        self.out.writelines(json.dumps(dict(zip(self.columns, self.prefix + list(row)))) + "\n" for row in rows)
+
+
+WRITERS = {"csv": CsvWriter, "ndjson": NdjsonWriter}
+
+
+def run_batch(requests, output=None, fmt="csv", arraysize=5000):
+    """Run (name, binds) requests on one connection, streaming rows to `output`.
+
+    `output` is a path, a path containing "{query}" for one file per
+    query name (a name run twice keeps its last result), or None for
+    stdout. Returns the row count of each request.
+    """
+    import oracledb
+    from src.db.connection import Database
+
+    per_query = output is not None and "{query}" in output
+    shared = len(requests) > 1 and not per_query
+    counts = []
+    with Database.get_connection() as connection:
+        cursors = {}
+        stream = None
+        try:
+            if not per_query:
+                stream = open(output, "w", newline="", encoding="utf-8") if output else sys.stdout
+                writer = WRITERS[fmt](stream, shared)
+            for name, binds in requests:
+                cursor = cursors.get(name)
+                if cursor is None:
+                    cursor = cursors[name] = connection.cursor()
+                    cursor.arraysize = arraysize
+                    cursor.prepare(BATCH_QUERIES[name][0])
+                if per_query:
+                    path = Path(output.format(query=name))
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    stream = open(path, "w", newline="", encoding="utf-8")
+                    writer = WRITERS[fmt](stream, False)
+
+                start = time.monotonic()
+                cursor.execute(None, binds)
+                columns = [column[0].lower() for column in cursor.description]
+                dates = [i for i, column in enumerate(cursor.description)
+                         if column[1] in (oracledb.DB_TYPE_DATE, oracledb.DB_TYPE_TIMESTAMP)]
+                writer.begin(name, columns)
+                count = 0
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    if dates or fmt == "ndjson":
+                        rows = [[_plain(value) for value in row] for row in rows]
+                    writer.write(rows)
+                    count += len(rows)
+                if per_query:
+                    stream.close()
+                logger.info(f"{name}: {count} rows in {time.monotonic() - start:.2f}s")
+                counts.append(count)
+        finally:
+            for cursor in cursors.values():
+                cursor.close()
+            if stream is not None and stream is not sys.stdout and not stream.closed:
+                stream.close()
+            elif stream is sys.stdout:
+                stream.flush()
+    return counts
+
+
+def list_batch_queries():
+    for name, (_, spec) in BATCH_QUERIES.items():
+        params = " ".join(f"{key}=..." if default is ... else f"[{key}=...]" for key, (_, default) in spec.items())
+        print(f"  {name} {params}".rstrip())
+
+
+def interactive():
     tool = QueryTool()
     
     print("\n" + "=" * 50)
@@ -228,6 +610,9 @@ def main():
         print("  7. Search by location")
         print("  8. Search by company")
         print("  9. Top skills")
+        print("  10. Find jobs (skills AND/NOT, state, recency)")
+        print("  11. Similar jobs")
+        print("  12. Related skills")
         print("  0. Exit")
         
         choice = input("\nChoice: ").strip()
@@ -245,10 +630,12 @@ def main():
                 table = input("Table name: ").strip()
                 tool.count_records(table)
             elif choice == '4':
-                tool.list_jobs()
+                days = input("First seen in last N days (blank for all): ").strip()
+                tool.list_jobs(days=int(days) if days else None)
             elif choice == '5':
                 job_id = int(input("Job ID: ").strip())
-                tool.job_details(job_id)
+                show = input("Show description? [Y/n]: ").strip().lower() != 'n'
+                tool.job_details(job_id, show_description=show)
             elif choice == '6':
                 skill = input("Skill: ").strip()
                 tool.search_by_skill(skill)
@@ -261,11 +648,47 @@ def main():
             elif choice == '9':
                 limit = input("How many? (default 10): ").strip()
                 tool.top_skills(int(limit) if limit else 10)
+            elif choice == '10':
+                def split(text):
+                    return [part.strip() for part in text.split(',') if part.strip()]
+                skills = split(input("Required skills (comma separated): "))
+                exclude = split(input("Excluded skills: "))
+                states = split(input("States (e.g. CA, NY): "))
+                days = input("Posted in last N days (blank for any): ").strip()
+                tool.find_jobs(skills, exclude, states=states, days=int(days) if days else None)
+            elif choice == '11':
+                job_id = int(input("Job ID: ").strip())
+                tool.similar_jobs(job_id)
+            elif choice == '12':
+                skill = input("Skill: ").strip()
+                tool.related_skills(skill)
             else:
                 print("Invalid choice")
         except Exception as e:
             print(f"Error: {e}")
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the job database; no arguments opens the menu.")
+    parser.add_argument("--query", nargs="+", action="append", metavar=("NAME", "KEY=VALUE"),
+                        help="run a named query with parameters (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list the named queries and their parameters")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("-o", "--output", help="file to write, or a path with {query} for one file per query")
+    parser.add_argument("--arraysize", type=int, default=5000, help="rows fetched per round trip")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_batch_queries()
+    elif args.query:
+        try:
+            requests = [(name, batch_params(name, pairs)) for name, *pairs in args.query]
+        except ValueError as e:
+            parser.error(str(e))
+        run_batch(requests, args.output, args.format, args.arraysize)
+    else:
+        interactive()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
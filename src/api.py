@@ -0,0 +1,398 @@
+"""
+Read-only HTTP API over the job database.
+
+    python -m src.main serve --port 8080
+
+    GET /jobs?skill=python&skill=aws&exclude=java&any=go&state=CA&company=12&days=30&active=1
+             &limit=50&after=<job_id>           newest first, keyset-paginated by job_id
+    GET /jobs/<job_id>[?description=0]
+    GET /jobs/<job_id>/similar?limit=10
+    GET /skills?limit=20                         skills by number of jobs
+    GET /skills/<name>/related?limit=10          co-occurring skills
+    GET /companies?prefix=acme&limit=50&after=<name>
+    GET /locations?state=CA&limit=50&after=<location_id>
+
+Job search runs on the in-memory bitset index (src/job_index.py) and
+similarity on src/similarity.py; only the rows of the requested page
+are read from Oracle, through the shared connection pool. List pages
+return {"items": [...], "next": <cursor or null>}; pass `next` back as
+`after` for the following page. Responses are encoded and sent in
+chunks as they are produced, gzip-compressed when the client accepts
+it, and carry a weak ETag derived from the data versions of the tables
+behind the endpoint, so a conditional GET is answered with 304 without
+touching the data.
+"""
+import hashlib
+import json
+import re
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from src.db.connection import Database
+from src.db.repository import decompress_description
+from src.db.versions import VersionStamp
+from src.job_index import shared_index
+from src.query_cache import shared_cache
+from src.scraper.locations import normalize_state
+from src.similarity import shared_engine
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+CHUNK_BYTES = 16 * 1024
+
+JOB_COLUMNS = ["job_id", "title", "company", "city", "state", "country", "post_date", "status", "work_mode"]
+JOB_SELECT = """
+    SELECT j.job_id, j.title, c.name, l.city, l.state, l.country, j.post_date, j.status, j.work_mode
+    FROM jobs j
+    JOIN companies c ON j.company_id = c.company_id
+    JOIN locations l ON j.location_id = l.location_id
+"""
+
+# Tables each endpoint reads; their data versions make up its ETag.
+JOB_TABLES = ("jobs", "companies", "locations", "job_skills", "skills")
+ROUTE_TABLES = {
+    "jobs": JOB_TABLES,
+    "job": JOB_TABLES + ("descriptions",),
+    "similar": JOB_TABLES,
+    "skills": ("skills", "job_skills"),
+    "related": ("skills", "job_skills"),
+    "companies": ("companies", "jobs"),
+    "locations": ("locations", "jobs"),
+}
+ROUTES = [
+    (re.compile(r"^/jobs$"), "jobs"),
+    (re.compile(r"^/jobs/(\d+)$"), "job"),
+    (re.compile(r"^/jobs/(\d+)/similar$"), "similar"),
+    (re.compile(r"^/skills$"), "skills"),
+    (re.compile(r"^/skills/([^/]+)/related$"), "related"),
+    (re.compile(r"^/companies$"), "companies"),
+    (re.compile(r"^/locations$"), "locations"),
+]
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, np.integer):
+        return int(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+def _page(items: List[dict], next_cursor, **extra) -> Iterator[str]:
+    """A list response, one item per piece so large pages are never encoded in one go."""
+    yield "{" + "".join(f"{_dumps(key)}:{_dumps(value)}," for key, value in extra.items()) + '"items":['
+    for i, item in enumerate(items):
+        yield ("," if i else "") + _dumps(item)
+    yield f'],"next":{_dumps(next_cursor)}}}'
+
+
+class JobApi:
+    """Endpoint implementations. Each returns an iterator of JSON text pieces."""
+
+    def __init__(self, stamp: Optional[VersionStamp] = None):
+        self.stamp = stamp or shared_cache().stamp
+        self._lock = threading.Lock()
+        self._index = self._engine = None
+        self._index_versions = self._engine_versions = None
+
+    # Shared in-memory structures, refreshed when jobs or skills changed. A refresh
+    # appends new and re-seen jobs, and rebuilds when rows already held were otherwise updated
+    # or deleted (closed postings, dropped partitions), so `active` and paging see the same rows
+    # as Oracle. Refreshes run outside the lock; requests meanwhile use the structure as it stands.
+
+    def index(self):
+        versions = self.stamp.of(("jobs", "job_skills"))
+        if self._index is None or versions != self._index_versions:
+            index = shared_index()
+            with self._lock:
+                self._index, self._index_versions = index, versions
+        return self._index
+
+    def engine(self):
+        versions = self.stamp.of(("job_skills", "skills"))
+        if self._engine is None or versions != self._engine_versions:
+            engine = shared_engine()
+            with self._lock:
+                self._engine, self._engine_versions = engine, versions
+        return self._engine
+
+    def _rows(self, name: str, params: tuple, tables: Tuple[str, ...], sql: str, binds=()) -> list:
+        def run():
+            with Database.get_cursor() as cursor:
+                cursor.execute(sql, binds)
+                return cursor.fetchall()
+
+        return shared_cache().get(name, params, tables, run)
+
+    def _jobs_by_id(self, job_ids: List[int]) -> List[dict]:
+        """Rows for job_ids in the given order. The IN list is padded to MAX_LIMIT so one statement serves every page."""
+        if not job_ids:
+            return []
+        padded = job_ids + [job_ids[-1]] * (MAX_LIMIT - len(job_ids))
+        binds = {f"id{i}": job_id for i, job_id in enumerate(padded)}
+        with Database.get_cursor() as cursor:
+            cursor.arraysize = len(job_ids)
+            cursor.execute(f"{JOB_SELECT} WHERE j.job_id IN ({', '.join(':' + name for name in binds)})", binds)
+            rows = {row[0]: dict(zip(JOB_COLUMNS, row)) for row in cursor}
+        return [rows[job_id] for job_id in job_ids if job_id in rows]
+
+    # Endpoints
+
+    def jobs(self, query: Dict[str, List[str]]) -> Iterator[str]:
+        limit = _limit(query)
+        after = _int(query, "after")
+        days = _int(query, "days")
+        matches = self.index().query(
+            all_skills=query.get("skill", []),
+            any_skills=query.get("any", []),
+            not_skills=query.get("exclude", []),
+            states=[normalize_state(state) for state in query.get("state", [])],
+            company_ids=[_to_int(value, "company") for value in query.get("company", [])],
+            posted_since=date.today() - timedelta(days=days) if days else None,
+            active_only=_flag(query, "active"),
+        )
+        total = len(matches)
+        if after is not None:
+            matches = matches[:np.searchsorted(matches, after)]
+        newest = matches[::-1]
+        # Jobs deleted after the index was last refreshed have no row; read on so the page is still full.
+        items: List[dict] = []
+        taken = 0
+        while len(items) < limit and taken < len(newest):
+            batch = [int(job_id) for job_id in newest[taken:taken + limit - len(items)]]
+            taken += len(batch)
+            items += self._jobs_by_id(batch)
+        next_cursor = int(newest[taken - 1]) if taken < len(newest) else None
+        return _page(items, next_cursor, matches=total)
+
+    def job(self, job_id: str, query: Dict[str, List[str]]) -> Iterator[str]:
+        rows = self._rows("api_job", (int(job_id),), JOB_TABLES, f"{JOB_SELECT} WHERE j.job_id = :1", (int(job_id),))
+        if not rows:
+            raise ApiError(404, f"no job {job_id}")
+        job = dict(zip(JOB_COLUMNS, rows[0]))
+        job["skills"] = [row[0] for row in self._rows("api_job_skills", (int(job_id),), ("job_skills", "skills"), """
+            SELECT s.skill_name FROM job_skills js JOIN skills s ON js.skill_id = s.skill_id
+            WHERE js.job_id = :1 ORDER BY s.skill_name
+        """, (int(job_id),))]
+        if query.get("description", ["1"])[0] != "0":
+            with Database.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT d.body FROM jobs j JOIN descriptions d ON d.desc_hash = j.desc_hash WHERE j.job_id = :1",
+                    (int(job_id),),
+                    fetch_lobs=False,
+                )
+                row = cursor.fetchone()
+            job["description"] = decompress_description(row[0]) if row else None
+        return iter([_dumps(job)])
+
+    def similar(self, job_id: str, query: Dict[str, List[str]]) -> Iterator[str]:
+        matches = self.engine().similar_jobs(int(job_id), _limit(query, default=10))
+        scores = dict(matches)
+        items = self._jobs_by_id(list(scores))
+        for item in items:
+            item["score"] = round(scores[item["job_id"]], 4)
+        return _page(items, None)
+
+    def skills(self, query: Dict[str, List[str]]) -> Iterator[str]:
+        limit = _limit(query, default=20)
+        rows = self._rows("api_skills", (limit,), ROUTE_TABLES["skills"], """
+            SELECT s.skill_name, COUNT(*) FROM job_skills js JOIN skills s ON js.skill_id = s.skill_id
+            GROUP BY s.skill_name ORDER BY COUNT(*) DESC, s.skill_name
+            FETCH FIRST :1 ROWS ONLY
+        """, (limit,))
+        return _page([{"skill": name, "jobs": count} for name, count in rows], None)
+
+    def related(self, name: str, query: Dict[str, List[str]]) -> Iterator[str]:
+        related = self.engine().co_skills(unquote(name), _limit(query, default=10))
+        return _page([{"skill": skill, "jobs": count, "share": round(share, 4)} for skill, count, share in related], None)
+
+    def companies(self, query: Dict[str, List[str]]) -> Iterator[str]:
+        limit = _limit(query)
+        prefix = query.get("prefix", [""])[0].upper()
+        after = query.get("after", [""])[0]
+        rows = self._rows("api_companies", (prefix, after, limit), ROUTE_TABLES["companies"], """
+            SELECT c.company_id, c.name, COUNT(j.job_id)
+            FROM companies c LEFT JOIN jobs j ON j.company_id = c.company_id
+            WHERE UPPER(c.name) LIKE :prefix || '%' AND c.name > :after
+            GROUP BY c.company_id, c.name
+            ORDER BY c.name
+            FETCH FIRST :limit ROWS ONLY
+        """, {"prefix": prefix, "after": after or " ", "limit": limit + 1})
+        items = [{"company_id": company_id, "name": name, "jobs": jobs} for company_id, name, jobs in rows[:limit]]
+        return _page(items, items[-1]["name"] if len(rows) > limit else None)
+
+    def locations(self, query: Dict[str, List[str]]) -> Iterator[str]:
+        limit = _limit(query)
+        state = query.get("state", [None])[0]
+        state = normalize_state(state) if state else None
+        after = _int(query, "after") or 0
+        rows = self._rows("api_locations", (state, after, limit), ROUTE_TABLES["locations"], """
+            SELECT l.location_id, l.city, l.state, l.country, COUNT(j.job_id)
+            FROM locations l LEFT JOIN jobs j ON j.location_id = l.location_id
+            WHERE (:state IS NULL OR l.state = :state) AND l.location_id > :after
+            GROUP BY l.location_id, l.city, l.state, l.country
+            ORDER BY l.location_id
+            FETCH FIRST :limit ROWS ONLY
+        """, {"state": state, "after": after, "limit": limit + 1})
+        columns = ["location_id", "city", "state", "country", "jobs"]
+        items = [dict(zip(columns, row)) for row in rows[:limit]]
+        return _page(items, items[-1]["location_id"] if len(rows) > limit else None)
+
+
+def _to_int(value: str, name: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer")
+
+
+def _int(query: Dict[str, List[str]], name: str) -> Optional[int]:
+    values = query.get(name)
+    return _to_int(values[0], name) if values else None
+
+
+def _flag(query: Dict[str, List[str]], name: str) -> bool:
+    return query.get(name, ["0"])[0].lower() in ("1", "true", "yes")
+
+
+def _limit(query: Dict[str, List[str]], default: int = DEFAULT_LIMIT) -> int:
+    limit = _int(query, "limit") or default
+    if not 0 < limit <= MAX_LIMIT:
+        raise ApiError(400, f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive and chunked responses
+    server_version = "JobAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        try:
+            route, args = self._route(url.path)
+            etag = self._etag(route, url)
+            if etag in self.headers.get("If-None-Match", ""):
+                self._send_head(304, etag)
+                return
+            body = self._call(route, args, query)
+            first = next(body, "")  # errors in the endpoint surface here, before the status line is sent
+        except ApiError as e:
+            self._send_error(e.status, str(e))
+            return
+        except Exception as e:
+            self.log_error("%s failed: %s", self.path, e)
+            self._send_error(500, "internal error")
+            return
+        self._stream(200, etag, first, body)
+
+    def _route(self, path: str) -> Tuple[str, tuple]:
+        for pattern, route in ROUTES:
+            match = pattern.match(path)
+            if match:
+                return route, match.groups()
+        raise ApiError(404, f"no such endpoint: {path}")
+
+    def _call(self, route: str, args: tuple, query: Dict[str, List[str]]) -> Iterator[str]:
+        endpoint: Callable[..., Iterator[str]] = getattr(self.server.api, route)
+        return endpoint(*args, query)
+
+    def _etag(self, route: str, url) -> str:
+        versions = self.server.api.stamp.of(ROUTE_TABLES[route])
+        digest = hashlib.sha1(f"{url.path}?{url.query}|{versions}".encode()).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+    def _send_head(self, status: int, etag: Optional[str], chunked: bool = False, gzip: bool = False) -> None:
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if status == 304:
+            self.send_header("Content-Length", "0")
+        if chunked:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+        if gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+
+    def _send_error(self, status: int, message: str) -> None:
+        body = _dumps({"error": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, status: int, etag: str, first: str, rest: Iterator[str]) -> None:
+        gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+        self._send_head(status, etag, chunked=True, gzip=gzip)
+        buffer: List[bytes] = []
+        size = 0
+
+        def flush(data: bytes) -> None:
+            if data:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+        for piece in _chain(first, rest):
+            data = piece.encode()
+            if compressor:
+                data = compressor.compress(data)
+            buffer.append(data)
+            size += len(data)
+            if size >= CHUNK_BYTES:
+                flush(b"".join(buffer))
+                buffer, size = [], 0
+        if compressor:
+            buffer.append(compressor.flush())
+        flush(b"".join(buffer))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _chain(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: Optional[JobApi] = None, verbose: bool = False):
+        super().__init__(address, ApiHandler)
+        self.api = api or JobApi()
+        self.verbose = verbose
+
+
+def serve(host: str = "127.0.0.1", port: int = 8080, pool: int = 10, verbose: bool = False) -> None:
+    Database.init_pool(min_connections=min(2, pool), max_connections=pool)
+    server = ApiServer((host, port), verbose=verbose)
+    print(f"Serving on http://{host}:{server.server_address[1]} (pool of {pool} connections)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Database.close_pool()
@@ -0,0 +1,165 @@
+import json
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.plan import query_key
+from src.scraper.parser import ParsedJob
+
+Position = Tuple[int, int]  # (page, card index on page)
+
+
+def _job_to_dict(job: ParsedJob) -> dict:
+    data = job.to_dict()
+    data["skills"] = list(job.skills)
+    data["post_date"] = job.post_date.isoformat() if job.post_date else None
+    return data
+
+
+def _job_from_dict(data: dict) -> ParsedJob:
+    data = dict(data)
+    data["post_date"] = date.fromisoformat(data["post_date"]) if data.get("post_date") else None
+    return ParsedJob.from_dict(data)
+
+
+class QueryProgress:
+    """Progress of one source x keywords x location query."""
+
+    def __init__(self, store: "CheckpointStore", key: str):
+        self._store = store
+        self.key = key
+        self.done = False
+        self.pages: Dict[int, int] = {}  # finished page -> cards processed on it
+        self.cards: Dict[int, int] = {}  # page -> cards processed so far
+        self.pending: Dict[Position, ParsedJob] = {}
+        self.last_card: Optional[Position] = None
+
+    def page_done(self, page: int) -> bool:
+        return page in self.pages
+
+    def cards_done(self, page: int) -> int:
+        return self.cards.get(page, 0)
+
+    def record_card(self, page: int, card: int, job: Optional[ParsedJob]) -> None:
+        """Record a processed card; a parsed job stays pending until marked saved."""
+        self.last_card = (page, card)
+        self._apply({"e": "card", "page": page, "card": card, "job": job and _job_to_dict(job)})
+
+    def mark_saved(self, position: Position) -> None:
+        self._apply({"e": "saved", "page": position[0], "card": position[1]})
+
+    def finish_page(self, page: int) -> None:
+        self._apply({"e": "page", "page": page})
+
+    def finish(self) -> None:
+        self._apply({"e": "done"})
+
+    def pending_jobs(self) -> List[Tuple[Position, ParsedJob]]:
+        return sorted(self.pending.items(), key=lambda item: item[0])
+
+    def _apply(self, event: dict, replay: bool = False) -> None:
+        kind = event["e"]
+        if kind == "card":
+            page, card = event["page"], event["card"]
+            self.cards[page] = max(self.cards.get(page, 0), card + 1)
+            if event.get("job"):
+                self.pending[(page, card)] = _job_from_dict(event["job"])
+        elif kind == "saved":
+            self.pending.pop((event["page"], event["card"]), None)
+        elif kind == "page":
+            self.pages[event["page"]] = self.cards.get(event["page"], 0)
+        elif kind == "done":
+            self.done = True
+        if not replay:
+            self._store._append(dict(event, q=self.key))
+
+    def _events(self) -> List[dict]:
+        """Minimal event list reproducing the current state."""
+        events = []
+        for page, count in sorted(self.cards.items()):
+            # Re-emit the last card of each page so its high-water mark survives compaction.
+            if count and (page, count - 1) not in self.pending:
+                events.append({"e": "card", "page": page, "card": count - 1, "job": None})
+        for (page, card), job in self.pending_jobs():
+            events.append({"e": "card", "page": page, "card": card, "job": _job_to_dict(job)})
+        events.extend({"e": "page", "page": page} for page in sorted(self.pages))
+        if self.done:
+            events.append({"e": "done"})
+        return [dict(event, q=self.key) for event in events]
+
+
+class CheckpointStore:
+    """Append-only JSON-lines log of crawl progress.
+
+    Writes are buffered and fsynced every `sync_every` events or
+    `sync_interval` seconds, so recording a card costs a write() call.
+    With resume=True the log is replayed and compacted; otherwise it
+    starts empty.
+    """
+
+    def __init__(self, path: str, resume: bool = False, sync_every: int = 50, sync_interval: float = 5.0):
+        self.path = Path(path)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._queries: Dict[str, QueryProgress] = {}
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._replay()
+        self._compact()
+        self._file = open(self.path, "a")
+
+    def query(self, source: str, keywords: str, location: str) -> QueryProgress:
+        key = "|".join(query_key(source, keywords, location))
+        if key not in self._queries:
+            self._queries[key] = QueryProgress(self, key)
+        return self._queries[key]
+
+    def sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _append(self, event: dict) -> None:
+        self._file.write(json.dumps(event) + "\n")
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def _replay(self) -> None:
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn write from a crash; everything before it is intact
+                key = event.pop("q")
+                if key not in self._queries:
+                    self._queries[key] = QueryProgress(self, key)
+                self._queries[key]._apply(event, replay=True)
+
+    def _compact(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            for progress in self._queries.values():
+                for event in progress._events():
+                    f.write(json.dumps(event) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
@@ -1,17 +1,37 @@
 import os
-from dataclasses import dataclass
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
-load_dotenv()
+
+def load_env() -> None:
+    """Load .env into os.environ once. Called on first access to a config object."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+_env_loaded = False
+
+
+def _flag(value: str) -> bool:
+    return value.lower() == "true"
+
+
+def _env(name: str, default: str, cast: Callable[[str], Any] = str) -> Any:
+    """Dataclass field read from the environment when the config object is created."""
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
 
 
 @dataclass
 class OracleConfig:
-    host: str = os.getenv("ORACLE_HOST", "localhost")
-    port: int = int(os.getenv("ORACLE_PORT", "1521"))
-    service: str = os.getenv("ORACLE_SERVICE", "ORCLPDB1")
-    user: str = os.getenv("ORACLE_USER", "system")
-    password: str = os.getenv("ORACLE_PWD", "")
+    host: str = _env("ORACLE_HOST", "localhost")
+    port: int = _env("ORACLE_PORT", "1521", int)
+    service: str = _env("ORACLE_SERVICE", "ORCLPDB1")
+    user: str = _env("ORACLE_USER", "system")
+    password: str = _env("ORACLE_PWD", "")
 
     @property
     def dsn(self) -> str:
@@ -21,10 +41,54 @@ class OracleConfig:
 @dataclass
 class ScraperConfig:
     base_url: str = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-    headless: bool = os.getenv("SCRAPER_HEADLESS", "true").lower() == "true"
-    page_load_timeout: int = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
-    max_jobs: int = int(os.getenv("MAX_JOBS", "50"))
+    headless: bool = _env("SCRAPER_HEADLESS", "true", _flag)
+    page_load_timeout: int = _env("PAGE_LOAD_TIMEOUT", "30", int)
+    max_jobs: int = _env("MAX_JOBS", "50", int)
+    max_pages: int = _env("MAX_PAGES", "10", int)
+    save_batch_size: int = _env("SAVE_BATCH_SIZE", "25", int)
+    requests_per_minute: float = _env("SCRAPER_RPM", "20", float)
+    min_requests_per_minute: float = _env("SCRAPER_MIN_RPM", "2", float)
+    max_requests_per_minute: float = _env("SCRAPER_MAX_RPM", "60", float)
+    target_latency: float = _env("SCRAPER_TARGET_LATENCY", "5", float)
+    ready_timeout: int = _env("SCRAPER_READY_TIMEOUT", "10", int)
+    max_retries: int = _env("SCRAPER_MAX_RETRIES", "3", int)
+    backoff_base: float = _env("SCRAPER_BACKOFF_BASE", "5", float)
+    backoff_cap: float = _env("SCRAPER_BACKOFF_CAP", "120", float)
+    lean_profile: bool = _env("SCRAPER_LEAN", "true", _flag)
+    renderer_memory_mb: int = _env("SCRAPER_RENDERER_MEMORY_MB", "512", int)
+    checkpoint_dir: str = _env("CHECKPOINT_DIR", ".checkpoints")
+    warm_start: bool = _env("SCRAPER_WARM_START", "true", _flag)
+    standby_browsers: int = _env("SCRAPER_STANDBY_BROWSERS", "0", int)
+    browser_cache_dir: str = _env("BROWSER_CACHE_DIR", ".cache/browser")
+    task_lease: int = _env("TASK_LEASE_SECONDS", "300", int)
+    task_max_attempts: int = _env("TASK_MAX_ATTEMPTS", "3", int)
+    watch_min_interval: float = _env("WATCH_MIN_INTERVAL", "300", float)
+    watch_max_interval: float = _env("WATCH_MAX_INTERVAL", "21600", float)
+    watch_target_new: float = _env("WATCH_TARGET_NEW", "10", float)
+    watch_known_streak: int = _env("WATCH_KNOWN_STREAK", "3", int)
+
+
+@dataclass
+class AnalyticsConfig:
+    cache_dir: str = _env("ANALYTICS_CACHE_DIR", ".cache")
+    query_cache_entries: int = _env("QUERY_CACHE_ENTRIES", "512", int)
+    query_cache_mb: float = _env("QUERY_CACHE_MB", "64", float)
+    query_cache_persist: bool = _env("QUERY_CACHE_PERSIST", "false", _flag)
+    data_version_ttl: float = _env("DATA_VERSION_TTL", "1", float)
+
+
+_CONFIGS = {
+    "oracle_config": OracleConfig,
+    "scraper_config": ScraperConfig,
+    "analytics_config": AnalyticsConfig,
+}
 
 
-oracle_config = OracleConfig()
-scraper_config = ScraperConfig()
\ No newline at end of file
+def __getattr__(name: str):
+    # Config objects are built on first use, so importing this module never reads .env.
+    if name in _CONFIGS:
+        load_env()
+        config = _CONFIGS[name]()
+        globals()[name] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
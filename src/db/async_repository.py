@@ -0,0 +1,273 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+import oracledb
+from src.db.connection import AsyncDatabase
+from src.db.versions import REWRITES, bump
+from src.db.repository import (
+    Company, Location, Skill, Job,
+    COMPANY_MERGE, LOCATION_MERGE, SKILL_MERGE, DESCRIPTION_MERGE, JOB_INSERT, JOB_MERGE, JOB_SKILL_MERGE,
+    COMPANY_INSERT, LOCATION_INSERT, SKILL_INSERT, COMPANY_BY_NAME, LOCATION_BY_KEY, SKILL_BY_NAME,
+    check_batch_errors, company_binds, description_binds, description_hash, ids_by_key, in_list_chunks,
+    in_list_query, job_merge_binds, job_skill_binds, location_binds, location_key_binds, purged_description,
+    skill_pairs,
+)
+
+T = TypeVar("T")
+
+
+async def _lookup_ids(cursor, table: str, id_column: str, key_columns: List[str], keys: List[tuple]) -> Dict[tuple, int]:
+    sql = in_list_query(table, id_column, key_columns)
+    found = {}
+    for binds in in_list_chunks(keys):
+        await cursor.execute(sql, binds)
+        found.update(ids_by_key(await cursor.fetchall(), len(key_columns)))
+    return found
+
+
+async def _get_cached(
+    cache: Dict[Hashable, int],
+    inflight: Dict[Hashable, "asyncio.Future[int]"],
+    key: Hashable,
+    lookup: Callable[[], Awaitable[int]],
+) -> int:
+    """Return a cached id, sharing one lookup between coroutines asking for the same key."""
+    if key in cache:
+        return cache[key]
+    if key in inflight:
+        return await inflight[key]
+    future = asyncio.ensure_future(lookup())
+    inflight[key] = future
+    try:
+        cache[key] = await future
+        return cache[key]
+    finally:
+        inflight.pop(key, None)
+
+
+class AsyncCompanyRepository:
+    _ids: Dict[str, int] = {}
+    _inflight: Dict[str, "asyncio.Future[int]"] = {}
+
+    @staticmethod
+    async def insert(company: Company) -> int:
+        async with AsyncDatabase.get_cursor() as cursor:
+            id_var = cursor.var(int)
+            await cursor.execute(COMPANY_INSERT, {**company_binds(company), "id": id_var})
+            bump(cursor, "companies")
+            return id_var.getvalue()[0]
+
+    @staticmethod
+    async def find_by_name(name: str) -> Optional[Company]:
+        async with AsyncDatabase.get_cursor() as cursor:
+            await cursor.execute(COMPANY_BY_NAME, {"name": name})
+            row = await cursor.fetchone()
+            return Company(*row) if row else None
+
+    @staticmethod
+    async def get_or_create(company: Company) -> int:
+        async def lookup() -> int:
+            existing = await AsyncCompanyRepository.find_by_name(company.name)
+            return existing.company_id if existing else await AsyncCompanyRepository.insert(company)
+
+        return await _get_cached(AsyncCompanyRepository._ids, AsyncCompanyRepository._inflight, company.name, lookup)
+
+    @staticmethod
+    async def upsert_many(names: List[str]) -> Dict[str, int]:
+        """MERGE a batch of company names in one round trip and return name -> id."""
+        ids = AsyncCompanyRepository._ids
+        missing = sorted({name for name in names if name not in ids})
+        if missing:
+            async with AsyncDatabase.get_cursor() as cursor:
+                await cursor.executemany(COMPANY_MERGE, [{"name": name} for name in missing], batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                found = await _lookup_ids(cursor, "companies", "company_id", ["name"], [(name,) for name in missing])
+                if inserted:
+                    bump(cursor, "companies")
+            ids.update({key[0]: company_id for key, company_id in found.items()})
+        return {name: ids[name] for name in names}
+
+
+class AsyncLocationRepository:
+    _ids: Dict[tuple, int] = {}
+    _inflight: Dict[tuple, "asyncio.Future[int]"] = {}
+
+    @staticmethod
+    async def insert(location: Location) -> int:
+        async with AsyncDatabase.get_cursor() as cursor:
+            id_var = cursor.var(int)
+            await cursor.execute(LOCATION_INSERT, {**location_binds(location), "id": id_var})
+            bump(cursor, "locations")
+            return id_var.getvalue()[0]
+
+    @staticmethod
+    async def find_by_location(city: str, state: str, country: str) -> Optional[Location]:
+        async with AsyncDatabase.get_cursor() as cursor:
+            await cursor.execute(LOCATION_BY_KEY, {"city": city, "state": state, "country": country})
+            row = await cursor.fetchone()
+            return Location(*row) if row else None
+
+    @staticmethod
+    async def get_or_create(location: Location) -> int:
+        key = (location.city, location.state, location.country)
+
+        async def lookup() -> int:
+            existing = await AsyncLocationRepository.find_by_location(*key)
+            return existing.location_id if existing else await AsyncLocationRepository.insert(location)
+
+        return await _get_cached(AsyncLocationRepository._ids, AsyncLocationRepository._inflight, key, lookup)
+
+    @staticmethod
+    async def upsert_many(keys: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], int]:
+        """MERGE a batch of (city, state, country) keys and return key -> id."""
+        ids = AsyncLocationRepository._ids
+        missing = sorted({key for key in keys if key not in ids})
+        if missing:
+            async with AsyncDatabase.get_cursor() as cursor:
+                await cursor.executemany(LOCATION_MERGE, location_key_binds(missing), batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                ids.update(await _lookup_ids(cursor, "locations", "location_id", ["city", "state", "country"], missing))
+                if inserted:
+                    bump(cursor, "locations")
+        return {key: ids[key] for key in keys}
+
+
+class AsyncSkillRepository:
+    _ids: Dict[str, int] = {}
+    _inflight: Dict[str, "asyncio.Future[int]"] = {}
+
+    @staticmethod
+    async def insert(skill: Skill) -> int:
+        async with AsyncDatabase.get_cursor() as cursor:
+            id_var = cursor.var(int)
+            await cursor.execute(SKILL_INSERT, {"skill_name": skill.skill_name, "id": id_var})
+            bump(cursor, "skills")
+            return id_var.getvalue()[0]
+
+    @staticmethod
+    async def find_by_name(skill_name: str) -> Optional[Skill]:
+        async with AsyncDatabase.get_cursor() as cursor:
+            await cursor.execute(SKILL_BY_NAME, {"skill_name": skill_name})
+            row = await cursor.fetchone()
+            return Skill(*row) if row else None
+
+    @staticmethod
+    async def get_or_create(skill: Skill) -> int:
+        async def lookup() -> int:
+            existing = await AsyncSkillRepository.find_by_name(skill.skill_name)
+            return existing.skill_id if existing else await AsyncSkillRepository.insert(skill)
+
+        return await _get_cached(AsyncSkillRepository._ids, AsyncSkillRepository._inflight, skill.skill_name, lookup)
+
+    @staticmethod
+    async def upsert_many(names: List[str]) -> Dict[str, int]:
+        """MERGE a batch of skill names and return name -> id."""
+        ids = AsyncSkillRepository._ids
+        missing = sorted({name for name in names if name not in ids})
+        if missing:
+            async with AsyncDatabase.get_cursor() as cursor:
+                await cursor.executemany(SKILL_MERGE, [{"skill_name": name} for name in missing], batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                found = await _lookup_ids(cursor, "skills", "skill_id", ["skill_name"], [(name,) for name in missing])
+                if inserted:
+                    bump(cursor, "skills")
+            ids.update({key[0]: skill_id for key, skill_id in found.items()})
+        return {name: ids[name] for name in names}
+
+
+class AsyncDescriptionRepository:
+    _known: Set[str] = set()
+
+    @staticmethod
+    async def upsert_many(texts: List[Optional[str]]) -> List[Optional[str]]:
+        """Store each distinct description once, compressed, and return hashes in input order."""
+        hashes = [description_hash(text) if text else None for text in texts]
+        known = AsyncDescriptionRepository._known
+        missing = {desc_hash: text for desc_hash, text in zip(hashes, texts) if desc_hash and desc_hash not in known}
+        if missing:
+            async with AsyncDatabase.get_cursor() as cursor:
+                stored = await _lookup_ids(cursor, "descriptions", "raw_length", ["desc_hash"], [(h,) for h in missing])
+                new = {desc_hash: text for desc_hash, text in missing.items() if (desc_hash,) not in stored}
+                if new:
+                    cursor.setinputsizes(body=oracledb.DB_TYPE_BLOB)
+                    await cursor.executemany(DESCRIPTION_MERGE, description_binds(new), batcherrors=True)
+                    check_batch_errors(cursor)
+                    bump(cursor, "descriptions")
+            known.update(missing)
+        return hashes
+
+
+async def _store_descriptions(jobs: List[Job]) -> None:
+    hashes = await AsyncDescriptionRepository.upsert_many([job.description for job in jobs])
+    for job, desc_hash in zip(jobs, hashes):
+        job.desc_hash = desc_hash
+
+
+async def _with_descriptions(jobs: List[Job], write: Callable[[], Awaitable[T]]) -> T:
+    """Async counterpart of repository._with_descriptions."""
+    await _store_descriptions(jobs)
+    try:
+        return await write()
+    except (oracledb.DatabaseError, RuntimeError) as e:
+        if not purged_description(e):
+            raise
+    AsyncDescriptionRepository._known.clear()
+    await _store_descriptions(jobs)
+    return await write()
+
+
+async def _link_skills(cursor, pairs: List[Tuple[int, int]]) -> int:
+    """MERGE (job_id, skill_id) links on the caller's cursor. Returns how many were new."""
+    if not pairs:
+        return 0
+    await cursor.executemany(JOB_SKILL_MERGE, job_skill_binds(pairs), batcherrors=True)
+    check_batch_errors(cursor)
+    return cursor.rowcount
+
+
+class AsyncJobRepository:
+    @staticmethod
+    async def insert_many(jobs: List[Job]) -> List[int]:
+        """Insert a batch of jobs in one round trip and return their ids in order."""
+        if not jobs:
+            return []
+
+        async def write() -> List[int]:
+            async with AsyncDatabase.get_cursor() as cursor:
+                id_var = cursor.var(int, arraysize=len(jobs))
+                cursor.setinputsizes(id=id_var)
+                await cursor.executemany(JOB_INSERT, [job_merge_binds(job) for job in jobs])
+                bump(cursor, "jobs")
+                return [id_var.getvalue(i)[0] for i in range(len(jobs))]
+
+        return await _with_descriptions(jobs, write)
+
+    @staticmethod
+    async def upsert_many(jobs: List[Job], skill_ids: Optional[List[List[int]]] = None) -> Dict[str, int]:
+        """MERGE a batch of jobs by job_key, linking `skill_ids` in the same transaction."""
+        if not jobs:
+            return {}
+
+        async def write() -> Dict[str, int]:
+            async with AsyncDatabase.get_cursor() as cursor:
+                await cursor.executemany(JOB_MERGE, [job_merge_binds(job) for job in jobs], batcherrors=True)
+                check_batch_errors(cursor)
+                found = await _lookup_ids(cursor, "jobs", "job_id", ["job_key"], [(job.job_key,) for job in jobs])
+                changed = ["jobs"]
+                if skill_ids and await _link_skills(cursor, skill_pairs(jobs, found, skill_ids)):
+                    changed.append("job_skills")
+                bump(cursor, *changed)
+            return {key[0]: job_id for key, job_id in found.items()}
+
+        return await _with_descriptions(jobs, write)
+
+    @staticmethod
+    async def add_skills(pairs: List[Tuple[int, int]]) -> None:
+        """Link (job_id, skill_id) pairs in one round trip, skipping existing links."""
+        if not pairs:
+            return
+        async with AsyncDatabase.get_cursor() as cursor:
+            if await _link_skills(cursor, pairs):
+                bump(cursor, "job_skills", REWRITES)
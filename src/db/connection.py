@@ -1,7 +1,8 @@
 import oracledb
-from contextlib import contextmanager
-from typing import Generator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator, Optional
 from src.config.settings import oracle_config
+from src.db.versions import publish, publish_async, take_changed
 
 
 class Database:
@@ -45,6 +46,56 @@ class Database:
                 connection.commit()
             except Exception:
                 connection.rollback()
+                take_changed(connection)
                 raise
             finally:
-                cursor.close()
\ No newline at end of file
+                cursor.close()
+            publish(connection)
+
+
+class AsyncDatabase:
+    """asyncio counterpart of Database on python-oracledb's async pool.
+
+    Coroutines waiting on Oracle share a small pool without a thread each.
+    """
+
+    _pool: Optional[oracledb.AsyncConnectionPool] = None
+
+    @classmethod
+    def init_pool(cls, min_connections: int = 2, max_connections: int = 10) -> None:
+        if cls._pool is None:
+            cls._pool = oracledb.create_pool_async(
+                user=oracle_config.user,
+                password=oracle_config.password,
+                dsn=oracle_config.dsn,
+                min=min_connections,
+                max=max_connections,
+            )
+
+    @classmethod
+    async def close_pool(cls) -> None:
+        if cls._pool:
+            await cls._pool.close()
+            cls._pool = None
+
+    @classmethod
+    @asynccontextmanager
+    async def get_connection(cls) -> AsyncGenerator[oracledb.AsyncConnection, None]:
+        if cls._pool is None:
+            cls.init_pool()
+        async with cls._pool.acquire() as connection:
+            yield connection
+
+    @classmethod
+    @asynccontextmanager
+    async def get_cursor(cls) -> AsyncGenerator[oracledb.AsyncCursor, None]:
+        async with cls.get_connection() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    yield cursor
+                    await connection.commit()
+                except Exception:
+                    await connection.rollback()
+                    take_changed(connection)
+                    raise
+            await publish_async(connection)
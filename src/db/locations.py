@@ -0,0 +1,79 @@
+"""
+Fold existing locations rows into their canonical places.
+
+Rows written before normalize_location existed hold raw strings such as
+("New York", "NY (Hybrid)", "USA") or ("Remote", "Unknown", "USA").
+normalize_locations maps every row through the normaliser, points its
+jobs at the canonical row (recording the work mode the old string
+carried), recomputes their job_keys and deletes the old row, all in one
+transaction. Two postings that only differed by location spelling now
+share a job_key; the older one is kept, as in the job_key migration.
+"""
+from typing import Dict, Tuple
+
+from src.db.connection import Database
+from src.db.repository import LocationRepository
+from src.db.versions import REWRITES, bump
+from src.scraper.locations import UNKNOWN, Place, normalize_location
+
+# Same formula as parser.job_key and the job_key backfill in models.py.
+JOB_KEY_SQL = """
+    LOWER(RAWTOHEX(STANDARD_HASH(
+        LOWER(j.title) || '|' || LOWER(c.name) || '|' ||
+        LOWER(l.city) || '|' || LOWER(l.state) || '|' || LOWER(l.country), 'SHA1')))
+"""
+
+DELETE_DUPLICATES = f"""
+    DELETE FROM jobs WHERE job_id IN (
+        SELECT job_id FROM (
+            SELECT j.job_id, ROW_NUMBER() OVER (PARTITION BY {JOB_KEY_SQL} ORDER BY j.job_id) AS copy
+            FROM jobs j
+            JOIN companies c ON j.company_id = c.company_id
+            JOIN locations l ON j.location_id = l.location_id
+            WHERE j.location_id = :1
+        )
+        WHERE copy > 1
+    )
+"""
+
+UPDATE_KEYS = f"""
+    UPDATE jobs j SET job_key = (
+        SELECT {JOB_KEY_SQL}
+        FROM companies c, locations l
+        WHERE c.company_id = j.company_id AND l.location_id = j.location_id
+    )
+    WHERE j.location_id = :1
+"""
+
+
+def _canonical(city: str, state: str, country: str) -> Place:
+    raw = ", ".join(part for part in (city, state, country) if part and part != UNKNOWN)
+    return normalize_location(raw)
+
+
+def normalize_locations() -> Tuple[int, int]:
+    """Merge non-canonical location rows into canonical ones. Returns (rows merged, duplicate jobs removed)."""
+    with Database.get_cursor() as cursor:
+        cursor.arraysize = 5000
+        cursor.execute("SELECT location_id, city, state, country FROM locations")
+        moves: Dict[int, Place] = {}
+        for location_id, city, state, country in cursor:
+            place = _canonical(city, state, country)
+            if place[:3] != (city, state, country):
+                moves[location_id] = place
+    if not moves:
+        return 0, 0
+
+    targets = LocationRepository.upsert_many([place[:3] for place in moves.values()])
+    target_ids = sorted({targets[place[:3]] for place in moves.values()})
+    with Database.get_cursor() as cursor:
+        cursor.executemany(
+            "UPDATE jobs SET location_id = :1, work_mode = NVL(work_mode, :2) WHERE location_id = :3",
+            [(targets[place[:3]], place.work_mode, old_id) for old_id, place in moves.items()],
+        )
+        cursor.executemany(DELETE_DUPLICATES, [(location_id,) for location_id in target_ids], arraydmlrowcounts=True)
+        removed = sum(cursor.getarraydmlrowcounts())
+        cursor.executemany(UPDATE_KEYS, [(location_id,) for location_id in target_ids])
+        cursor.executemany("DELETE FROM locations WHERE location_id = :1", [(old_id,) for old_id in moves])
+        bump(cursor, "locations", "jobs", "job_skills", REWRITES)
+    return len(moves), removed
@@ -1,24 +1,42 @@
 from src.db.connection import Database
+from src.db.repository import DescriptionRepository
+from src.db.versions import REWRITES, VERSION_KEYS, bump
+
+# Ids come from sequence-default columns; a large cache keeps bulk loads from
+# updating the sequence dictionary entry every few rows.
+SEQUENCE_CACHE = 1000
 
 SEQUENCES = [
-    "CREATE SEQUENCE company_seq START WITH 1 INCREMENT BY 1",
-    "CREATE SEQUENCE location_seq START WITH 1 INCREMENT BY 1",
-    "CREATE SEQUENCE skill_seq START WITH 1 INCREMENT BY 1",
-    "CREATE SEQUENCE job_seq START WITH 1 INCREMENT BY 1",
+    f"CREATE SEQUENCE company_seq START WITH 1 INCREMENT BY 1 CACHE {SEQUENCE_CACHE}",
+    f"CREATE SEQUENCE location_seq START WITH 1 INCREMENT BY 1 CACHE {SEQUENCE_CACHE}",
+    f"CREATE SEQUENCE skill_seq START WITH 1 INCREMENT BY 1 CACHE {SEQUENCE_CACHE}",
+    f"CREATE SEQUENCE job_seq START WITH 1 INCREMENT BY 1 CACHE {SEQUENCE_CACHE}",
+    f"CREATE SEQUENCE task_seq START WITH 1 INCREMENT BY 1 CACHE {SEQUENCE_CACHE}",
 ]
 
+# Monthly partitions on the date a posting was last scraped, so a partition only ever
+# holds postings no run has seen since that month, and dropping it never takes a live
+# one. A posting seen again moves to the current month (row movement), at most once a
+# month. job_skills is reference-partitioned on fk_job, so its links move and drop with
+# their job.
+JOBS_PARTITIONING = """
+    PARTITION BY RANGE (last_seen) INTERVAL (NUMTOYMINTERVAL(1, 'MONTH'))
+    (PARTITION p_initial VALUES LESS THAN (DATE '2025-01-01'))
+"""
+
 TABLES = [
     """
     CREATE TABLE companies (
-        company_id NUMBER PRIMARY KEY,
+        company_id NUMBER DEFAULT company_seq.NEXTVAL PRIMARY KEY,
         name VARCHAR2(255) NOT NULL,
         industry VARCHAR2(255),
-        company_size VARCHAR2(100)
+        company_size VARCHAR2(100),
+        CONSTRAINT uq_company_name UNIQUE (name)
     )
     """,
     """
     CREATE TABLE locations (
-        location_id NUMBER PRIMARY KEY,
+        location_id NUMBER DEFAULT location_seq.NEXTVAL PRIMARY KEY,
         city VARCHAR2(100),
         state VARCHAR2(100),
         country VARCHAR2(100) DEFAULT 'USA',
@@ -27,72 +45,183 @@ TABLES = [
     """,
     """
     CREATE TABLE skills (
-        skill_id NUMBER PRIMARY KEY,
+        skill_id NUMBER DEFAULT skill_seq.NEXTVAL PRIMARY KEY,
         skill_name VARCHAR2(100) NOT NULL UNIQUE
     )
     """,
+    # Content-addressed, zlib-compressed bodies shared by every posting with the same text.
+    # Compressed bodies are small enough to stay in-row, so there is no LOB segment I/O.
+    """
+    CREATE TABLE descriptions (
+        desc_hash VARCHAR2(64) PRIMARY KEY,
+        raw_length NUMBER NOT NULL,
+        body BLOB NOT NULL
+    )
+    LOB (body) STORE AS SECUREFILE
+    """,
     """
     CREATE TABLE jobs (
-        job_id NUMBER PRIMARY KEY,
+        job_id NUMBER DEFAULT job_seq.NEXTVAL PRIMARY KEY,
         title VARCHAR2(255) NOT NULL,
         company_id NUMBER,
         location_id NUMBER,
-        description CLOB,
+        desc_hash VARCHAR2(64),
         post_date DATE,
+        job_key VARCHAR2(40) NOT NULL,
+        first_seen DATE DEFAULT SYSDATE NOT NULL,
+        last_seen DATE DEFAULT SYSDATE NOT NULL,
+        status VARCHAR2(10) DEFAULT 'OPEN' NOT NULL,
+        work_mode VARCHAR2(10),
+        CONSTRAINT uq_job_key UNIQUE (job_key),
         CONSTRAINT fk_company FOREIGN KEY (company_id) REFERENCES companies(company_id),
-        CONSTRAINT fk_location FOREIGN KEY (location_id) REFERENCES locations(location_id)
+        CONSTRAINT fk_location FOREIGN KEY (location_id) REFERENCES locations(location_id),
+        CONSTRAINT fk_description FOREIGN KEY (desc_hash) REFERENCES descriptions(desc_hash)
     )
-    """,
+    """ + JOBS_PARTITIONING + "ENABLE ROW MOVEMENT",
     """
     CREATE TABLE job_skills (
-        job_id NUMBER,
-        skill_id NUMBER,
-        PRIMARY KEY (job_id, skill_id),
+        job_id NUMBER NOT NULL,
+        skill_id NUMBER NOT NULL,
+        CONSTRAINT pk_job_skills PRIMARY KEY (job_id, skill_id) USING INDEX LOCAL,
         CONSTRAINT fk_job FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
         CONSTRAINT fk_skill FOREIGN KEY (skill_id) REFERENCES skills(skill_id) ON DELETE CASCADE
     )
+    PARTITION BY REFERENCE (fk_job)
+    ENABLE ROW MOVEMENT
     """,
-]
-
-TRIGGERS = [
-    """
-    CREATE OR REPLACE TRIGGER trg_company_id
-    BEFORE INSERT ON companies
-    FOR EACH ROW
-    WHEN (NEW.company_id IS NULL)
-    BEGIN
-        SELECT company_seq.NEXTVAL INTO :NEW.company_id FROM dual;
-    END;
-    """,
-    """
-    CREATE OR REPLACE TRIGGER trg_location_id
-    BEFORE INSERT ON locations
-    FOR EACH ROW
-    WHEN (NEW.location_id IS NULL)
-    BEGIN
-        SELECT location_seq.NEXTVAL INTO :NEW.location_id FROM dual;
-    END;
-    """,
+    # Change counters per table, bumped by every write path (see src/db/versions.py).
     """
-    CREATE OR REPLACE TRIGGER trg_skill_id
-    BEFORE INSERT ON skills
-    FOR EACH ROW
-    WHEN (NEW.skill_id IS NULL)
-    BEGIN
-        SELECT skill_seq.NEXTVAL INTO :NEW.skill_id FROM dual;
-    END;
+    CREATE TABLE data_versions (
+        table_name VARCHAR2(30) PRIMARY KEY,
+        version NUMBER DEFAULT 0 NOT NULL,
+        changed_at TIMESTAMP
+    )
     """,
+    # Work queue for distributed crawls: one row per batch x query x results page.
+    # PENDING -> RUNNING (leased to a worker) -> DONE | SKIPPED | FAILED; an expired lease is reclaimable.
     """
-    CREATE OR REPLACE TRIGGER trg_job_id
-    BEFORE INSERT ON jobs
-    FOR EACH ROW
-    WHEN (NEW.job_id IS NULL)
-    BEGIN
-        SELECT job_seq.NEXTVAL INTO :NEW.job_id FROM dual;
-    END;
+    CREATE TABLE scrape_tasks (
+        task_id NUMBER DEFAULT task_seq.NEXTVAL PRIMARY KEY,
+        batch VARCHAR2(100) NOT NULL,
+        source VARCHAR2(20) NOT NULL,
+        keywords VARCHAR2(255) NOT NULL,
+        location VARCHAR2(255) NOT NULL,
+        page NUMBER NOT NULL,
+        status VARCHAR2(10) DEFAULT 'PENDING' NOT NULL,
+        attempts NUMBER DEFAULT 0 NOT NULL,
+        worker VARCHAR2(100),
+        lease_until TIMESTAMP,
+        not_before TIMESTAMP DEFAULT SYSTIMESTAMP NOT NULL,
+        jobs_saved NUMBER,
+        last_error VARCHAR2(1000),
+        finished_at TIMESTAMP,
+        CONSTRAINT uq_scrape_task UNIQUE (batch, source, keywords, location, page)
+    )
     """,
 ]
 
+INDEXES = [
+    # Serves both the stale-posting sweep and "active jobs" filters.
+    "CREATE INDEX idx_jobs_status_seen ON jobs (status, last_seen) LOCAL",
+    # Foreign key index; also finds orphaned descriptions after a partition drop.
+    "CREATE INDEX idx_jobs_desc_hash ON jobs (desc_hash) LOCAL",
+    # Location searches: equality on canonical state (city, state is served by uq_location), then jobs by location.
+    "CREATE INDEX idx_locations_state ON locations (state)",
+    "CREATE INDEX idx_jobs_location ON jobs (location_id) LOCAL",
+    # Claim scans only touch claimable rows.
+    "CREATE INDEX idx_scrape_tasks_claim ON scrape_tasks (status, not_before)",
+]
+
+# Upgrades for schemas created by earlier versions, as (statement, ignorable ORA codes).
+# Each statement is safe to re-run.
+MIGRATIONS = [
+    # Phase 3 assigned ids with row-level triggers and uncached sequences.
+    (f"ALTER SEQUENCE company_seq CACHE {SEQUENCE_CACHE}", ()),
+    (f"ALTER SEQUENCE location_seq CACHE {SEQUENCE_CACHE}", ()),
+    (f"ALTER SEQUENCE skill_seq CACHE {SEQUENCE_CACHE}", ()),
+    (f"ALTER SEQUENCE job_seq CACHE {SEQUENCE_CACHE}", ()),
+    ("ALTER TABLE companies MODIFY company_id DEFAULT company_seq.NEXTVAL", ()),
+    ("ALTER TABLE locations MODIFY location_id DEFAULT location_seq.NEXTVAL", ()),
+    ("ALTER TABLE skills MODIFY skill_id DEFAULT skill_seq.NEXTVAL", ()),
+    ("ALTER TABLE jobs MODIFY job_id DEFAULT job_seq.NEXTVAL", ()),
+    ("DROP TRIGGER trg_company_id", ("ORA-04080",)),
+    ("DROP TRIGGER trg_location_id", ("ORA-04080",)),
+    ("DROP TRIGGER trg_skill_id", ("ORA-04080",)),
+    ("DROP TRIGGER trg_job_id", ("ORA-04080",)),
+    # Posting lifecycle: natural key for MERGE upserts plus first/last seen tracking.
+    ("ALTER TABLE jobs ADD (job_key VARCHAR2(40))", ("ORA-01430",)),
+    ("ALTER TABLE jobs ADD (first_seen DATE DEFAULT SYSDATE NOT NULL)", ("ORA-01430",)),
+    ("ALTER TABLE jobs ADD (last_seen DATE DEFAULT SYSDATE NOT NULL)", ("ORA-01430",)),
+    ("ALTER TABLE jobs ADD (status VARCHAR2(10) DEFAULT 'OPEN' NOT NULL)", ("ORA-01430",)),
+    # Keyless rows that duplicate a keyed row or an older keyless one (e.g. inserted without a
+    # key after uq_job_key existed) go first, so the backfill below cannot hit uq_job_key.
+    (
+        """
+        DELETE FROM jobs WHERE job_id IN (
+            SELECT job_id FROM (
+                SELECT j.job_id, j.job_key, ROW_NUMBER() OVER (
+                    PARTITION BY NVL(j.job_key, LOWER(RAWTOHEX(STANDARD_HASH(
+                        LOWER(j.title) || '|' || LOWER(c.name) || '|' ||
+                        LOWER(l.city) || '|' || LOWER(l.state) || '|' || LOWER(l.country), 'SHA1'))))
+                    ORDER BY NVL2(j.job_key, 0, 1), j.job_id
+                ) AS copy
+                FROM jobs j
+                LEFT JOIN companies c ON c.company_id = j.company_id
+                LEFT JOIN locations l ON l.location_id = j.location_id
+                WHERE EXISTS (SELECT 1 FROM jobs WHERE job_key IS NULL)
+            )
+            WHERE copy > 1 AND job_key IS NULL
+        )
+        """,
+        (),
+    ),
+    (
+        # Same formula as parser.job_key.
+        """
+        UPDATE jobs j SET job_key = (
+            SELECT LOWER(RAWTOHEX(STANDARD_HASH(
+                LOWER(j.title) || '|' || LOWER(c.name) || '|' ||
+                LOWER(l.city) || '|' || LOWER(l.state) || '|' || LOWER(l.country), 'SHA1')))
+            FROM companies c, locations l
+            WHERE c.company_id = j.company_id AND l.location_id = j.location_id
+        )
+        WHERE job_key IS NULL
+        """,
+        (),
+    ),
+    # Repeat scrapes of the same posting were stored as separate rows before job_key existed.
+    (
+        """
+        DELETE FROM jobs WHERE job_key IS NOT NULL AND job_id NOT IN (
+            SELECT MIN(job_id) FROM jobs WHERE job_key IS NOT NULL GROUP BY job_key
+        )
+        """,
+        (),
+    ),
+    ("ALTER TABLE jobs ADD CONSTRAINT uq_job_key UNIQUE (job_key)", ("ORA-02261", "ORA-02264")),
+    # ORA-02296 if a keyless row has no company or location row to compute its key from.
+    ("ALTER TABLE jobs MODIFY (job_key NOT NULL)", ("ORA-01442", "ORA-02296")),
+    # Fails with ORA-02299 if duplicate company names exist; lookups then use the lowest id.
+    ("ALTER TABLE companies ADD CONSTRAINT uq_company_name UNIQUE (name)", ("ORA-02261", "ORA-02264", "ORA-02299")),
+    # Descriptions moved out of a per-job CLOB; _move_descriptions copies the old column over.
+    ("ALTER TABLE jobs ADD (desc_hash VARCHAR2(64))", ("ORA-01430",)),
+    (
+        "ALTER TABLE jobs ADD CONSTRAINT fk_description FOREIGN KEY (desc_hash) REFERENCES descriptions(desc_hash)",
+        ("ORA-02275",),
+    ),
+    # remote / hybrid / onsite from normalize_location; run normalize-locations to fill older rows.
+    ("ALTER TABLE jobs ADD (work_mode VARCHAR2(10))", ("ORA-01430",)),
+    # One counter row per version key; existing rows keep their count.
+    (
+        """
+        INSERT INTO data_versions (table_name)
+        SELECT column_value FROM TABLE(sys.odcivarchar2list(%s))
+        WHERE column_value NOT IN (SELECT table_name FROM data_versions)
+        """ % ", ".join(f"'{table}'" for table in VERSION_KEYS),
+        (),
+    ),
+]
+
 
 def init_schema() -> None:
     with Database.get_cursor() as cursor:
@@ -110,20 +239,126 @@ def init_schema() -> None:
                 if "ORA-00955" not in str(e):
                     raise
 
-        for trigger in TRIGGERS:
-            cursor.execute(trigger)
+    migrate_schema()
+
+    with Database.get_cursor() as cursor:
+        for index in INDEXES:
+            try:
+                cursor.execute(index)
+            except Exception as e:
+                if "ORA-00955" not in str(e) and "ORA-01408" not in str(e):
+                    raise
+
+
+def migrate_schema() -> None:
+    """Bring an existing schema up to date; a no-op on one created by init_schema."""
+    with Database.get_cursor() as cursor:
+        for statement, ignored in MIGRATIONS:
+            try:
+                cursor.execute(statement)
+            except Exception as e:
+                if not any(code in str(e) for code in ignored):
+                    raise
+
+        cursor.execute("SELECT table_name FROM user_part_tables WHERE table_name IN ('JOBS', 'JOB_SKILLS')")
+        partitioned = {row[0] for row in cursor.fetchall()}
+        if "JOBS" not in partitioned:
+            _partition_jobs(cursor)
+        if "JOB_SKILLS" not in partitioned:
+            _partition_job_skills(cursor)
+
+        cursor.execute("SELECT column_name FROM user_part_key_columns WHERE name = 'JOBS' AND object_type = 'TABLE'")
+        if cursor.fetchone() == ("FIRST_SEEN",):
+            _repartition_jobs(cursor)
+
+        cursor.execute("SELECT 1 FROM user_tab_columns WHERE table_name = 'JOBS' AND column_name = 'DESCRIPTION'")
+        if cursor.fetchone():
+            _move_descriptions(cursor)
+
+        # Migrations may delete, merge or repartition job rows.
+        bump(cursor, "jobs", "job_skills", REWRITES)
+
+
+def _move_descriptions(cursor, batch_size: int = 500) -> None:
+    """Copy jobs.description CLOBs into the descriptions table, then retire the column."""
+    connection = cursor.connection
+    update = connection.cursor()
+    cursor.arraysize = batch_size
+    cursor.execute(
+        "SELECT job_id, description FROM jobs WHERE description IS NOT NULL AND desc_hash IS NULL",
+        fetch_lobs=False,
+    )
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        hashes = DescriptionRepository.upsert_many([row[1] for row in rows])
+        update.executemany(
+            "UPDATE jobs SET desc_hash = :1 WHERE job_id = :2",
+            [(desc_hash, row[0]) for desc_hash, row in zip(hashes, rows)],
+        )
+        connection.commit()
+    update.close()
+    # SET UNUSED is a dictionary change; the space is reclaimed by a later DROP UNUSED COLUMNS.
+    cursor.execute("ALTER TABLE jobs SET UNUSED (description)")
+
+
+def _partition_jobs(cursor) -> None:
+    # Recreated as LOCAL by init_schema once the table is partitioned.
+    try:
+        cursor.execute("DROP INDEX idx_jobs_status_seen")
+    except Exception as e:
+        if "ORA-01418" not in str(e):
+            raise
+    cursor.execute(f"ALTER TABLE jobs MODIFY {JOBS_PARTITIONING} ONLINE UPDATE INDEXES")
+    cursor.execute("ALTER TABLE jobs ENABLE ROW MOVEMENT")
+
+
+def _repartition_jobs(cursor) -> None:
+    """Move jobs from first_seen to last_seen partitions.
+
+    Earlier versions partitioned on first_seen, so retention dropped postings
+    that were still being seen. A parent of a reference-partitioned table
+    cannot be repartitioned, so job_skills is set aside and rebuilt after.
+    """
+    cursor.execute("CREATE TABLE job_skills_old AS SELECT job_id, skill_id FROM job_skills")
+    cursor.execute("DROP TABLE job_skills CASCADE CONSTRAINTS PURGE")
+    _partition_jobs(cursor)
+    _partition_job_skills(cursor, source="job_skills_old")
+
+
+def _partition_job_skills(cursor, source: str = "job_skills") -> None:
+    """Rebuild job_skills as a reference-partitioned child from `source`; Oracle cannot convert it in place."""
+    cursor.execute("""
+        CREATE TABLE job_skills_new (
+            job_id NUMBER NOT NULL,
+            skill_id NUMBER NOT NULL,
+            CONSTRAINT pk_job_skills_new PRIMARY KEY (job_id, skill_id) USING INDEX LOCAL,
+            CONSTRAINT fk_job_new FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
+            CONSTRAINT fk_skill_new FOREIGN KEY (skill_id) REFERENCES skills(skill_id) ON DELETE CASCADE
+        )
+        PARTITION BY REFERENCE (fk_job_new)
+        ENABLE ROW MOVEMENT
+    """)
+    cursor.execute(f"INSERT /*+ APPEND */ INTO job_skills_new (job_id, skill_id) SELECT job_id, skill_id FROM {source}")
+    cursor.connection.commit()
+    cursor.execute(f"DROP TABLE {source} CASCADE CONSTRAINTS PURGE")
+    cursor.execute("ALTER TABLE job_skills_new RENAME TO job_skills")
+    cursor.execute("ALTER TABLE job_skills RENAME CONSTRAINT pk_job_skills_new TO pk_job_skills")
+    cursor.execute("ALTER TABLE job_skills RENAME CONSTRAINT fk_job_new TO fk_job")
+    cursor.execute("ALTER TABLE job_skills RENAME CONSTRAINT fk_skill_new TO fk_skill")
 
 
 def drop_schema() -> None:
     with Database.get_cursor() as cursor:
-        for table in ["job_skills", "jobs", "skills", "locations", "companies"]:
+        for table in ["data_versions", "scrape_tasks", "job_skills", "jobs", "descriptions", "skills", "locations", "companies"]:
             try:
                 cursor.execute(f"DROP TABLE {table} CASCADE CONSTRAINTS")
             except Exception as e:
                 if "ORA-00942" not in str(e):
                     raise
 
-        for seq in ["job_seq", "skill_seq", "location_seq", "company_seq"]:
+        for seq in ["task_seq", "job_seq", "skill_seq", "location_seq", "company_seq"]:
             try:
                 cursor.execute(f"DROP SEQUENCE {seq}")
             except Exception as e:
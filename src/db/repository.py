@@ -1,7 +1,211 @@
+import hashlib
+import zlib
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional, List
+from typing import Callable, Dict, Iterable, Optional, List, Set, Tuple, TypeVar
+import oracledb
 from src.db.connection import Database
+from src.db.versions import REWRITES, bump
+
+T = TypeVar("T")
+
+# Keys per IN-list query; the last chunk is padded so every lookup reuses one statement.
+IN_LIST_CHUNK = 200
+
+COMPANY_MERGE = """
+    MERGE INTO companies c
+    USING (SELECT :name AS name FROM dual) src
+    ON (c.name = src.name)
+    WHEN NOT MATCHED THEN INSERT (name) VALUES (src.name)
+"""
+
+LOCATION_MERGE = """
+    MERGE INTO locations l
+    USING (SELECT :city AS city, :state AS state, :country AS country FROM dual) src
+    ON (l.city = src.city AND l.state = src.state AND l.country = src.country)
+    WHEN NOT MATCHED THEN INSERT (city, state, country) VALUES (src.city, src.state, src.country)
+"""
+
+SKILL_MERGE = """
+    MERGE INTO skills s
+    USING (SELECT :skill_name AS skill_name FROM dual) src
+    ON (s.skill_name = src.skill_name)
+    WHEN NOT MATCHED THEN INSERT (skill_name) VALUES (src.skill_name)
+"""
+
+DESCRIPTION_MERGE = """
+    MERGE INTO descriptions d
+    USING (SELECT :desc_hash AS desc_hash FROM dual) src
+    ON (d.desc_hash = src.desc_hash)
+    WHEN NOT MATCHED THEN INSERT (desc_hash, raw_length, body) VALUES (src.desc_hash, :raw_length, :body)
+"""
+
+# Seen again: refresh last_seen, reopen, and keep the work mode if the card stated one.
+# New: insert with first_seen = last_seen = now.
+JOB_MERGE = """
+    MERGE INTO jobs j
+    USING (
+        SELECT :job_key AS job_key, :title AS title, :company_id AS company_id,
+               :location_id AS location_id, :desc_hash AS desc_hash, :post_date AS post_date,
+               :work_mode AS work_mode
+        FROM dual
+    ) src
+    ON (j.job_key = src.job_key)
+    WHEN MATCHED THEN UPDATE SET j.last_seen = SYSDATE, j.status = 'OPEN',
+        j.work_mode = NVL(src.work_mode, j.work_mode)
+    WHEN NOT MATCHED THEN INSERT (job_key, title, company_id, location_id, desc_hash, post_date, work_mode)
+        VALUES (src.job_key, src.title, src.company_id, src.location_id, src.desc_hash, src.post_date,
+                src.work_mode)
+"""
+
+# Plain insert for callers that do not supply job_key: it is computed from the company and
+# location rows with the formula of parser.job_key (a missing row counts as empty parts).
+JOB_INSERT = """
+    INSERT INTO jobs (job_key, title, company_id, location_id, desc_hash, post_date, work_mode)
+    VALUES (
+        NVL(:job_key, LOWER(RAWTOHEX(STANDARD_HASH(
+            LOWER(:title) || '|' ||
+            (SELECT LOWER(c.name) FROM companies c WHERE c.company_id = :company_id) || '|' ||
+            NVL((SELECT LOWER(l.city) || '|' || LOWER(l.state) || '|' || LOWER(l.country)
+                 FROM locations l WHERE l.location_id = :location_id), '||'), 'SHA1')))),
+        :title, :company_id, :location_id, :desc_hash, :post_date, :work_mode
+    )
+    RETURNING job_id INTO :id
+"""
+
+JOB_SKILL_MERGE = """
+    MERGE INTO job_skills js
+    USING (SELECT :job_id AS job_id, :skill_id AS skill_id FROM dual) src
+    ON (js.job_id = src.job_id AND js.skill_id = src.skill_id)
+    WHEN NOT MATCHED THEN INSERT (job_id, skill_id) VALUES (src.job_id, src.skill_id)
+"""
+
+COMPANY_INSERT = """
+    INSERT INTO companies (name, industry, company_size)
+    VALUES (:name, :industry, :company_size)
+    RETURNING company_id INTO :id
+"""
+
+LOCATION_INSERT = """
+    INSERT INTO locations (city, state, country)
+    VALUES (:city, :state, :country)
+    RETURNING location_id INTO :id
+"""
+
+SKILL_INSERT = """
+    INSERT INTO skills (skill_name)
+    VALUES (:skill_name)
+    RETURNING skill_id INTO :id
+"""
+
+# Single-row lookups select columns in dataclass field order, so a row unpacks into the dataclass.
+COMPANY_BY_NAME = """
+    SELECT name, industry, company_size, company_id FROM companies WHERE name = :name
+    ORDER BY company_id
+"""
+
+LOCATION_BY_KEY = """
+    SELECT city, state, country, location_id FROM locations
+    WHERE city = :city AND state = :state AND country = :country
+"""
+
+SKILL_BY_NAME = "SELECT skill_name, skill_id FROM skills WHERE skill_name = :skill_name"
+
+
+def in_list_query(table: str, id_column: str, key_columns: List[str]) -> str:
+    """SELECT matching IN_LIST_CHUNK key tuples of `table`, returning key columns then the id, lowest id first."""
+    width = len(key_columns)
+    columns = ", ".join(key_columns)
+    tuples = ", ".join(
+        "(" + ", ".join(f":{i * width + j + 1}" for j in range(width)) + ")" for i in range(IN_LIST_CHUNK)
+    )
+    return f"SELECT {columns}, {id_column} FROM {table} WHERE ({columns}) IN ({tuples}) ORDER BY {id_column}"
+
+
+def in_list_chunks(keys: List[tuple]) -> Iterable[list]:
+    """Flattened bind values for in_list_query, one padded chunk at a time."""
+    for start in range(0, len(keys), IN_LIST_CHUNK):
+        chunk = keys[start:start + IN_LIST_CHUNK]
+        chunk = chunk + [chunk[-1]] * (IN_LIST_CHUNK - len(chunk))
+        yield [value for key in chunk for value in key]
+
+
+def check_batch_errors(cursor) -> None:
+    """Raise for executemany batch errors other than unique-key races with another writer."""
+    for error in cursor.getbatcherrors():
+        if "ORA-00001" not in error.message:
+            raise RuntimeError(error.message)
+
+
+def description_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_description(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_description(body: Optional[bytes]) -> Optional[str]:
+    return zlib.decompress(body).decode("utf-8") if body is not None else None
+
+
+def description_binds(texts: Dict[str, str]) -> List[dict]:
+    """DESCRIPTION_MERGE binds for a hash -> text mapping."""
+    return [
+        {"desc_hash": desc_hash, "raw_length": len(text), "body": compress_description(text)}
+        for desc_hash, text in texts.items()
+    ]
+
+
+def job_merge_binds(job: "Job") -> dict:
+    return {
+        "job_key": job.job_key,
+        "title": job.title,
+        "company_id": job.company_id,
+        "location_id": job.location_id,
+        "desc_hash": job.desc_hash,
+        "post_date": job.post_date,
+        "work_mode": job.work_mode,
+    }
+
+
+def company_binds(company: "Company") -> dict:
+    return {"name": company.name, "industry": company.industry, "company_size": company.company_size}
+
+
+def location_binds(location: "Location") -> dict:
+    return {"city": location.city, "state": location.state, "country": location.country}
+
+
+def location_key_binds(keys: List[Tuple[str, str, str]]) -> List[dict]:
+    """LOCATION_MERGE binds for (city, state, country) keys."""
+    return [{"city": city, "state": state, "country": country} for city, state, country in keys]
+
+
+def job_skill_binds(pairs: List[Tuple[int, int]]) -> List[dict]:
+    return [{"job_id": job_id, "skill_id": skill_id} for job_id, skill_id in pairs]
+
+
+def skill_pairs(jobs: List["Job"], found: Dict[tuple, int], skill_ids: List[List[int]]) -> List[Tuple[int, int]]:
+    """(job_id, skill_id) links for a merged batch, from the job_key -> id lookup and one skill list per job."""
+    return [(found[(job.job_key,)], skill_id) for job, ids in zip(jobs, skill_ids) for skill_id in ids]
+
+
+def ids_by_key(rows: Iterable[tuple], width: int) -> Dict[tuple, int]:
+    """in_list_query rows as key tuple -> id; a key on several rows keeps the first, i.e. the lowest id."""
+    found = {}
+    for row in rows:
+        found.setdefault(tuple(row[:width]), row[width])
+    return found
+
+
+def _lookup_ids(cursor, table: str, id_column: str, key_columns: List[str], keys: List[tuple]) -> Dict[tuple, int]:
+    sql = in_list_query(table, id_column, key_columns)
+    found = {}
+    for binds in in_list_chunks(keys):
+        cursor.execute(sql, binds)
+        found.update(ids_by_key(cursor, len(key_columns)))
+    return found
 
 
 @dataclass
@@ -33,148 +237,335 @@ class Job:
     location_id: int
     description: Optional[str] = None
     post_date: Optional[date] = None
+    job_key: Optional[str] = None
+    desc_hash: Optional[str] = None
+    work_mode: Optional[str] = None
+    first_seen: Optional[date] = None
+    last_seen: Optional[date] = None
+    status: str = "OPEN"
     job_id: Optional[int] = None
 
 
 class CompanyRepository:
+    # Process-wide id caches let repeated queries in one run skip the lookup round trip.
+    _ids: Dict[str, int] = {}
+
     @staticmethod
     def insert(company: Company) -> int:
         with Database.get_cursor() as cursor:
             id_var = cursor.var(int)
-            cursor.execute(
-                """
-                INSERT INTO companies (name, industry, company_size)
-                VALUES (:name, :industry, :company_size)
-                RETURNING company_id INTO :id
-                """,
-                {
-                    "name": company.name,
-                    "industry": company.industry,
-                    "company_size": company.company_size,
-                    "id": id_var,
-                },
-            )
+            cursor.execute(COMPANY_INSERT, {**company_binds(company), "id": id_var})
+            bump(cursor, "companies")
             return id_var.getvalue()[0]
 
     @staticmethod
     def find_by_name(name: str) -> Optional[Company]:
         with Database.get_cursor() as cursor:
-            cursor.execute(
-                "SELECT company_id, name, industry, company_size FROM companies WHERE name = :name",
-                {"name": name},
-            )
+            cursor.execute(COMPANY_BY_NAME, {"name": name})
             row = cursor.fetchone()
-            if row:
-                return Company(company_id=row[0], name=row[1], industry=row[2], company_size=row[3])
-            return None
+            return Company(*row) if row else None
 
     @staticmethod
     def get_or_create(company: Company) -> int:
+        cached = CompanyRepository._ids.get(company.name)
+        if cached:
+            return cached
         existing = CompanyRepository.find_by_name(company.name)
-        if existing:
-            return existing.company_id
-        return CompanyRepository.insert(company)
+        company_id = existing.company_id if existing else CompanyRepository.insert(company)
+        CompanyRepository._ids[company.name] = company_id
+        return company_id
+
+    @staticmethod
+    def upsert_many(names: List[str]) -> Dict[str, int]:
+        """MERGE a batch of company names in one round trip and return name -> id."""
+        ids = CompanyRepository._ids
+        missing = sorted({name for name in names if name not in ids})
+        if missing:
+            with Database.get_cursor() as cursor:
+                cursor.executemany(COMPANY_MERGE, [{"name": name} for name in missing], batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                found = _lookup_ids(cursor, "companies", "company_id", ["name"], [(name,) for name in missing])
+                if inserted:
+                    bump(cursor, "companies")
+            ids.update({key[0]: company_id for key, company_id in found.items()})
+        return {name: ids[name] for name in names}
 
 
 class LocationRepository:
+    _ids: Dict[tuple, int] = {}
+
     @staticmethod
     def insert(location: Location) -> int:
         with Database.get_cursor() as cursor:
             id_var = cursor.var(int)
-            cursor.execute(
-                """
-                INSERT INTO locations (city, state, country)
-                VALUES (:city, :state, :country)
-                RETURNING location_id INTO :id
-                """,
-                {
-                    "city": location.city,
-                    "state": location.state,
-                    "country": location.country,
-                    "id": id_var,
-                },
-            )
+            cursor.execute(LOCATION_INSERT, {**location_binds(location), "id": id_var})
+            bump(cursor, "locations")
             return id_var.getvalue()[0]
 
     @staticmethod
     def find_by_location(city: str, state: str, country: str) -> Optional[Location]:
         with Database.get_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT location_id, city, state, country FROM locations
-                WHERE city = :city AND state = :state AND country = :country
-                """,
-                {"city": city, "state": state, "country": country},
-            )
+            cursor.execute(LOCATION_BY_KEY, {"city": city, "state": state, "country": country})
             row = cursor.fetchone()
-            if row:
-                return Location(location_id=row[0], city=row[1], state=row[2], country=row[3])
-            return None
+            return Location(*row) if row else None
 
     @staticmethod
     def get_or_create(location: Location) -> int:
-        existing = LocationRepository.find_by_location(location.city, location.state, location.country)
-        if existing:
-            return existing.location_id
-        return LocationRepository.insert(location)
+        key = (location.city, location.state, location.country)
+        cached = LocationRepository._ids.get(key)
+        if cached:
+            return cached
+        existing = LocationRepository.find_by_location(*key)
+        location_id = existing.location_id if existing else LocationRepository.insert(location)
+        LocationRepository._ids[key] = location_id
+        return location_id
+
+    @staticmethod
+    def upsert_many(keys: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], int]:
+        """MERGE a batch of (city, state, country) keys and return key -> id."""
+        ids = LocationRepository._ids
+        missing = sorted({key for key in keys if key not in ids})
+        if missing:
+            with Database.get_cursor() as cursor:
+                cursor.executemany(LOCATION_MERGE, location_key_binds(missing), batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                ids.update(_lookup_ids(cursor, "locations", "location_id", ["city", "state", "country"], missing))
+                if inserted:
+                    bump(cursor, "locations")
+        return {key: ids[key] for key in keys}
 
 
 class SkillRepository:
+    _ids: Dict[str, int] = {}
+
     @staticmethod
     def insert(skill: Skill) -> int:
         with Database.get_cursor() as cursor:
             id_var = cursor.var(int)
-            cursor.execute(
-                """
-                INSERT INTO skills (skill_name)
-                VALUES (:skill_name)
-                RETURNING skill_id INTO :id
-                """,
-                {"skill_name": skill.skill_name, "id": id_var},
-            )
+            cursor.execute(SKILL_INSERT, {"skill_name": skill.skill_name, "id": id_var})
+            bump(cursor, "skills")
             return id_var.getvalue()[0]
 
     @staticmethod
     def find_by_name(skill_name: str) -> Optional[Skill]:
         with Database.get_cursor() as cursor:
-            cursor.execute(
-                "SELECT skill_id, skill_name FROM skills WHERE skill_name = :skill_name",
-                {"skill_name": skill_name},
-            )
+            cursor.execute(SKILL_BY_NAME, {"skill_name": skill_name})
             row = cursor.fetchone()
-            if row:
-                return Skill(skill_id=row[0], skill_name=row[1])
-            return None
+            return Skill(*row) if row else None
 
     @staticmethod
     def get_or_create(skill: Skill) -> int:
+        cached = SkillRepository._ids.get(skill.skill_name)
+        if cached:
+            return cached
         existing = SkillRepository.find_by_name(skill.skill_name)
-        if existing:
-            return existing.skill_id
-        return SkillRepository.insert(skill)
+        skill_id = existing.skill_id if existing else SkillRepository.insert(skill)
+        SkillRepository._ids[skill.skill_name] = skill_id
+        return skill_id
+
+    @staticmethod
+    def upsert_many(names: List[str]) -> Dict[str, int]:
+        """MERGE a batch of skill names and return name -> id."""
+        ids = SkillRepository._ids
+        missing = sorted({name for name in names if name not in ids})
+        if missing:
+            with Database.get_cursor() as cursor:
+                cursor.executemany(SKILL_MERGE, [{"skill_name": name} for name in missing], batcherrors=True)
+                check_batch_errors(cursor)
+                inserted = cursor.rowcount
+                found = _lookup_ids(cursor, "skills", "skill_id", ["skill_name"], [(name,) for name in missing])
+                if inserted:
+                    bump(cursor, "skills")
+            ids.update({key[0]: skill_id for key, skill_id in found.items()})
+        return {name: ids[name] for name in names}
+
+
+class DescriptionRepository:
+    # Hashes known to be stored; reruns then skip both the existence check and the upload.
+    _known: Set[str] = set()
+
+    @staticmethod
+    def upsert_many(texts: List[Optional[str]]) -> List[Optional[str]]:
+        """Store each distinct description once, compressed, and return hashes in input order."""
+        hashes = [description_hash(text) if text else None for text in texts]
+        known = DescriptionRepository._known
+        missing = {desc_hash: text for desc_hash, text in zip(hashes, texts) if desc_hash and desc_hash not in known}
+        if missing:
+            with Database.get_cursor() as cursor:
+                stored = _lookup_ids(cursor, "descriptions", "raw_length", ["desc_hash"], [(h,) for h in missing])
+                new = {desc_hash: text for desc_hash, text in missing.items() if (desc_hash,) not in stored}
+                if new:
+                    cursor.setinputsizes(body=oracledb.DB_TYPE_BLOB)
+                    cursor.executemany(DESCRIPTION_MERGE, description_binds(new), batcherrors=True)
+                    check_batch_errors(cursor)
+                    bump(cursor, "descriptions")
+            known.update(missing)
+        return hashes
+
+    @staticmethod
+    def get(desc_hash: str) -> Optional[str]:
+        """Fetch one body; fetch_lobs=False returns it inline instead of as a LOB locator."""
+        with Database.get_cursor() as cursor:
+            cursor.execute("SELECT body FROM descriptions WHERE desc_hash = :1", [desc_hash], fetch_lobs=False)
+            row = cursor.fetchone()
+            return decompress_description(row[0]) if row else None
+
+    @staticmethod
+    def purge_orphans() -> int:
+        """Delete descriptions no job references any more. Returns how many were removed."""
+        DescriptionRepository._known.clear()
+        with Database.get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM descriptions d WHERE NOT EXISTS (SELECT 1 FROM jobs j WHERE j.desc_hash = d.desc_hash)"
+            )
+            removed = cursor.rowcount
+            if removed:
+                bump(cursor, "descriptions")
+            return removed
+
+
+def _store_descriptions(jobs: List[Job]) -> None:
+    for job, desc_hash in zip(jobs, DescriptionRepository.upsert_many([job.description for job in jobs])):
+        job.desc_hash = desc_hash
+
+
+def purged_description(error: Exception) -> bool:
+    """Whether a job write failed on fk_description, i.e. a cached desc_hash was purged meanwhile."""
+    message = str(error)
+    return "ORA-02291" in message and "FK_DESCRIPTION" in message.upper()
+
+
+def _with_descriptions(jobs: List[Job], write: Callable[[], T]) -> T:
+    """Store the jobs' descriptions, then write(); retried once if a description was purged.
+
+    DescriptionRepository._known is per process, so a purge_orphans run in
+    another process (retention) leaves hashes here that no longer exist.
+    """
+    _store_descriptions(jobs)
+    try:
+        return write()
+    except (oracledb.DatabaseError, RuntimeError) as e:
+        if not purged_description(e):
+            raise
+    DescriptionRepository._known.clear()
+    _store_descriptions(jobs)
+    return write()
+
+
+def _link_skills(cursor, pairs: List[Tuple[int, int]]) -> int:
+    """MERGE (job_id, skill_id) links on the caller's cursor. Returns how many were new."""
+    if not pairs:
+        return 0
+    cursor.executemany(JOB_SKILL_MERGE, job_skill_binds(pairs), batcherrors=True)
+    check_batch_errors(cursor)
+    return cursor.rowcount
 
 
 class JobRepository:
     @staticmethod
     def insert(job: Job) -> int:
+        return JobRepository.insert_many([job])[0]
+
+    @staticmethod
+    def insert_many(jobs: List[Job]) -> List[int]:
+        """Insert a batch of jobs in one round trip and return their ids in order."""
+        if not jobs:
+            return []
+
+        def write() -> List[int]:
+            with Database.get_cursor() as cursor:
+                id_var = cursor.var(int, arraysize=len(jobs))
+                cursor.setinputsizes(id=id_var)
+                cursor.executemany(JOB_INSERT, [job_merge_binds(job) for job in jobs])
+                bump(cursor, "jobs")
+                return [id_var.getvalue(i)[0] for i in range(len(jobs))]
+
+        return _with_descriptions(jobs, write)
+
+    @staticmethod
+    def upsert_many(jobs: List[Job], skill_ids: Optional[List[List[int]]] = None) -> Dict[str, int]:
+        """MERGE a batch of jobs by job_key and return job_key -> job_id.
+
+        New postings are inserted; postings seen before get last_seen
+        refreshed and are reopened if they had been closed. Descriptions
+        are stored first, so each job only carries its desc_hash.
+        `skill_ids` (one list per job) are linked in the same transaction,
+        so no reader sees a new job without its skills.
+        """
+        if not jobs:
+            return {}
+
+        def write() -> Dict[str, int]:
+            with Database.get_cursor() as cursor:
+                cursor.executemany(JOB_MERGE, [job_merge_binds(job) for job in jobs], batcherrors=True)
+                check_batch_errors(cursor)
+                found = _lookup_ids(cursor, "jobs", "job_id", ["job_key"], [(job.job_key,) for job in jobs])
+                # Matched rows change too (last_seen, status), so the jobs version always moves.
+                changed = ["jobs"]
+                if skill_ids and _link_skills(cursor, skill_pairs(jobs, found, skill_ids)):
+                    changed.append("job_skills")
+                bump(cursor, *changed)
+            return {key[0]: job_id for key, job_id in found.items()}
+
+        return _with_descriptions(jobs, write)
+
+    @staticmethod
+    def existing_keys(keys: List[str]) -> Set[str]:
+        """The subset of `keys` already saved as jobs."""
+        if not keys:
+            return set()
+        with Database.get_cursor() as cursor:
+            found = _lookup_ids(cursor, "jobs", "job_id", ["job_key"], [(key,) for key in set(keys)])
+        return {key[0] for key in found}
+
+    @staticmethod
+    def add_skills(pairs: List[Tuple[int, int]]) -> None:
+        """Link (job_id, skill_id) pairs in one round trip, skipping existing links."""
+        if not pairs:
+            return
+        with Database.get_cursor() as cursor:
+            if _link_skills(cursor, pairs):
+                bump(cursor, "job_skills", REWRITES)
+
+    @staticmethod
+    def remove_skills(pairs: List[Tuple[int, int]]) -> None:
+        """Unlink (job_id, skill_id) pairs in one round trip."""
+        if not pairs:
+            return
+        with Database.get_cursor() as cursor:
+            cursor.executemany("DELETE FROM job_skills WHERE job_id = :1 AND skill_id = :2", pairs)
+            bump(cursor, "job_skills", REWRITES)
+
+    @staticmethod
+    def touch(keys: List[str]) -> int:
+        """Refresh last_seen, and reopen, postings seen again without being re-saved. Returns rows updated."""
+        if not keys:
+            return 0
+        with Database.get_cursor() as cursor:
+            cursor.executemany(
+                "UPDATE jobs SET last_seen = SYSDATE, status = 'OPEN' WHERE job_key = :1",
+                [(key,) for key in sorted(set(keys))],
+                arraydmlrowcounts=True,
+            )
+            touched = sum(cursor.getarraydmlrowcounts())
+            if touched:
+                bump(cursor, "jobs")
+            return touched
+
+    @staticmethod
+    def close_stale(days: int) -> int:
+        """Mark open postings not seen for `days` days as closed. Returns how many were closed."""
         with Database.get_cursor() as cursor:
-            id_var = cursor.var(int)
             cursor.execute(
-                """
-                INSERT INTO jobs (title, company_id, location_id, description, post_date)
-                VALUES (:title, :company_id, :location_id, :description, :post_date)
-                RETURNING job_id INTO :id
-                """,
-                {
-                    "title": job.title,
-                    "company_id": job.company_id,
-                    "location_id": job.location_id,
-                    "description": job.description,
-                    "post_date": job.post_date,
-                    "id": id_var,
-                },
+                "UPDATE jobs SET status = 'CLOSED' WHERE status = 'OPEN' AND last_seen < SYSDATE - :days",
+                {"days": days},
             )
-            return id_var.getvalue()[0]
+            closed = cursor.rowcount
+            if closed:
+                bump(cursor, "jobs", REWRITES)
+            return closed
 
     @staticmethod
     def add_skill(job_id: int, skill_id: int) -> None:
@@ -184,6 +575,7 @@ class JobRepository:
                     "INSERT INTO job_skills (job_id, skill_id) VALUES (:job_id, :skill_id)",
                     {"job_id": job_id, "skill_id": skill_id},
                 )
+                bump(cursor, "job_skills", REWRITES)
             except Exception as e:
                 if "ORA-00001" not in str(e):
                     raise
@@ -193,7 +585,7 @@ class JobRepository:
         with Database.get_cursor() as cursor:
             cursor.execute(
                 """
-                SELECT job_id, title, company_id, location_id, description, post_date
+                SELECT job_id, title, company_id, location_id, desc_hash, post_date
                 FROM jobs WHERE LOWER(title) LIKE LOWER(:title)
                 """,
                 {"title": f"%{title}%"},
@@ -204,24 +596,34 @@ class JobRepository:
                     title=row[1],
                     company_id=row[2],
                     location_id=row[3],
-                    description=row[4],
+                    desc_hash=row[4],
                     post_date=row[5],
                 )
                 for row in cursor.fetchall()
             ]
 
     @staticmethod
-    def get_all_with_details() -> List[dict]:
+    def get_all_with_details(active_only: bool = False, since: Optional[date] = None) -> List[dict]:
+        """List jobs; `since` bounds first_seen, and through it last_seen, so only recent partitions are scanned."""
+        filters, binds = [], {}
+        if active_only:
+            filters.append("j.status = 'OPEN'")
+        if since:
+            # last_seen >= first_seen, so the second bound changes nothing but lets Oracle prune partitions.
+            filters.append("j.first_seen >= :since AND j.last_seen >= :since")
+            binds["since"] = since
         with Database.get_cursor() as cursor:
             cursor.execute(
-                """
+                f"""
                 SELECT j.job_id, j.title, c.name as company, 
                        l.city, l.state, l.country, j.post_date
                 FROM jobs j
                 JOIN companies c ON j.company_id = c.company_id
                 JOIN locations l ON j.location_id = l.location_id
+                {"WHERE " + " AND ".join(filters) if filters else ""}
                 ORDER BY j.post_date DESC
-                """
+                """,
+                binds,
             )
             columns = ["job_id", "title", "company", "city", "state", "country", "post_date"]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Partition retention for the jobs table.
+
+jobs is interval-partitioned by month on last_seen and job_skills is
+reference-partitioned on it, so expiring a month is a dictionary
+operation rather than a DELETE over millions of rows. Partitioning on
+last_seen means an expired partition holds only postings that no run
+has seen for the whole retention period; a posting that is still being
+scraped has moved on to the current month, whatever its age.
+
+Every index is LOCAL except the two that cannot be: the job_id primary
+key and uq_job_key, whose keys do not contain last_seen. Those are kept
+usable with UPDATE GLOBAL INDEXES, which Oracle (12.1 and later) does as
+a dictionary update, leaving the orphaned entries to its scheduled
+cleanup, so the drop stays independent of the partition's size.
+
+Partitions are optionally archived to gzipped JSON lines before they
+are dropped.
+"""
+import gzip
+import json
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+from src.db.connection import Database
+from src.db.repository import DescriptionRepository, decompress_description
+from src.db.versions import REWRITES, bump
+
+_HIGH_VALUE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@dataclass
+class Partition:
+    name: str
+    upper_bound: date  # exclusive
+    rows: Optional[int]
+    interval: bool  # created automatically; the initial range partition cannot be dropped
+
+
+def list_partitions() -> List[Partition]:
+    """Partitions of jobs, oldest first. Row counts come from optimizer statistics."""
+    with Database.get_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT partition_name, high_value, num_rows, interval
+            FROM user_tab_partitions
+            WHERE table_name = 'JOBS'
+            ORDER BY partition_position
+            """
+        )
+        partitions = []
+        for name, high_value, rows, interval in cursor.fetchall():
+            match = _HIGH_VALUE.search(high_value)
+            partitions.append(Partition(name, date(*map(int, match.groups())), rows, interval == "YES"))
+        return partitions
+
+
+def expired_partitions(months: int, today: Optional[date] = None) -> List[Partition]:
+    """Partitions whose every row was last seen more than `months` months ago."""
+    today = today or date.today()
+    month = today.year * 12 + today.month - 1 - months
+    cutoff = date(month // 12, month % 12 + 1, 1)
+    return [p for p in list_partitions() if p.upper_bound <= cutoff]
+
+
+def archive_partition(partition: Partition, directory: Path) -> int:
+    """Write one partition's jobs, with skills and descriptions, to <dir>/jobs_<bound>.jsonl.gz."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"jobs_{partition.upper_bound:%Y%m}_{partition.name.lower()}.jsonl.gz"
+    count = 0
+    with Database.get_cursor() as cursor, gzip.open(path, "wt", encoding="utf-8") as out:
+        cursor.arraysize = 500
+        # fetch_lobs=False returns bodies as bytes in the same round trip instead of a LOB locator per row.
+        cursor.execute(
+            f"""
+            SELECT j.job_id, j.job_key, j.title, c.name, l.city, l.state, l.country,
+                   j.post_date, j.first_seen, j.last_seen, j.status, j.work_mode, d.body,
+                   (SELECT LISTAGG(s.skill_name, '|') WITHIN GROUP (ORDER BY s.skill_name)
+                    FROM job_skills PARTITION ({partition.name}) js
+                    JOIN skills s ON js.skill_id = s.skill_id
+                    WHERE js.job_id = j.job_id)
+            FROM jobs PARTITION ({partition.name}) j
+            LEFT JOIN companies c ON j.company_id = c.company_id
+            LEFT JOIN locations l ON j.location_id = l.location_id
+            LEFT JOIN descriptions d ON j.desc_hash = d.desc_hash
+            """,
+            fetch_lobs=False,
+        )
+        columns = [
+            "job_id", "job_key", "title", "company", "city", "state", "country",
+            "post_date", "first_seen", "last_seen", "status", "work_mode", "description", "skills",
+        ]
+        for row in cursor:
+            record = dict(zip(columns, row))
+            for field in ("post_date", "first_seen", "last_seen"):
+                record[field] = record[field].isoformat() if record[field] else None
+            record["description"] = decompress_description(record["description"])
+            record["skills"] = record["skills"].split("|") if record["skills"] else []
+            out.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+
+def drop_partition(partition: Partition) -> None:
+    """Remove a partition's rows; job_skills follows through reference partitioning."""
+    with Database.get_cursor() as cursor:
+        if partition.interval:
+            cursor.execute(f"ALTER TABLE jobs DROP PARTITION {partition.name} UPDATE GLOBAL INDEXES")
+        else:
+            # The last range partition before the interval section cannot be dropped (ORA-14758).
+            cursor.execute(f"ALTER TABLE jobs TRUNCATE PARTITION {partition.name} CASCADE UPDATE GLOBAL INDEXES")
+        bump(cursor, "jobs", "job_skills", REWRITES)
+
+
+def apply_retention(months: int, archive_dir: Optional[str] = None) -> List[tuple]:
+    """Archive (if a directory is given) and drop partitions older than `months`.
+
+    Descriptions left unreferenced by the drop are purged afterwards.
+    Returns (partition name, upper bound, rows archived or None) per partition.
+    """
+    results = []
+    for partition in expired_partitions(months):
+        archived = archive_partition(partition, Path(archive_dir)) if archive_dir else None
+        drop_partition(partition)
+        results.append((partition.name, partition.upper_bound, archived))
+    if results:
+        DescriptionRepository.purge_orphans()
+    return results
@@ -0,0 +1,201 @@
+"""
+Work queue in the scrape_tasks table for crawls spread over several workers.
+
+A plan is enqueued as one task per source x query x results page. Workers
+claim the oldest claimable task with SELECT ... FOR UPDATE SKIP LOCKED, so
+concurrent claims never block on or return the same row, then hold a
+lease on it that a background heartbeat keeps extending. A task whose
+lease runs out (the worker died) becomes claimable again; a failed task
+is retried after a backoff until it has used TASK_MAX_ATTEMPTS.
+"""
+import math
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.config.settings import scraper_config
+from src.db.connection import Database
+from src.db.repository import check_batch_errors
+from src.plan import PAGE_SIZES
+from src.scraper.throttle import backoff_delay
+
+TASK_INSERT = """
+    INSERT INTO scrape_tasks (batch, source, keywords, location, page)
+    VALUES (:batch, :source, :keywords, :location, :page)
+"""
+
+# Rows whose worker died on the last attempt; nobody may claim them again.
+TASK_REAP = """
+    UPDATE scrape_tasks
+    SET status = 'FAILED', worker = NULL, lease_until = NULL,
+        last_error = 'lease expired', finished_at = SYSTIMESTAMP
+    WHERE status = 'RUNNING' AND lease_until < SYSTIMESTAMP AND attempts >= :max_attempts
+"""
+
+TASK_CLAIM = """
+    SELECT task_id, batch, source, keywords, location, page, attempts
+    FROM scrape_tasks
+    WHERE (status = 'PENDING' AND not_before <= SYSTIMESTAMP)
+       OR (status = 'RUNNING' AND lease_until < SYSTIMESTAMP)
+    ORDER BY task_id
+    FOR UPDATE SKIP LOCKED
+"""
+
+TASK_LEASE = """
+    UPDATE scrape_tasks
+    SET status = 'RUNNING', worker = :worker, attempts = attempts + 1,
+        lease_until = SYSTIMESTAMP + NUMTODSINTERVAL(:lease, 'SECOND')
+    WHERE task_id = :task_id
+"""
+
+
+@dataclass
+class Task:
+    task_id: int
+    batch: str
+    source: str
+    keywords: str
+    location: str
+    page: int
+    attempts: int
+
+
+def pages_for(source: str, max_jobs: int) -> int:
+    """Results pages needed for max_jobs cards, capped at MAX_PAGES."""
+    return max(1, min(scraper_config.max_pages, math.ceil(max_jobs / PAGE_SIZES[source])))
+
+
+class TaskQueue:
+    def __init__(self, worker: Optional[str] = None, lease: Optional[int] = None):
+        self.worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease = lease or scraper_config.task_lease
+        self.max_attempts = scraper_config.task_max_attempts
+
+    @staticmethod
+    def enqueue(queries: List, batch: str) -> int:
+        """Add a task per page of each plan query. Tasks already in the batch are left as they are."""
+        rows = [
+            {"batch": batch, "source": q.source, "keywords": q.keywords, "location": q.location, "page": page}
+            for q in queries
+            for page in range(pages_for(q.source, q.max_jobs))
+        ]
+        if not rows:
+            return 0
+        with Database.get_cursor() as cursor:
+            cursor.executemany(TASK_INSERT, rows, batcherrors=True)
+            check_batch_errors(cursor)
+            return len(rows) - len(cursor.getbatcherrors())
+
+    def claim(self) -> Optional[Task]:
+        """Lease the oldest claimable task to this worker, or None if there is none."""
+        with Database.get_cursor() as cursor:
+            cursor.execute(TASK_REAP, {"max_attempts": self.max_attempts})
+            # Rows are locked as they are fetched, so fetch exactly one.
+            cursor.arraysize = 1
+            cursor.prefetchrows = 1
+            cursor.execute(TASK_CLAIM)
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            task = Task(*row)
+            cursor.execute(TASK_LEASE, {"worker": self.worker, "lease": self.lease, "task_id": task.task_id})
+        task.attempts += 1
+        return task
+
+    @contextmanager
+    def heartbeat(self, task: Task) -> Iterator[None]:
+        """Keep extending the task's lease while the block runs."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self.lease / 3):
+                try:
+                    if not self._extend(task):
+                        print(f"  Lost lease on task {task.task_id}")
+                        return
+                except Exception as e:
+                    print(f"  Heartbeat for task {task.task_id} failed: {e}")
+
+        thread = threading.Thread(target=beat, name=f"heartbeat-{task.task_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _extend(self, task: Task) -> bool:
+        with Database.get_cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE scrape_tasks SET lease_until = SYSTIMESTAMP + NUMTODSINTERVAL(:lease, 'SECOND')
+                WHERE task_id = :task_id AND worker = :worker AND status = 'RUNNING'
+                """,
+                {"lease": self.lease, "task_id": task.task_id, "worker": self.worker},
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, task: Task, saved: int, more: bool) -> None:
+        """Mark the task done. A page that was not full ends its query, so later pages are skipped."""
+        with Database.get_cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE scrape_tasks
+                SET status = 'DONE', jobs_saved = :saved, lease_until = NULL, finished_at = SYSTIMESTAMP
+                WHERE task_id = :task_id AND worker = :worker
+                """,
+                {"saved": saved, "task_id": task.task_id, "worker": self.worker},
+            )
+            if not more:
+                cursor.execute(
+                    """
+                    UPDATE scrape_tasks SET status = 'SKIPPED', finished_at = SYSTIMESTAMP
+                    WHERE batch = :batch AND source = :source AND keywords = :keywords
+                      AND location = :location AND page > :page AND status = 'PENDING'
+                    """,
+                    {
+                        "batch": task.batch, "source": task.source, "keywords": task.keywords,
+                        "location": task.location, "page": task.page,
+                    },
+                )
+
+    def fail(self, task: Task, error: Exception) -> bool:
+        """Put the task back with a backoff, or fail it for good. Returns True if it will be retried."""
+        retry = task.attempts < self.max_attempts
+        with Database.get_cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE scrape_tasks
+                SET status = :status, worker = NULL, lease_until = NULL, last_error = :error,
+                    not_before = SYSTIMESTAMP + NUMTODSINTERVAL(:delay, 'SECOND'),
+                    finished_at = CASE WHEN :status = 'FAILED' THEN SYSTIMESTAMP END
+                WHERE task_id = :task_id AND worker = :worker
+                """,
+                {
+                    "status": "PENDING" if retry else "FAILED",
+                    "error": str(error)[:1000],
+                    "delay": backoff_delay(task.attempts - 1) if retry else 0,
+                    "task_id": task.task_id,
+                    "worker": self.worker,
+                },
+            )
+        return retry
+
+    @staticmethod
+    def status(batch: Optional[str] = None) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """(batch, status) -> (tasks, jobs saved)."""
+        with Database.get_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT batch, status, COUNT(*), NVL(SUM(jobs_saved), 0)
+                FROM scrape_tasks
+                WHERE :batch IS NULL OR batch = :batch
+                GROUP BY batch, status
+                ORDER BY batch, status
+                """,
+                {"batch": batch},
+            )
+            return {(b, s): (count, saved) for b, s, count, saved in cursor}
@@ -0,0 +1,103 @@
+"""
+Per-table data versions for cache invalidation.
+
+Every write path marks the tables it changed with bump(); once its
+transaction commits, Database.get_cursor advances their counters in a
+separate one-statement transaction. The data_versions rows are therefore
+locked only for that statement, not for the whole write, so concurrent
+writers do not queue behind each other on them. A version never moves
+before the data it stands for is visible: a reader that catches the new
+rows under the old version caches them under that version, and the bump
+that follows invalidates the entry. If a process dies between the two
+commits, the versions lag until the next write to those tables.
+
+Readers compare the versions a cached result was computed under with
+the current ones; reading them is one primary-key scan of a handful of
+rows, and VersionStamp additionally reuses a read for a short TTL.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+VERSIONED_TABLES = ["companies", "locations", "skills", "descriptions", "jobs", "job_skills"]
+
+# Not a table: advanced, besides "jobs"/"job_skills", by writes that change or remove rows
+# other than by saving postings again (close-stale, retention, location merges, skill
+# reprocessing, migrations). The in-memory job index and similarity engine only append
+# new jobs and re-read re-seen ones while it stays put, and rebuild when it moves.
+REWRITES = "job_rewrites"
+VERSION_KEYS = VERSIONED_TABLES + [REWRITES]
+
+VERSION_BUMP = """
+    UPDATE data_versions SET version = version + 1, changed_at = SYSTIMESTAMP
+    WHERE table_name = :1
+"""
+
+
+def bump(cursor, *tables: str) -> None:
+    """Mark `tables` as changed by the cursor's transaction; their versions advance after it commits."""
+    connection = cursor.connection
+    connection.changed_tables = getattr(connection, "changed_tables", None) or set()
+    connection.changed_tables.update(tables)
+
+
+def take_changed(connection) -> List[str]:
+    """Tables marked by bump() since the last call, in a fixed order so concurrent bumps lock rows alike."""
+    changed = getattr(connection, "changed_tables", None) or set()
+    connection.changed_tables = None
+    return sorted(changed)
+
+
+def publish(connection) -> None:
+    """Advance the versions of the tables the just-committed transaction marked, in a transaction of their own."""
+    changed = take_changed(connection)
+    if changed:
+        with connection.cursor() as cursor:
+            cursor.executemany(VERSION_BUMP, [(table,) for table in changed])
+        connection.commit()
+
+
+async def publish_async(connection) -> None:
+    changed = take_changed(connection)
+    if changed:
+        async with connection.cursor() as cursor:
+            await cursor.executemany(VERSION_BUMP, [(table,) for table in changed])
+        await connection.commit()
+
+
+def read_versions() -> Dict[str, int]:
+    from src.db.connection import Database  # connection imports this module to publish bumps
+
+    with Database.get_cursor() as cursor:
+        cursor.execute("SELECT table_name, version FROM data_versions")
+        return dict(cursor.fetchall())
+
+
+class VersionStamp:
+    """Current table versions, re-read from the database at most every `ttl` seconds.
+
+    A write by another process is therefore noticed within `ttl`; with
+    ttl=0 every call reads the table.
+    """
+
+    def __init__(self, ttl: float = 1.0):
+        self.ttl = ttl
+        self._versions: Dict[str, int] = {}
+        self._read_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> Dict[str, int]:
+        with self._lock:
+            now = time.monotonic()
+            if self._read_at is None or now - self._read_at >= self.ttl:
+                self._versions = read_versions()
+                self._read_at = now
+            return self._versions
+
+    def of(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        versions = self.current()
+        return tuple(versions.get(table, 0) for table in tables)
+
+    def expire(self) -> None:
+        with self._lock:
+            self._read_at = None
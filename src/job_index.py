@@ -0,0 +1,302 @@
+"""
+In-memory columnar index over jobs for boolean skill/location/date filters.
+
+Every skill and every state is a packed bitset (one bit per job, in
+job_id order), so "Python AND AWS AND NOT Java in CA" is a handful of
+bitwise ops over n/8 bytes. company_id, posted date and status are
+plain NumPy columns.
+
+refresh() does nothing while the jobs, job_skills and job_rewrites data
+versions are unchanged. Saving postings only adds jobs, reopens them
+and links skills, so after a save it appends jobs with ids above the
+highest indexed one and re-reads the indexed jobs whose last_seen moved
+since the previous refresh (a scan of the newest partition). Anything
+else (postings closed, skills reprocessed, partitions dropped, locations
+merged) advances job_rewrites and the index is rebuilt, as it is when a
+lower id turns up late. Versions and rows are read in one read-only
+transaction, so they describe the same snapshot; the database work runs
+without holding the lock queries take.
+"""
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.db.connection import Database
+from src.db.versions import REWRITES
+
+_EPOCH = date(1970, 1, 1)
+
+INDEX_TABLES = ("jobs", "job_skills", REWRITES)
+
+# Re-seen jobs are found by last_seen >= previous refresh - margin, so a save whose statement
+# ran up to this long before that refresh but committed after it is still picked up.
+RESEEN_MARGIN = timedelta(minutes=10)
+
+JOB_ROWS = """
+    SELECT j.job_id, j.company_id, l.state, NVL(j.post_date, TRUNC(j.first_seen)), j.status
+    FROM jobs j JOIN locations l ON j.location_id = l.location_id
+    WHERE {where}
+    ORDER BY j.job_id
+"""
+SKILL_ROWS = """
+    SELECT js.job_id, s.skill_name
+    FROM job_skills js JOIN skills s ON js.skill_id = s.skill_id JOIN jobs j ON j.job_id = js.job_id
+    WHERE {where}
+"""
+NEW_JOBS = "j.job_id > :after"
+RESEEN_JOBS = "j.job_id <= :after AND j.last_seen >= :since"
+
+
+def _read(cursor, where: str, binds: dict) -> Tuple[list, list]:
+    """Rows of the jobs matching `where`, in job_id order, and their (job_id, skill name) pairs."""
+    cursor.execute(JOB_ROWS.format(where=where), binds)
+    rows = cursor.fetchall()
+    if not rows:
+        return rows, []
+    cursor.execute(SKILL_ROWS.format(where=where), binds)
+    indexed = {row[0] for row in rows}  # jobs without a location are not indexed
+    return rows, [pair for pair in cursor.fetchall() if pair[0] in indexed]
+
+
+def _days(value: date) -> int:
+    return (value - _EPOCH).days
+
+
+def _pack(mask: np.ndarray) -> np.ndarray:
+    return np.packbits(mask, bitorder="little")
+
+
+def _append_bits(bits: Optional[np.ndarray], count: int, new: np.ndarray) -> np.ndarray:
+    """Extend a packed bitset holding `count` bits with the bools in `new`."""
+    if bits is None:
+        return _pack(np.concatenate([np.zeros(count, dtype=bool), new]))
+    if count % 8 == 0:
+        return np.concatenate([bits, _pack(new)])
+    old = np.unpackbits(bits, count=count, bitorder="little").astype(bool)
+    return _pack(np.concatenate([old, new]))
+
+
+class JobIndex:
+    """Columnar snapshot of jobs; query() returns matching job_ids in ascending order."""
+
+    def __init__(self):
+        self.job_ids = np.empty(0, dtype=np.int64)
+        self.company_ids = np.empty(0, dtype=np.int64)
+        self.posted = np.empty(0, dtype=np.int32)  # days since epoch; post_date, else first_seen
+        self.open = np.empty(0, dtype=bool)
+        self.skills: Dict[str, np.ndarray] = {}  # lower-cased skill name -> packed bitset
+        self.states: Dict[str, np.ndarray] = {}  # upper-cased state -> packed bitset
+        self.versions: Optional[Tuple[int, ...]] = None  # INDEX_TABLES versions at the last load
+        self.loaded_at = None  # database SYSDATE of the last load
+        self._lock = threading.Lock()  # guards the columns; held only to read or swap them
+        self._refreshing = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def max_job_id(self) -> int:
+        return int(self.job_ids[-1]) if len(self.job_ids) else 0
+
+    def append(
+        self,
+        job_ids: Sequence[int],
+        company_ids: Sequence[int],
+        states: Sequence[str],
+        posted: Sequence[date],
+        open_: Sequence[bool],
+        skills: Iterable[Tuple[int, str]],
+    ) -> None:
+        """Add jobs with ids above max_job_id; `skills` holds (job_id, skill name) pairs."""
+        if not len(job_ids):
+            return
+        new_ids = np.asarray(job_ids, dtype=np.int64)
+        count, added = len(self.job_ids), len(new_ids)
+
+        new_skills = self._columns(
+            [name.lower() for _, name in pairs] if (pairs := list(skills)) else [],
+            np.searchsorted(new_ids, np.fromiter((job_id for job_id, _ in pairs), dtype=np.int64, count=len(pairs))),
+            added,
+        )
+        new_states = self._columns([(state or "").upper() for state in states], np.arange(added), added)
+
+        with self._lock:
+            for bitsets, columns in ((self.skills, new_skills), (self.states, new_states)):
+                for key in bitsets.keys() | columns.keys():
+                    column = columns.get(key, np.zeros(added, dtype=bool))
+                    bitsets[key] = _append_bits(bitsets.get(key), count, column)
+            self.company_ids = np.concatenate([self.company_ids, np.asarray(company_ids, dtype=np.int64)])
+            self.posted = np.concatenate([self.posted, np.array([_days(d) for d in posted], dtype=np.int32)])
+            self.open = np.concatenate([self.open, np.asarray(open_, dtype=bool)])
+            self.job_ids = np.concatenate([self.job_ids, new_ids])
+
+    @staticmethod
+    def _columns(keys: List[str], positions: np.ndarray, size: int) -> Dict[str, np.ndarray]:
+        """One bool column of length `size` per distinct key, set at the key's positions."""
+        if not keys:
+            return {}
+        names, codes = np.unique(np.asarray(keys), return_inverse=True)
+        columns = {}
+        for code, name in enumerate(names.tolist()):
+            column = np.zeros(size, dtype=bool)
+            column[positions[codes == code]] = True
+            columns[name] = column
+        return columns
+
+    def refresh(self, wait: bool = True) -> int:
+        """Bring the index up to date. Returns how many jobs were loaded (all of them after a rebuild).
+
+        With wait=False a refresh already running in another thread is not waited for, and 0 returned.
+        """
+        if not self._refreshing.acquire(blocking=wait):
+            return 0
+        try:
+            return self._load(full=False)
+        finally:
+            self._refreshing.release()
+
+    def reload(self) -> int:
+        """Rebuild the whole index from the database."""
+        with self._refreshing:
+            return self._load(full=True)
+
+    def _load(self, full: bool) -> int:
+        with Database.get_cursor() as cursor:
+            cursor.execute("SET TRANSACTION READ ONLY")
+            cursor.execute(
+                "SELECT table_name, version FROM data_versions WHERE table_name IN (:1, :2, :3)", INDEX_TABLES
+            )
+            found = dict(cursor.fetchall())
+            versions = tuple(found.get(table, 0) for table in INDEX_TABLES)
+            if not full and versions == self.versions:
+                return 0
+            if self.versions is None or versions[-1] != self.versions[-1]:
+                full = True  # rows the index holds changed other than by a save
+
+            cursor.execute("SELECT SYSDATE FROM dual")
+            (loaded_at,) = cursor.fetchone()
+            cursor.arraysize = 10000
+            after = 0 if full else self.max_job_id
+            rows, skills = _read(cursor, NEW_JOBS, {"after": after})
+            seen, seen_skills = [], []
+            if after:
+                since = self.loaded_at - RESEEN_MARGIN
+                seen, seen_skills = _read(cursor, RESEEN_JOBS, {"after": after, "since": since})
+
+        if after and not self._mark_seen(seen, seen_skills):
+            # A job below the highest indexed id committed after the previous refresh.
+            return self._load(full=True)
+        target = self if after else JobIndex()
+        if rows:
+            job_ids, company_ids, states, posted, status = zip(*rows)
+            posted = [value.date() if hasattr(value, "date") else value for value in posted]
+            target.append(job_ids, company_ids, states, posted, [s == "OPEN" for s in status], skills)
+        with self._lock:
+            if target is not self:
+                for name in ("job_ids", "company_ids", "posted", "open", "skills", "states"):
+                    setattr(self, name, getattr(target, name))
+            self.versions, self.loaded_at = versions, loaded_at
+        return len(rows)
+
+    def _mark_seen(self, rows: List[tuple], skills: List[Tuple[int, str]]) -> bool:
+        """Apply the status and new skill links of re-seen jobs; False if one is not indexed."""
+        if not rows:
+            return True
+        job_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        positions = np.searchsorted(self.job_ids, job_ids)
+        if (self.job_ids[positions] != job_ids).any():
+            return False
+
+        open_ = self.open.copy()
+        open_[positions] = [row[4] == "OPEN" for row in rows]
+        count = len(self.job_ids)
+        columns = self._columns(
+            [name.lower() for _, name in skills],
+            np.searchsorted(self.job_ids, np.array([job_id for job_id, _ in skills], dtype=np.int64)),
+            count,
+        )
+        linked = {}
+        for name, column in columns.items():
+            bits = _pack(column)
+            linked[name] = bits | self.skills[name] if name in self.skills else bits
+        with self._lock:
+            self.open = open_
+            self.skills.update(linked)
+        return True
+
+    def query(
+        self,
+        all_skills: Sequence[str] = (),
+        any_skills: Sequence[str] = (),
+        not_skills: Sequence[str] = (),
+        states: Sequence[str] = (),
+        company_ids: Sequence[int] = (),
+        posted_since: Optional[date] = None,
+        posted_before: Optional[date] = None,
+        active_only: bool = False,
+    ) -> np.ndarray:
+        """job_ids matching every given filter; unknown skills or states match nothing."""
+        with self._lock:
+            count = len(self.job_ids)
+            empty = np.zeros((count + 7) // 8, dtype=np.uint8)
+            mask = np.full_like(empty, 0xFF)
+
+            for name in all_skills:
+                mask &= self.skills.get(name.lower(), empty)
+            if any_skills:
+                either = empty.copy()
+                for name in any_skills:
+                    either |= self.skills.get(name.lower(), empty)
+                mask &= either
+            for name in not_skills:
+                mask &= ~self.skills.get(name.lower(), empty)
+            if states:
+                anywhere = empty.copy()
+                for state in states:
+                    anywhere |= self.states.get(state.upper(), empty)
+                mask &= anywhere
+
+            rows = np.unpackbits(mask, count=count, bitorder="little").view(bool)
+            if company_ids:
+                rows &= np.isin(self.company_ids, company_ids)
+            if posted_since:
+                rows &= self.posted >= _days(posted_since)
+            if posted_before:
+                rows &= self.posted < _days(posted_before)
+            if active_only:
+                rows &= self.open
+            return self.job_ids[rows]
+
+    def skill_counts(self, job_ids: Optional[np.ndarray] = None) -> List[Tuple[str, int]]:
+        """Jobs per skill, most common first, optionally within a query result."""
+        with self._lock:
+            if job_ids is None:
+                counts = {name: int(np.unpackbits(bits).sum()) for name, bits in self.skills.items()}
+            else:
+                selected = _pack(np.isin(self.job_ids, job_ids))
+                counts = {name: int(np.unpackbits(bits & selected).sum()) for name, bits in self.skills.items()}
+        return sorted(((name, n) for name, n in counts.items() if n), key=lambda item: -item[1])
+
+
+_shared: Optional[JobIndex] = None
+_shared_lock = threading.Lock()
+
+
+def shared_index() -> JobIndex:
+    """Process-wide index, loaded on first use and brought up to date on every call.
+
+    While jobs and job_skills are unchanged that costs one data_versions read.
+    Only the first load makes other callers wait; while a refresh runs they
+    get the index as it stands.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            index = JobIndex()
+            index.refresh()
+            _shared = index
+            return _shared
+    _shared.refresh(wait=False)
+    return _shared
@@ -1,109 +1,211 @@
-from src.db.repository import (
-    Company, Location, Skill, Job,
-    CompanyRepository, LocationRepository, SkillRepository, JobRepository
-)
-from src.scraper.linkedin import LinkedInScraper
-from src.scraper.indeed import IndeedScraper
-from src.scraper.glassdoor import GlassdoorScraper
-
-
-SCRAPERS = {
-    'linkedin': LinkedInScraper,
-    'indeed': IndeedScraper,
-    'glassdoor': GlassdoorScraper,
-    'all': None  # Special case
-}
-
-
-def save_job(parsed_job) -> bool:
-    """Save a parsed job to the database. Returns True if successful."""
-    if not parsed_job.title or not parsed_job.company:
-        print(f"  Skipped: missing title or company")
-        return False
-    
-    try:
-        company = Company(name=parsed_job.company)
-        company_id = CompanyRepository.get_or_create(company)
-        
-        loc = Location(
-            city=parsed_job.city,
-            state=parsed_job.state,
-            country=parsed_job.country
-        )
-        location_id = LocationRepository.get_or_create(loc)
-        
-        job = Job(
-            title=parsed_job.title,
-            company_id=company_id,
-            location_id=location_id,
-            description=parsed_job.description,
-            post_date=parsed_job.post_date
-        )
-        job_id = JobRepository.insert(job)
-        
-        for skill_name in parsed_job.skills:
-            skill = Skill(skill_name=skill_name)
-            skill_id = SkillRepository.get_or_create(skill)
-            JobRepository.add_skill(job_id, skill_id)
-        
-        print(f"  Saved: {parsed_job.title} at {parsed_job.company}")
-        return True
-    except Exception as e:
-        print(f"  Error saving job: {e}")
-        return False
-
-
-def run_scraper(source: str = "all", keywords: str = "software engineer", location: str = "United States"):
-    """Main entry point - scrape jobs and save to database."""
-    
-    if source == "all":
-        sources = ['linkedin', 'indeed', 'glassdoor']
-    else:
-        sources = [source]
-    
-    total_saved = 0
-    
-    for src in sources:
-        print(f"\n{'='*50}")
-        print(f"Scraping {src.upper()} for: {keywords} in {location}")
-        print('='*50)
-        
-        scraper_class = SCRAPERS[src]
-        scraper = scraper_class()
-        jobs = scraper.scrape_jobs(keywords, location)
-        
-        print(f"Found {len(jobs)} jobs")
-        
-        saved = sum(1 for job in jobs if save_job(job))
-        total_saved += saved
-        
-        print(f"Saved {saved} jobs from {src}")
-    
-    print(f"\n{'='*50}")
-    print(f"TOTAL: Saved {total_saved} jobs to database.")
-    print('='*50)
-
-
-def view_jobs():
-    """Display all saved jobs."""
-    jobs = JobRepository.get_all_with_details()
-    for job in jobs:
-        skills = job.get('skills', [])
-        desc_len = len(job.get('description', '') or '')
+"""
+Command line interface: python -m src.main <command> [options]
+
+Commands import what they need when they run, so `--help` loads neither
+Selenium nor the Oracle driver and read-only commands such as `view`
+never load Selenium. Run `python benchmarks/import_budget.py` after
+touching imports here.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from src.plan import SOURCES
+
+DEFAULT_KEYWORDS = "software engineer"
+DEFAULT_LOCATION = "United States"
+
+
+def cmd_crawl(args) -> None:
+    from src.checkpoint import CheckpointStore
+    from src.pipeline import checkpoint_path, run_scraper
+    from src.scraper.filters import load_filters
+
+    source = args.command if args.command in SOURCES else "all"
+    filters = load_filters(args.filters)
+    with CheckpointStore(checkpoint_path("crawl"), resume=args.resume) as checkpoint:
+        run_scraper(source, args.keywords, args.location, checkpoint, filters)
+
+
+def cmd_plan(args) -> None:
+    from src.checkpoint import CheckpointStore
+    from src.pipeline import checkpoint_path, run_plan
+
+    with CheckpointStore(checkpoint_path(Path(args.file).stem), resume=args.resume) as checkpoint:
+        run_plan(args.file, checkpoint)
+
+
+def cmd_view(args) -> None:
+    from src.db.repository import JobRepository
+
+    for job in JobRepository.get_all_with_details(args.active):
         print(f"{job['title']} | {job['company']} | {job['city']}, {job['state']}")
-        print(f"  Description: {desc_len} chars | Skills: {skills}")
+        print(f"  Posted: {job['post_date'] or 'unknown'} | Job ID: {job['job_id']}")
         print()
 
 
+def cmd_close_stale(args) -> None:
+    from src.db.repository import JobRepository
+
+    print(f"Closed {JobRepository.close_stale(args.days)} postings not seen in {args.days} days.")
+
+
+def cmd_retention(args) -> None:
+    from src.db.retention import apply_retention
+
+    for name, bound, archived in apply_retention(args.months, args.archive_dir):
+        note = f", archived {archived} jobs" if archived is not None else ""
+        print(f"Dropped {name} (last seen before {bound}){note}")
+
+
+def cmd_normalize_locations(args) -> None:
+    from src.db.locations import normalize_locations
+
+    merged, removed = normalize_locations()
+    print(f"Merged {merged} location rows into canonical places, removed {removed} duplicate postings.")
+
+
+def cmd_reprocess_skills(args) -> None:
+    from src.reprocess import reprocess_skills
+
+    reprocess_skills(args.from_id, args.to_id, resume=args.resume)
+
+
+def cmd_rebuild_similarity(args) -> None:
+    from src.similarity import SimilarityEngine
+
+    engine = SimilarityEngine()
+    engine.rebuild()
+    print(f"Rebuilt {engine.path}: {len(engine.job_ids)} jobs, {len(engine.skill_ids)} skills")
+
+
+def cmd_enqueue(args) -> None:
+    from src.db.task_queue import TaskQueue
+    from src.plan import load_plan
+
+    batch = args.batch or Path(args.file).stem
+    print(f"Enqueued {TaskQueue.enqueue(load_plan(args.file), batch)} new tasks in batch '{batch}'.")
+
+
+def cmd_worker(args) -> None:
+    from src.scraper.filters import load_filters
+    from src.worker import run_worker
+
+    run_worker(max_tasks=args.max_tasks, idle_exit=args.idle_exit, filters=load_filters(args.filters))
+
+
+def cmd_watch(args) -> None:
+    from src.watch import run_watch
+
+    run_watch(args.file, max_polls=args.max_polls)
+
+
+def cmd_queue_status(args) -> None:
+    from src.db.task_queue import TaskQueue
+
+    for (batch, status), (tasks, saved) in TaskQueue.status(args.batch).items():
+        print(f"{batch:<30} {status:<8} {tasks:>7} tasks {saved:>9} jobs")
+
+
+def cmd_serve(args) -> None:
+    from src.api import serve
+
+    serve(args.host, args.port, args.pool, verbose=args.verbose)
+
+
+def cmd_init_db(args) -> None:
+    from src.db.models import init_schema
+
+    init_schema()
+    print("Schema is up to date.")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Job scraper and database tools.")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    for name in ["crawl", *SOURCES]:
+        sub = commands.add_parser(name, help="scrape all sources" if name == "crawl" else f"scrape {name} only")
+        sub.add_argument("keywords", nargs="?", default=DEFAULT_KEYWORDS)
+        sub.add_argument("location", nargs="?", default=DEFAULT_LOCATION)
+        sub.add_argument("--resume", action="store_true", help="continue an interrupted run")
+        sub.add_argument("--filters", metavar="FILE", help="apply the filters section of this plan file")
+        sub.set_defaults(handler=cmd_crawl)
+
+    sub = commands.add_parser("plan", help="run a keywords x locations x sources plan file")
+    sub.add_argument("file")
+    sub.add_argument("--resume", action="store_true", help="skip finished queries, pages and cards")
+    sub.set_defaults(handler=cmd_plan)
+
+    sub = commands.add_parser("enqueue", help="queue a plan file as page tasks for workers")
+    sub.add_argument("file")
+    sub.add_argument("--batch", help="batch name (default: the plan file name)")
+    sub.set_defaults(handler=cmd_enqueue)
+
+    sub = commands.add_parser("worker", help="process queued scrape tasks")
+    sub.add_argument("--max-tasks", type=int, help="exit after this many tasks")
+    sub.add_argument("--idle-exit", type=float, help="exit after the queue was empty for this many seconds")
+    sub.add_argument("--filters", metavar="FILE", help="apply the filters section of this plan file")
+    sub.set_defaults(handler=cmd_worker)
+
+    sub = commands.add_parser("watch", help="poll a plan's queries for new postings, newest first")
+    sub.add_argument("file")
+    sub.add_argument("--max-polls", type=int, help="exit after this many polls")
+    sub.set_defaults(handler=cmd_watch)
+
+    sub = commands.add_parser("queue-status", help="task counts per batch and status")
+    sub.add_argument("batch", nargs="?")
+    sub.set_defaults(handler=cmd_queue_status)
+
+    sub = commands.add_parser("view", help="list saved jobs")
+    sub.add_argument("--active", action="store_true", help="hide closed postings")
+    sub.set_defaults(handler=cmd_view)
+
+    sub = commands.add_parser("close-stale", help="close postings not seen for N days")
+    sub.add_argument("days", nargs="?", type=int, default=30)
+    sub.set_defaults(handler=cmd_close_stale)
+
+    sub = commands.add_parser("retention", help="drop monthly job partitions not seen for N months")
+    sub.add_argument("months", nargs="?", type=int, default=12)
+    sub.add_argument("archive_dir", nargs="?", help="write each partition here before dropping it")
+    sub.set_defaults(handler=cmd_retention)
+
+    sub = commands.add_parser("normalize-locations", help="fold raw location rows into canonical places")
+    sub.set_defaults(handler=cmd_normalize_locations)
+
+    sub = commands.add_parser("reprocess-skills", help="re-extract skills from stored descriptions")
+    sub.add_argument("from_id", nargs="?", type=int, default=0, help="start after this job_id")
+    sub.add_argument("to_id", nargs="?", type=int, help="stop at this job_id (inclusive)")
+    sub.add_argument("--resume", action="store_true", help="continue after the last finished chunk")
+    sub.set_defaults(handler=cmd_reprocess_skills)
+
+    sub = commands.add_parser("rebuild-similarity", help="rebuild the similar-jobs cache from job_skills")
+    sub.set_defaults(handler=cmd_rebuild_similarity)
+
+    sub = commands.add_parser("serve", help="run the read-only HTTP API")
+    sub.add_argument("--host", default="127.0.0.1")
+    sub.add_argument("--port", type=int, default=8080)
+    sub.add_argument("--pool", type=int, default=10, help="database connections shared by request threads")
+    sub.add_argument("--verbose", action="store_true", help="log every request")
+    sub.set_defaults(handler=cmd_serve)
+
+    sub = commands.add_parser("init-db", help="create or upgrade the schema")
+    sub.set_defaults(handler=cmd_init_db)
+
+    parser.commands = set(commands.choices)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    # `python -m src.main` and `python -m src.main "python developer"` still crawl every source.
+    if not argv or (argv[0] not in parser.commands and not argv[0].startswith("-")):
+        argv = ["crawl", *argv]
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
 if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1 and sys.argv[1] == "view":
-        view_jobs()
-    elif len(sys.argv) > 1 and sys.argv[1] in SCRAPERS:
-        source = sys.argv[1]
-        keywords = sys.argv[2] if len(sys.argv) > 2 else "software engineer"
-        run_scraper(source, keywords)
-    else:
-        keywords = sys.argv[1] if len(sys.argv) > 1 else "software engineer"
-        run_scraper("all", keywords)
\ No newline at end of file
+    main()
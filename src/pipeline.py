@@ -0,0 +1,262 @@
+"""
+Scrape-and-save pipeline: batched persistence, checkpointed queries and plans.
+
+Scraper classes are imported when a source is first used, so code that
+only saves or views jobs never loads Selenium.
+"""
+import asyncio
+import importlib
+import time
+from itertools import groupby
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.db.repository import (
+    Job, CompanyRepository, LocationRepository, SkillRepository, JobRepository
+)
+from src.db.async_repository import (
+    AsyncCompanyRepository, AsyncLocationRepository, AsyncSkillRepository, AsyncJobRepository
+)
+from src.plan import SOURCES, load_plan
+from src.checkpoint import CheckpointStore, QueryProgress
+from src.config.settings import scraper_config
+from src.scraper.filters import CardFilter, load_filters
+from src.scraper.throttle import BlockedError
+
+
+SCRAPERS = {
+    'linkedin': 'src.scraper.linkedin:LinkedInScraper',
+    'indeed': 'src.scraper.indeed:IndeedScraper',
+    'glassdoor': 'src.scraper.glassdoor:GlassdoorScraper',
+}
+
+
+def scraper_class(source: str):
+    module, name = SCRAPERS[source].split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+def has_required_fields(parsed_job) -> bool:
+    return bool(parsed_job.title and parsed_job.company)
+
+
+def save_jobs(parsed_jobs: List) -> int:
+    """Upsert a batch of parsed jobs in a handful of round trips.
+
+    Returns how many were saved; database errors propagate to the caller.
+    """
+    valid = []
+    for parsed_job in parsed_jobs:
+        if has_required_fields(parsed_job):
+            valid.append(parsed_job)
+        else:
+            print(f"  Skipped: missing title or company")
+    if not valid:
+        return 0
+
+    company_ids = CompanyRepository.upsert_many([job.company for job in valid])
+    location_ids = LocationRepository.upsert_many([(job.city, job.state, job.country) for job in valid])
+    skill_ids = SkillRepository.upsert_many([skill for job in valid for skill in job.skills])
+    # Each job and its skill links commit together.
+    JobRepository.upsert_many(
+        [
+            Job(
+                title=job.title,
+                company_id=company_ids[job.company],
+                location_id=location_ids[(job.city, job.state, job.country)],
+                description=job.description,
+                post_date=job.post_date,
+                job_key=job.key,
+                work_mode=job.work_mode
+            )
+            for job in valid
+        ],
+        [[skill_ids[skill] for skill in job.skills] for job in valid],
+    )
+
+    for job in valid:
+        print(f"  Saved: {job.title} at {job.company}")
+    return len(valid)
+
+
+def save_job(parsed_job) -> bool:
+    """Save a parsed job to the database. Returns True if successful."""
+    try:
+        return save_jobs([parsed_job]) == 1
+    except Exception as e:
+        print(f"  Error saving job: {e}")
+        return False
+
+
+async def save_jobs_async(parsed_jobs: List) -> int:
+    """Async counterpart of save_jobs for asyncio pipelines."""
+    valid = [job for job in parsed_jobs if has_required_fields(job)]
+    if not valid:
+        return 0
+
+    company_ids, location_ids, skill_ids = await asyncio.gather(
+        AsyncCompanyRepository.upsert_many([job.company for job in valid]),
+        AsyncLocationRepository.upsert_many([(job.city, job.state, job.country) for job in valid]),
+        AsyncSkillRepository.upsert_many([skill for job in valid for skill in job.skills]),
+    )
+    await AsyncJobRepository.upsert_many(
+        [
+            Job(
+                title=job.title,
+                company_id=company_ids[job.company],
+                location_id=location_ids[(job.city, job.state, job.country)],
+                description=job.description,
+                post_date=job.post_date,
+                job_key=job.key,
+                work_mode=job.work_mode
+            )
+            for job in valid
+        ],
+        [[skill_ids[skill] for skill in job.skills] for job in valid],
+    )
+    return len(valid)
+
+
+def scrape_query(
+    scraper,
+    keywords: str,
+    location: str,
+    max_jobs: Optional[int] = None,
+    progress: Optional[QueryProgress] = None,
+) -> Tuple[int, int]:
+    """Scrape one query and save its jobs in batches. Returns (found, saved).
+
+    BlockedError from the scraper propagates once the jobs scraped before
+    the block are saved.
+    """
+    found = saved = 0
+    batch = []
+    if progress:
+        # Jobs an interrupted run scraped but never saved go out with the first batch.
+        batch = progress.pending_jobs()
+        if progress.done:
+            print("Already completed in a previous run, skipping")
+            return found, save_batch(batch, progress) if batch else 0
+
+    try:
+        for job in scraper.scrape_jobs(keywords, location, max_jobs, progress):
+            found += 1
+            batch.append((progress.last_card if progress else None, job))
+            if len(batch) >= scraper_config.save_batch_size:
+                saved += save_batch(batch, progress)
+                batch = []
+    finally:
+        if batch:
+            saved += save_batch(batch, progress)
+
+    print(f"Found {found} jobs")
+    return found, saved
+
+
+def save_batch(batch: List[Tuple], progress: Optional[QueryProgress]) -> int:
+    """Save buffered (checkpoint position, job) pairs; on error they stay pending in the checkpoint."""
+    try:
+        saved = save_jobs([job for _, job in batch])
+    except Exception as e:
+        print(f"  Error saving {len(batch)} jobs: {e}")
+        return 0
+    if progress:
+        for position, _ in batch:
+            progress.mark_saved(position)
+    return saved
+
+
+def checkpoint_path(name: str) -> str:
+    return str(Path(scraper_config.checkpoint_dir) / f"{name}.jsonl")
+
+
+def run_scraper(
+    source: str = "all",
+    keywords: str = "software engineer",
+    location: str = "United States",
+    checkpoint: Optional[CheckpointStore] = None,
+    filters: Optional[dict] = None,
+):
+    """Main entry point - scrape jobs and save to database."""
+    
+    if source == "all":
+        sources = SOURCES
+    else:
+        sources = [source]
+    
+    total_saved = 0
+    
+    for src in sources:
+        print(f"\n{'='*50}")
+        print(f"Scraping {src.upper()} for: {keywords} in {location}")
+        print('='*50)
+        
+        scraper = scraper_class(src)()
+        scraper.card_filter = CardFilter.from_dict(filters)
+        progress = checkpoint.query(src, keywords, location) if checkpoint else None
+        try:
+            _, saved = scrape_query(scraper, keywords, location, progress=progress)
+        except BlockedError as e:
+            print(f"Blocked, moving on to the next source: {e}")
+            saved = 0
+        for line in scraper.summary():
+            print(line)
+        
+        total_saved += saved
+        
+        print(f"Saved {saved} jobs from {src}")
+    
+    print(f"\n{'='*50}")
+    print(f"TOTAL: Saved {total_saved} jobs to database.")
+    print('='*50)
+
+
+def run_plan(path: str, checkpoint: Optional[CheckpointStore] = None):
+    """Run every query of a plan file in one process, one browser per source.
+
+    The plan's `filters` section (see src.scraper.filters) applies to every query.
+    """
+    queries = load_plan(path)
+    filters = load_filters(path)
+    print(f"Plan {path}: {len(queries)} unique queries")
+
+    results = []
+    blocked = []
+    for src, group in groupby(queries, key=lambda q: q.source):
+        with scraper_class(src)() as scraper:
+            scraper.card_filter = CardFilter.from_dict(filters)
+            for query in group:
+                print(f"\n{'='*50}")
+                print(f"Scraping {src.upper()} for: {query.keywords} in {query.location} (max {query.max_jobs})")
+                print('='*50)
+
+                start = time.monotonic()
+                progress = checkpoint.query(src, query.keywords, query.location) if checkpoint else None
+                try:
+                    found, saved = scrape_query(scraper, query.keywords, query.location, query.max_jobs, progress)
+                except BlockedError as e:
+                    # The source's remaining queries would be blocked too; all stay unfinished in the checkpoint.
+                    print(f"Blocked, skipping the rest of {src}: {e}")
+                    blocked += [query, *group]
+                    break
+                results.append((query, found, saved, time.monotonic() - start))
+            for line in scraper.summary():
+                print(line)
+
+    print(f"\n{'='*80}")
+    print(f"{'SOURCE':<10} {'KEYWORDS':<25} {'LOCATION':<20} {'FOUND':>6} {'SAVED':>6} {'SECS':>6}")
+    print('-'*80)
+    for query, found, saved, elapsed in results:
+        print(
+            f"{query.source:<10} {query.keywords[:25]:<25} {query.location[:20]:<20} "
+            f"{found:>6} {saved:>6} {elapsed:>6.0f}"
+        )
+    print('-'*80)
+    total_found = sum(r[1] for r in results)
+    total_saved = sum(r[2] for r in results)
+    total_secs = sum(r[3] for r in results)
+    print(f"{'TOTAL':<57} {total_found:>6} {total_saved:>6} {total_secs:>6.0f}")
+    for query in blocked:
+        print(f"{query.source:<10} {query.keywords[:25]:<25} {query.location[:20]:<20} {'BLOCKED':>20}")
+    print('='*80)
+
@@ -0,0 +1,100 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.config import settings
+
+SOURCES = ["linkedin", "indeed", "glassdoor"]
+# Result cards per search page. The scrapers page by these; the task queue reads them
+# to split a query into page tasks without importing the scrapers (and Selenium).
+PAGE_SIZES = {"linkedin": 10, "indeed": 10, "glassdoor": 30}
+
+
+@dataclass
+class PlanQuery:
+    source: str
+    keywords: str
+    location: str
+    max_jobs: int
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return query_key(self.source, self.keywords, self.location)
+
+
+def query_key(source: str, keywords: str, location: str) -> Tuple[str, str, str]:
+    """Identity used to collapse overlapping queries and track their progress."""
+    return (source, _normalize(keywords), _normalize(location))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _expand_sources(value) -> List[str]:
+    sources = []
+    for source in _as_list(value) or ["all"]:
+        source = source.lower()
+        if source == "all":
+            sources.extend(SOURCES)
+        elif source in SOURCES:
+            sources.append(source)
+        else:
+            raise ValueError(f"Unknown source in plan: {source}")
+    return sources
+
+
+def read_file(path: str) -> dict:
+    text = Path(path).read_text()
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("PyYAML is required for YAML plans (pip install pyyaml)")
+        return yaml.safe_load(text) or {}
+    return json.loads(text)
+
+
+def load_plan(path: str) -> List[PlanQuery]:
+    """Load a plan file and expand it into a deduplicated list of queries.
+
+    The file holds a keywords x locations x sources matrix plus optional
+    explicit `queries` entries; each entry may override `max_jobs`.
+    """
+    data = read_file(path)
+    default_max = int(data.get("max_jobs", settings.scraper_config.max_jobs))
+
+    entries = []
+    for keywords in _as_list(data.get("keywords")):
+        for location in _as_list(data.get("locations")) or ["United States"]:
+            entries.append({"keywords": keywords, "location": location, "sources": data.get("sources")})
+    entries.extend(data.get("queries") or [])
+
+    unique: Dict[Tuple[str, str, str], PlanQuery] = {}
+    for entry in entries:
+        max_jobs = int(entry.get("max_jobs", default_max))
+        sources = entry.get("sources", entry.get("source"))
+        for source in _expand_sources(sources):
+            query = PlanQuery(
+                source=source,
+                keywords=entry["keywords"],
+                location=entry.get("location", "United States"),
+                max_jobs=max_jobs,
+            )
+            existing: Optional[PlanQuery] = unique.get(query.key)
+            if existing:
+                existing.max_jobs = max(existing.max_jobs, query.max_jobs)
+            else:
+                unique[query.key] = query
+
+    # Group by source so each browser is started once for the whole plan.
+    return sorted(unique.values(), key=lambda q: SOURCES.index(q.source))
@@ -0,0 +1,155 @@
+"""
+Result cache for read queries, invalidated by table data versions.
+
+An entry is keyed by query name and parameters and remembers the
+versions of the tables it read (src/db/versions.py). A lookup is a hit
+only while those versions are unchanged, so a scrape run that writes
+jobs invalidates job listings but not, say, a cached company lookup.
+Versions are read before the query runs: a write that commits while
+it runs leaves the entry tagged with the older versions, to be
+recomputed on the next lookup, never the other way round.
+
+Entries are evicted least recently used past QUERY_CACHE_ENTRIES or
+QUERY_CACHE_MB (measured as pickled size). With QUERY_CACHE_PERSIST the
+cache is written to <cache_dir>/query_cache.pickle at exit and reloaded
+on start, so analyst sessions and dashboards start warm; entries whose
+tables changed in between are simply misses.
+
+Only queries over VERSIONED_TABLES can be cached: any other table has no
+version to change, so its entry would never be invalidated, and get()
+refuses it.
+"""
+import atexit
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from src.config.settings import analytics_config, oracle_config
+from src.db.versions import VERSIONED_TABLES, VersionStamp
+
+
+class QueryCache:
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_mb: Optional[float] = None,
+        path: Optional[str] = None,
+        stamp: Optional[VersionStamp] = None,
+    ):
+        self.max_entries = max_entries or analytics_config.query_cache_entries
+        self.max_bytes = int((max_mb or analytics_config.query_cache_mb) * 1024 * 1024)
+        self.path = Path(path) if path else None
+        self.stamp = stamp or VersionStamp(analytics_config.data_version_ttl)
+        # key -> (table versions, pickled size, result)
+        self._entries: "OrderedDict[Hashable, Tuple[tuple, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        if self.path:
+            self.load()
+
+    def get(self, name: str, params: tuple, tables: Iterable[str], compute: Callable[[], Any]) -> Any:
+        """Cached result of compute() for (name, params), recomputed once any of `tables` changed."""
+        unversioned = [table for table in tables if table not in VERSIONED_TABLES]
+        if unversioned:
+            raise ValueError(f"cannot cache reads of unversioned tables: {', '.join(unversioned)}")
+        key = (name, params)
+        versions = self.stamp.of(tables)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == versions:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        result = compute()
+        size = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._entries[key] = (versions, size, result)
+                self._bytes += size
+                self._evict()
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry[1]
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    # Persistence
+
+    def _owner(self) -> str:
+        # Versions are per database, so a file written against another one is ignored.
+        return f"{oracle_config.user}@{oracle_config.dsn}"
+
+    def load(self) -> None:
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "rb") as f:
+                owner, entries = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable query cache {self.path}: {e}")
+            return
+        if owner != self._owner():
+            return
+        with self._lock:
+            for key, entry in entries:
+                self._discard(key)
+                self._entries[key] = entry
+                self._bytes += entry[1]
+            self._evict()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            entries = list(self._entries.items())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((self._owner(), entries), f, pickle.HIGHEST_PROTOCOL)
+        tmp.replace(self.path)
+
+
+_shared: Optional[QueryCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> QueryCache:
+    """Process-wide cache; persisted across runs when QUERY_CACHE_PERSIST is set."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            path = None
+            if analytics_config.query_cache_persist:
+                path = str(Path(analytics_config.cache_dir) / "query_cache.pickle")
+            _shared = QueryCache(path=path)
+            if path:
+                atexit.register(_shared.save)
+        return _shared
@@ -0,0 +1,136 @@
+"""
+Re-run skill extraction over stored descriptions.
+
+Jobs are read in job_id order, CHUNK_SIZE at a time, with their
+compressed bodies fetched inline. Decompression and extract_skills run
+in a process pool while the next chunk is being fetched, and only the
+difference against the current job_skills rows is written back. The
+last finished job_id is recorded after every chunk, so an interrupted
+run continues from there with --resume.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.config.settings import scraper_config
+from src.db.connection import Database
+from src.db.repository import JobRepository, SkillRepository, decompress_description
+from src.scraper.parser import extract_skills
+
+CHUNK_SIZE = 2000
+MAX_JOB_ID = 10 ** 18
+
+Row = Tuple[int, Optional[str], Optional[bytes]]  # (job_id, desc_hash, compressed body)
+
+
+def _skills_for(body: Optional[bytes]) -> Tuple[str, ...]:
+    text = decompress_description(body)
+    return tuple(extract_skills(text)) if text else ()
+
+
+def progress_path() -> Path:
+    return Path(scraper_config.checkpoint_dir) / "reprocess-skills.last"
+
+
+def _fetch_chunks(after: int, until: Optional[int], chunk_size: int) -> Iterator[List[Row]]:
+    with Database.get_cursor() as cursor:
+        cursor.arraysize = chunk_size
+        while True:
+            cursor.execute(
+                """
+                SELECT j.job_id, j.desc_hash, d.body
+                FROM jobs j LEFT JOIN descriptions d ON j.desc_hash = d.desc_hash
+                WHERE j.job_id > :after AND j.job_id <= :until
+                ORDER BY j.job_id
+                FETCH FIRST :n ROWS ONLY
+                """,
+                {"after": after, "until": until if until is not None else MAX_JOB_ID, "n": chunk_size},
+                fetch_lobs=False,
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            yield rows
+            after = rows[-1][0]
+
+
+def _current_skills(first_id: int, last_id: int) -> Dict[int, Dict[str, int]]:
+    """job_id -> {skill name: skill_id} for linked skills in an id range."""
+    current: Dict[int, Dict[str, int]] = {}
+    with Database.get_cursor() as cursor:
+        cursor.arraysize = 5000
+        cursor.execute(
+            """
+            SELECT js.job_id, s.skill_name, s.skill_id
+            FROM job_skills js JOIN skills s ON js.skill_id = s.skill_id
+            WHERE js.job_id BETWEEN :first_id AND :last_id
+            """,
+            {"first_id": first_id, "last_id": last_id},
+        )
+        for job_id, name, skill_id in cursor:
+            current.setdefault(job_id, {})[name] = skill_id
+    return current
+
+
+def _apply_diff(rows: List[Row], skills_by_hash: Dict[str, Tuple[str, ...]]) -> Tuple[int, int]:
+    """Write the job_skills changes for one chunk. Returns (links added, links removed)."""
+    current = _current_skills(rows[0][0], rows[-1][0])
+    added: List[Tuple[int, str]] = []
+    removed: List[Tuple[int, int]] = []
+    for job_id, desc_hash, _ in rows:
+        wanted: Set[str] = set(skills_by_hash.get(desc_hash, ()))
+        existing = current.get(job_id, {})
+        added.extend((job_id, name) for name in wanted - existing.keys())
+        removed.extend((job_id, existing[name]) for name in existing.keys() - wanted)
+
+    skill_ids = SkillRepository.upsert_many([name for _, name in added])
+    JobRepository.add_skills([(job_id, skill_ids[name]) for job_id, name in added])
+    JobRepository.remove_skills(removed)
+    return len(added), len(removed)
+
+
+def reprocess_skills(
+    from_id: int = 0,
+    to_id: Optional[int] = None,
+    resume: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+) -> int:
+    """Re-extract skills for jobs with from_id < job_id <= to_id. Returns jobs processed."""
+    path = progress_path()
+    if resume and path.exists():
+        from_id = max(from_id, int(path.read_text()))
+        print(f"Resuming after job_id {from_id}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    processed = added = removed = 0
+    start = time.monotonic()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = _fetch_chunks(from_id, to_id, chunk_size)
+        rows = next(chunks, None)
+        while rows:
+            # Each distinct body is extracted once, however many jobs share it.
+            bodies = {desc_hash: body for _, desc_hash, body in rows if desc_hash}
+            results = pool.map(_skills_for, bodies.values(), chunksize=max(1, len(bodies) // (4 * workers)))
+            next_rows = next(chunks, None)  # fetched while the pool works
+            skills_by_hash = dict(zip(bodies.keys(), results))
+
+            chunk_added, chunk_removed = _apply_diff(rows, skills_by_hash)
+            processed += len(rows)
+            added += chunk_added
+            removed += chunk_removed
+            path.write_text(str(rows[-1][0]))
+
+            elapsed = time.monotonic() - start
+            print(
+                f"  through job_id {rows[-1][0]}: {processed} jobs, +{added}/-{removed} links, "
+                f"{processed / elapsed:.0f} jobs/s"
+            )
+            rows = next_rows
+
+    elapsed = time.monotonic() - start
+    print(f"Reprocessed {processed} jobs in {elapsed:.1f}s ({processed / max(elapsed, 1e-9):.0f} jobs/s)")
+    return processed
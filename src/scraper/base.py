@@ -1,28 +1,358 @@
 import time
-from typing import Optional
+from typing import Callable, Iterator, List, Optional, Set, Tuple
 import undetected_chromedriver as uc
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
+from src.checkpoint import QueryProgress
 from src.config.settings import scraper_config
+from src.scraper.filters import CardFilter
+from src.scraper.parser import ParsedJob
+from src.scraper.launcher import launch, quit_browser
+from src.scraper.profile import TrafficStats, block_urls, collect_traffic
+from src.scraper.throttle import BlockedError, backoff_delay, get_limiter
+
+# Selectors for interstitials served instead of results (Cloudflare, PerimeterX, reCAPTCHA).
+BLOCK_SELECTORS = [
+    "#challenge-form",
+    "#challenge-running",
+    "#px-captcha",
+    "iframe[src*='captcha']",
+    "iframe[title*='challenge']",
+]
+
+BLOCK_TITLES = ["just a moment", "access denied", "attention required", "security check", "too many requests"]
 
 
 class BaseScraper:
     """Base class for all job scrapers."""
-    
+
+    source = "base"
+    card_selector = ""
+    page_size = 10
+    blocked_url_patterns: List[str] = []
+    # Whether cards lack the description, so each kept job costs a detail fetch (_fetch_details).
+    fetches_details = False
+    # Query parameters for "sort by date, past 24 hours" results, used by scrape_new.
+    newest_first_params = ""
+
     def __init__(self):
         self.driver: Optional[uc.Chrome] = None
+        self.limiter = get_limiter(self.source)
+        self.keep_driver = False
+        self.traffic = TrafficStats()
+        self.card_filter = CardFilter()
+        self.newest_first = False
+        self.caught_up = False
+        self.known_seen: List[str] = []  # job_keys scrape_new passed over as already saved
+
+    def __enter__(self) -> "BaseScraper":
+        """Keep one browser open across several scrape_jobs calls."""
+        self.keep_driver = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.keep_driver = False
+        self._close_driver()
+
+    def scrape_jobs(
+        self,
+        keywords: str,
+        location: str = "United States",
+        max_jobs: Optional[int] = None,
+        progress: Optional[QueryProgress] = None,
+    ) -> Iterator[ParsedJob]:
+        """Yield job listings page by page, up to max_jobs cards.
+
+        Jobs are yielded as soon as their card is parsed, so callers can
+        persist them while the crawl is still running. With `progress`,
+        pages and cards finished by an earlier run are skipped and every
+        processed card is recorded before its job is yielded.
+
+        BlockedError propagates, leaving `progress` unfinished so a later
+        run resumes the query; other errors end the crawl early.
+        """
+        limit = max_jobs or scraper_config.max_jobs
+        seen = 0
+
+        try:
+            for page in range(scraper_config.max_pages):
+                if seen >= limit:
+                    break
+                if progress and progress.page_done(page):
+                    seen += progress.pages[page]
+                    continue
+
+                self._init_driver()
+                if not self._navigate(self._results_url(keywords, location, page)):
+                    break
+                self._prepare_page()
+
+                job_cards = self.driver.find_elements(By.CSS_SELECTOR, self.card_selector)
+                start = progress.cards_done(page) if progress else 0
+                seen += start
+
+                end = max(start, min(len(job_cards), start + limit - seen))
+                for index, job in enumerate(self._parse_cards(job_cards[start:end]), start):
+                    if progress:
+                        progress.record_card(page, index, job)
+                    if job:
+                        yield job
+                    seen += 1
+
+                if progress:
+                    progress.finish_page(page)
+                if len(job_cards) < self.page_size:
+                    break
+
+            if progress:
+                progress.finish()
+
+        except BlockedError:
+            self._close_driver()
+            raise
+        except Exception as e:
+            print(f"Scraping error: {e}")
+            self._close_driver()
+        finally:
+            self._release_driver()
+
+    def scrape_page(self, keywords: str, location: str, page: int) -> Tuple[List[ParsedJob], bool]:
+        """Scrape a single results page, as one unit of a distributed crawl.
+
+        Returns the parsed jobs and whether the page was full, i.e. whether
+        a next page may exist. Navigation errors propagate to the caller.
+        """
+        self._init_driver()
+        if not self._navigate(self._results_url(keywords, location, page)):
+            return [], False
+        self._prepare_page()
+
+        job_cards = self.driver.find_elements(By.CSS_SELECTOR, self.card_selector)
+        jobs = [job for job in self._parse_cards(job_cards) if job]
+        return jobs, len(job_cards) >= self.page_size
+
+    def _parse_cards(self, cards: list) -> Iterator[Optional[ParsedJob]]:
+        """Yield one job per card, or None for cards that failed to parse or were filtered out.
+
+        All cards are read before any details are fetched, so rules and
+        the already-seen lookup (one query for the page) run on card
+        fields alone. Details are fetched lazily as the caller consumes
+        jobs, and only for jobs that passed.
+        """
+        jobs = []
+        for card in cards:
+            job = self._read_card(card)
+            reason = self.card_filter.reject(job) if job else None
+            if reason:
+                self.card_filter.count(reason)
+                job = None
+            jobs.append(job)
+        if self.fetches_details:
+            self.card_filter.prime(jobs)
+
+        for card, job in zip(cards, jobs):
+            if job and self.fetches_details:
+                if self.card_filter.seen(job):
+                    # Saving it only refreshes last_seen, which needs no description.
+                    self.card_filter.count("seen")
+                else:
+                    self._fetch_details(card, job)
+                    self.card_filter.count(None)
+            yield job
+
+    def scrape_new(
+        self,
+        keywords: str,
+        location: str,
+        known_keys: Callable[[List[str]], Set[str]],
+        max_pages: Optional[int] = None,
+    ) -> Iterator[ParsedJob]:
+        """Yield postings newer than any already saved, from results sorted newest first.
+
+        Pages are read in date order until WATCH_KNOWN_STREAK cards in a
+        row are ones `known_keys` reports as saved; everything after them
+        was seen by an earlier poll, so paging stops there. A single known
+        card is not enough: sites pin sponsored or promoted postings above
+        the date order, and stopping at one would end every poll at it.
+        Known cards are skipped, a new card restarts the count, and cards
+        the filters reject leave it as it is. A poll therefore costs a page
+        or so plus the new postings, however large the result set.
+        Details are fetched for new jobs only. Navigation errors propagate
+        to the caller.
+
+        Afterwards `caught_up` tells whether paging reached the run of known
+        postings or the end of the results; False means max_pages ran out
+        first and older new postings may have been missed. `known_seen`
+        lists the known cards passed over, whose last_seen the caller
+        should refresh (JobRepository.touch) since they are not re-saved.
+        """
+        self.newest_first = True
+        self.caught_up = False
+        self.known_seen = []
+        streak = 0
+        try:
+            for page in range(max_pages or scraper_config.max_pages):
+                self._init_driver()
+                if not self._navigate(self._results_url(keywords, location, page)):
+                    self.caught_up = True
+                    return
+                self._prepare_page()
+
+                job_cards = self.driver.find_elements(By.CSS_SELECTOR, self.card_selector)
+                jobs = [self._read_card(card) for card in job_cards]
+                saved = known_keys([job.key for job in jobs if job])
+                for card, job in zip(job_cards, jobs):
+                    if job is None:
+                        continue
+                    if job.key in saved:
+                        self.known_seen.append(job.key)
+                        streak += 1
+                        if streak >= scraper_config.watch_known_streak:
+                            self.caught_up = True
+                            return
+                        continue
+                    reason = self.card_filter.reject(job)
+                    if reason:
+                        self.card_filter.count(reason)
+                        continue
+                    streak = 0
+                    if self.fetches_details:
+                        self._fetch_details(card, job)
+                        self.card_filter.count(None)
+                    yield job
+
+                if len(job_cards) < self.page_size:
+                    self.caught_up = True
+                    return
+        finally:
+            self.newest_first = False
+            self._release_driver()
+
+    def _read_card(self, card) -> Optional[ParsedJob]:
+        try:
+            return self._parse_job_card(card)
+        except Exception as e:
+            print(f"Error parsing job card: {e}")
+            return None
+
+    def _results_url(self, keywords: str, location: str, page: int) -> str:
+        url = self._page_url(keywords, location, page)
+        if self.newest_first and self.newest_first_params:
+            url += ("&" if "?" in url else "?") + self.newest_first_params
+        return url
+
+    def _page_url(self, keywords: str, location: str, page: int) -> str:
+        raise NotImplementedError
+
+    def summary(self) -> List[str]:
+        """Run statistics for the end-of-run report, one "Label: stats" line each."""
+        return [
+            f"Pacing: {self.limiter.summary()}",
+            f"Traffic: {self.traffic.summary()}",
+            f"Cards: {self.card_filter.summary()}",
+        ]
+
+    def _prepare_page(self) -> None:
+        """Hook run after a results page has loaded, before cards are read."""
+
+    def _parse_job_card(self, card) -> Optional[ParsedJob]:
+        """Read the fields shown on the card itself; nothing here may open the posting."""
+        raise NotImplementedError
+
+    def _fetch_details(self, card, job: ParsedJob) -> None:
+        """Fill in what only the posting itself shows. Called only when fetches_details is set."""
 
     def _init_driver(self) -> None:
-        options = uc.ChromeOptions()
-        if scraper_config.headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-
-        self.driver = uc.Chrome(options=options)
+        if self.driver:
+            return
+        self.driver = launch()
         self.driver.set_page_load_timeout(scraper_config.page_load_timeout)
+        if scraper_config.lean_profile:
+            block_urls(self.driver, self.blocked_url_patterns)
 
     def _close_driver(self) -> None:
         if self.driver:
-            self.driver.quit()
-            self.driver = None
\ No newline at end of file
+            quit_browser(self.driver)
+            self.driver = None
+
+    def _release_driver(self) -> None:
+        if not self.keep_driver:
+            self._close_driver()
+
+    def _navigate(self, url: str) -> bool:
+        """Load a results page through the source's rate limiter.
+
+        Retries with jittered exponential backoff when the page is a block
+        page or shows no job cards. Returns False if the page stayed empty,
+        raises BlockedError if the source is still blocking after all retries.
+        """
+        reason = None
+        for attempt in range(scraper_config.max_retries + 1):
+            if attempt:
+                delay = backoff_delay(attempt - 1)
+                print(f"  {self.source}: {reason}, retrying in {delay:.0f}s")
+                time.sleep(delay)
+
+            self.limiter.acquire()
+            start = time.monotonic()
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                pass
+            if self._wait_for_cards():
+                self.limiter.on_success(time.monotonic() - start)
+                self._record_traffic()
+                return True
+
+            reason = self._detect_block()
+            if reason is not None:
+                self.limiter.on_block()
+            else:
+                # Empty results may be genuine, so only give them one more try.
+                if attempt >= 1:
+                    print(f"  {self.source}: no job cards on page ({self.limiter.summary()})")
+                    return False
+                reason = "empty results"
+
+        raise BlockedError(f"{self.source} blocked after {scraper_config.max_retries} retries: {reason}")
+
+    def _record_traffic(self) -> None:
+        if not scraper_config.lean_profile:
+            return
+        try:
+            page = collect_traffic(self.driver)
+        except Exception as e:
+            print(f"  Could not read traffic log: {e}")
+            return
+        self.traffic.add(page)
+        print(f"  Page traffic: {page.summary()}")
+
+    def _wait_for_cards(self) -> bool:
+        try:
+            WebDriverWait(self.driver, scraper_config.ready_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.card_selector))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _detect_block(self) -> Optional[str]:
+        """Return a description of the block signal on the current page, if any."""
+        status = self.driver.execute_script(
+            "const nav = performance.getEntriesByType('navigation')[0];"
+            "return nav ? nav.responseStatus : null;"
+        )
+        if status in (403, 429, 503):
+            return f"HTTP {status}"
+
+        title = (self.driver.title or "").lower()
+        for marker in BLOCK_TITLES:
+            if marker in title:
+                return f"block page ({marker})"
+
+        if self.driver.find_elements(By.CSS_SELECTOR, ", ".join(BLOCK_SELECTORS)):
+            return "captcha"
+        return None
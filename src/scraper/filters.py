@@ -0,0 +1,128 @@
+"""
+Card filters, evaluated on the fields a results card shows before any
+detail page is opened.
+
+Opening a posting to read its description costs a click, fixed sleeps
+and a panel wait, so jobs we would throw away anyway are rejected from
+the card alone. Rules come from the `filters` section of a plan file:
+
+    filters:
+      title_include: [engineer, developer]   # regexes; the title must match one
+      title_exclude: [intern, "\\bsales\\b"]  # regexes; the title must match none
+      company_blocklist: [Acme Staffing]      # exact names, case-insensitive
+      locations: [remote, ", NY", "Austin"]   # regexes on "city, state, country work_mode"; one must match
+      skip_seen: true                          # no detail fetch for job_keys already saved
+
+All patterns are case-insensitive. Jobs already in the database are
+still yielded, without a description: saving them only refreshes
+last_seen, which is all a repeat sighting changes (see JOB_MERGE).
+"""
+import re
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Set
+
+from src.scraper.parser import ParsedJob
+
+KnownKeys = Callable[[List[str]], Set[str]]
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _patterns(value) -> List[Pattern]:
+    return [re.compile(pattern, re.IGNORECASE) for pattern in _as_list(value)]
+
+
+def _fold(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def _saved_keys(keys: List[str]) -> Set[str]:
+    from src.db.repository import JobRepository
+
+    return JobRepository.existing_keys(keys)
+
+
+class CardFilter:
+    """Rules applied to card fields, with counts of the detail fetches they saved."""
+
+    def __init__(
+        self,
+        title_include=(),
+        title_exclude=(),
+        company_blocklist=(),
+        locations=(),
+        skip_seen: bool = False,
+        known_keys: KnownKeys = _saved_keys,
+    ):
+        self.title_include = _patterns(title_include)
+        self.title_exclude = _patterns(title_exclude)
+        self.company_blocklist = {_fold(name) for name in _as_list(company_blocklist)}
+        self.locations = _patterns(locations)
+        self.skip_seen = skip_seen
+        self.known_keys = known_keys
+        self.skipped: Counter = Counter()  # reason -> detail fetches avoided
+        self.fetched = 0
+        self._seen: Set[str] = set()
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "CardFilter":
+        data = data or {}
+        unknown = set(data) - {"title_include", "title_exclude", "company_blocklist", "locations", "skip_seen"}
+        if unknown:
+            raise ValueError(f"Unknown filter keys: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def reject(self, job: ParsedJob) -> Optional[str]:
+        """Reason to drop a job read from its card, or None to keep it."""
+        # The same check save_jobs makes; no point fetching details it would discard.
+        if not (job.title and job.company):
+            return "missing title or company"
+        if self.title_include and not any(p.search(job.title) for p in self.title_include):
+            return "title"
+        if any(p.search(job.title) for p in self.title_exclude):
+            return "title"
+        if _fold(job.company) in self.company_blocklist:
+            return "company"
+        if self.locations:
+            location = f"{job.city}, {job.state}, {job.country} {job.work_mode or ''}"
+            if not any(p.search(location) for p in self.locations):
+                return "location"
+        return None
+
+    def prime(self, jobs: Iterable[Optional[ParsedJob]]) -> None:
+        """Look up which of a page's jobs are already saved, in one query."""
+        if not self.skip_seen:
+            return
+        keys = [job.key for job in jobs if job is not None]
+        self._seen = self.known_keys(keys) if keys else set()
+
+    def seen(self, job: ParsedJob) -> bool:
+        return job.key in self._seen
+
+    def count(self, reason: Optional[str]) -> None:
+        if reason:
+            self.skipped[reason] += 1
+        else:
+            self.fetched += 1
+
+    def summary(self) -> str:
+        skipped = sum(self.skipped.values())
+        detail = ", ".join(f"{reason} {count}" for reason, count in self.skipped.most_common())
+        return f"{self.fetched} detail fetches, {skipped} skipped" + (f" ({detail})" if detail else "")
+
+
+def load_filters(path: Optional[str]) -> Dict:
+    """The `filters` section of a plan file, or {} without one."""
+    if not path:
+        return {}
+    from src.plan import read_file
+
+    filters = read_file(path).get("filters") or {}
+    CardFilter.from_dict(filters)  # fail on a bad section before any browser starts
+    return filters
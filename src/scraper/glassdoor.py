@@ -1,95 +1,100 @@
 import time
 from typing import List, Optional
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
-from src.config.settings import scraper_config
+from src.plan import PAGE_SIZES
 from src.scraper.base import BaseScraper
-from src.scraper.parser import ParsedJob, parse_location, extract_skills
+from src.scraper.locations import normalize_location
+from src.scraper.parser import ParsedJob
+
+# Removes sign-in walls and other overlays the moment they are attached, and
+# undoes the scroll lock they put on <body>. Counts removals in window.__modalsRemoved.
+MODAL_GUARD = """
+(() => {
+    const SELECTOR = 'dialog, [class*="Modal"], [class*="Overlay"]';
+    window.__modalsRemoved = 0;
+    const strip = (root) => {
+        const found = root.matches && root.matches(SELECTOR) ? [root] : [];
+        if (root.querySelectorAll) found.push(...root.querySelectorAll(SELECTOR));
+        for (const el of found) {
+            if (el.isConnected) {
+                el.remove();
+                window.__modalsRemoved++;
+            }
+        }
+        if (found.length && document.body) {
+            document.body.style.overflow = 'auto';
+        }
+    };
+    new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) strip(node);
+            }
+        }
+    }).observe(document, {childList: true, subtree: true});
+})();
+"""
 
 
 class GlassdoorScraper(BaseScraper):
-    
+
+    source = "glassdoor"
+    card_selector = '[data-test="jobListing"]'
+    blocked_url_patterns = ["*media.glassdoor.com*"]
+    page_size = PAGE_SIZES["glassdoor"]
+    fetches_details = True
+    newest_first_params = "sortBy=date_desc&fromAge=1"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.glassdoor.com/Job"
+        self.modals_removed = 0
 
-    def scrape_jobs(self, keywords: str, location: str = "United States") -> List[ParsedJob]:
-        """Scrape Glassdoor job listings."""
-        jobs = []
-        
-        try:
-            self._init_driver()
-            
-            keyword_slug = keywords.lower().replace(' ', '-')
-            url = f"{self.base_url}/{keyword_slug}-jobs-SRCH_KO0,{len(keywords)}.htm"
-            self.driver.get(url)
-            time.sleep(3)
-            
-            self._close_modals()
-            time.sleep(1)
-            self._close_modals()
-            
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, '[data-test="jobListing"]')
-            
-            for card in job_cards[:scraper_config.max_jobs]:
-                try:
-                    self._close_modals()
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"Error parsing job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Scraping error: {e}")
-        finally:
-            self._close_driver()
-        
-        return jobs
-
-    def _close_modals(self) -> None:
-        """Close any popup modals."""
+    def _page_url(self, keywords: str, location: str, page: int) -> str:
+        keyword_slug = keywords.lower().replace(' ', '-')
+        page_suffix = f"_IP{page + 1}" if page else ""
+        return f"{self.base_url}/{keyword_slug}-jobs-SRCH_KO0,{len(keywords)}{page_suffix}.htm"
+
+    def _init_driver(self) -> None:
+        if self.driver:
+            return
+        super()._init_driver()
+        # Registered once per browser; runs in every document before Glassdoor's own scripts.
+        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": MODAL_GUARD})
+
+    def _navigate(self, url: str) -> bool:
+        self._collect_modal_count()
+        return super()._navigate(url)
+
+    def _close_driver(self) -> None:
+        self._collect_modal_count()
+        super()._close_driver()
+
+    def summary(self) -> List[str]:
+        # The current page's modals are banked only when the browser leaves it.
+        pending = self._page_modal_count() if self.driver else 0
+        return super().summary() + [f"Modals: {self.modals_removed + pending} removed"]
+
+    def _prepare_page(self) -> None:
+        removed = self._page_modal_count()
+        if removed:
+            print(f"  Removed {removed} modals while the page loaded")
+
+    def _page_modal_count(self) -> int:
+        """Modals the guard has removed from the current document."""
         try:
-            close_selectors = [
-                '[aria-label="Close"]',
-                'button[class*="CloseButton"]',
-                '[data-test="close-button"]',
-                '.modal-close',
-                'dialog button'
-            ]
-            
-            for selector in close_selectors:
-                try:
-                    btns = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in btns:
-                        try:
-                            btn.click()
-                            time.sleep(0.3)
-                        except:
-                            pass
-                except:
-                    pass
-            
-            try:
-                body = self.driver.find_element(By.TAG_NAME, "body")
-                body.send_keys(Keys.ESCAPE)
-                time.sleep(0.3)
-            except:
-                pass
-            
-            self.driver.execute_script("""
-                document.querySelectorAll('dialog, [class*="Modal"]').forEach(el => el.remove());
-                document.querySelectorAll('[class*="Overlay"]').forEach(el => el.remove());
-            """)
-            time.sleep(0.3)
-            
-        except:
-            pass
+            return int(self.driver.execute_script("return window.__modalsRemoved || 0;"))
+        except Exception:
+            return 0
+
+    def _collect_modal_count(self) -> None:
+        # The in-page counter dies with its document, so bank it before leaving the page.
+        if self.driver:
+            self.modals_removed += self._page_modal_count()
 
     def _parse_job_card(self, card) -> Optional[ParsedJob]:
         """Parse a single Glassdoor job card."""
@@ -109,25 +114,26 @@ class GlassdoorScraper(BaseScraper):
             except NoSuchElementException:
                 location_str = "Unknown"
             
-            description = self._get_description(card)
-            
-            city, state, country = parse_location(location_str)
-            skills = extract_skills(description)
+            place = normalize_location(location_str)
             
             return ParsedJob(
                 title=title,
                 company=company,
-                city=city,
-                state=state,
-                country=country,
-                description=description,
-                skills=skills,
-                post_date=None
+                city=place.city,
+                state=place.state,
+                country=place.country,
+                description="",
+                skills=[],
+                post_date=None,
+                work_mode=place.work_mode
             )
         except Exception as e:
             print(f"Parse error: {e}")
             return None
 
+    def _fetch_details(self, card, job: ParsedJob) -> None:
+        job.set_description(self._get_description(card))
+
     def _get_description(self, card) -> str:
         """Click job card and extract description."""
         try:
@@ -137,8 +143,6 @@ class GlassdoorScraper(BaseScraper):
             self.driver.execute_script("arguments[0].click();", card)
             time.sleep(1.5)
             
-            self._close_modals()
-            
             try:
                 desc_elem = WebDriverWait(self.driver, 5).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="JobDetails_jobDescription"]'))
@@ -1,49 +1,34 @@
 import time
-from typing import List, Optional
+from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
-from src.config.settings import scraper_config
+from src.plan import PAGE_SIZES
 from src.scraper.base import BaseScraper
-from src.scraper.parser import ParsedJob, parse_location, extract_skills
+from src.scraper.locations import normalize_location
+from src.scraper.parser import ParsedJob
 
 
 class IndeedScraper(BaseScraper):
-    
+
+    source = "indeed"
+    card_selector = ".job_seen_beacon"
+    page_size = PAGE_SIZES["indeed"]
+    blocked_url_patterns = ["*d2q79iu7y748jz.cloudfront.net*"]
+    fetches_details = True
+    newest_first_params = "sort=date&fromage=1"
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.indeed.com/jobs"
 
-    def scrape_jobs(self, keywords: str, location: str = "United States") -> List[ParsedJob]:
-        """Scrape Indeed job listings."""
-        jobs = []
-        
-        try:
-            self._init_driver()
-            
-            url = f"{self.base_url}?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}"
-            self.driver.get(url)
-            time.sleep(3)
-            
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job_seen_beacon")
-            
-            for card in job_cards[:scraper_config.max_jobs]:
-                try:
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"Error parsing job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Scraping error: {e}")
-        finally:
-            self._close_driver()
-        
-        return jobs
+    def _page_url(self, keywords: str, location: str, page: int) -> str:
+        return (
+            f"{self.base_url}?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}"
+            f"&start={page * self.page_size}"
+        )
 
     def _parse_job_card(self, card) -> Optional[ParsedJob]:
         """Parse a single Indeed job card."""
@@ -63,25 +48,26 @@ class IndeedScraper(BaseScraper):
             except NoSuchElementException:
                 location_str = "Unknown"
             
-            description = self._get_description(card)
-            
-            city, state, country = parse_location(location_str)
-            skills = extract_skills(description)
+            place = normalize_location(location_str)
             
             return ParsedJob(
                 title=title,
                 company=company,
-                city=city,
-                state=state,
-                country=country,
-                description=description,
-                skills=skills,
-                post_date=None
+                city=place.city,
+                state=place.state,
+                country=place.country,
+                description="",
+                skills=[],
+                post_date=None,
+                work_mode=place.work_mode
             )
         except Exception as e:
             print(f"Parse error: {e}")
             return None
 
+    def _fetch_details(self, card, job: ParsedJob) -> None:
+        job.set_description(self._get_description(card))
+
     def _get_description(self, card) -> str:
         """Click job card and extract description from side panel."""
         try:
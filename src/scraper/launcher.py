@@ -0,0 +1,252 @@
+"""
+Browser launch with a warm-start cache.
+
+A plain uc.Chrome() downloads chromedriver, patches it and has Chrome
+build a new profile from scratch on every launch: seconds before the
+first page, paid again by every scraper, query retry and worker.
+With SCRAPER_WARM_START (the default) launches instead reuse:
+
+- a patched chromedriver kept in BROWSER_CACHE_DIR, one per Chrome major
+  version. undetected_chromedriver only checks a binary it is given, so
+  there is no download or patching after the first launch, in any process;
+- a template profile made by one throwaway launch and cloned for each
+  browser with `cp --reflink=auto` (copy-on-write where the filesystem
+  supports it). Clones are not hardlinked: Chrome updates its SQLite
+  files in place, which would write through to the template;
+- with SCRAPER_STANDBY_BROWSERS=N, N browsers started in the background
+  and handed out by launch(); each one taken is replaced right away.
+
+Cache files are written to a temporary name and renamed into place, so
+processes warming the cache at the same time never see a partial file.
+"""
+import atexit
+import os
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+import undetected_chromedriver as uc
+
+from src.config.settings import scraper_config
+from src.scraper.profile import apply_lean_options
+
+# Regenerated on every launch; copying them into the template only costs time.
+PROFILE_SKIP = {"Cache", "Code Cache", "GPUCache", "ShaderCache", "GrShaderCache", "GraphiteDawnCache",
+                "Crashpad", "SingletonLock", "SingletonSocket", "SingletonCookie", "DevToolsActivePort"}
+
+
+def chrome_options() -> uc.ChromeOptions:
+    """Options for every scraper browser. A ChromeOptions object can only be used for one launch."""
+    options = uc.ChromeOptions()
+    if scraper_config.headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    if scraper_config.lean_profile:
+        apply_lean_options(options)
+    return options
+
+
+def chrome_version() -> Optional[int]:
+    """Major version of the installed Chrome, or None if it cannot be found."""
+    executable = uc.find_chrome_executable()
+    if not executable:
+        return None
+    try:
+        output = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=30).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+)\.\d+\.\d+", output)
+    return int(match.group(1)) if match else None
+
+
+def _cache_dir(version: int) -> Path:
+    return Path(scraper_config.browser_cache_dir) / f"chrome-{version}"
+
+
+def patched_driver(version: int) -> str:
+    """Path of a patched chromedriver for this Chrome version, downloading and patching it once."""
+    path = _cache_dir(version) / ("chromedriver.exe" if sys.platform == "win32" else "chromedriver")
+    if path.exists():
+        return str(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    patcher = uc.Patcher(version_main=version)
+    patcher.auto()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    shutil.copy2(patcher.executable_path, tmp)
+    os.chmod(tmp, 0o755)
+    os.replace(tmp, path)
+    return str(path)
+
+
+def profile_template(version: int, driver_path: str) -> Path:
+    """A profile directory past Chrome's first-run setup, created by one throwaway launch."""
+    path = _cache_dir(version) / "profile"
+    if path.exists():
+        return path
+    tmp = Path(tempfile.mkdtemp(prefix="profile.", dir=path.parent))
+    driver = uc.Chrome(
+        options=chrome_options(), user_data_dir=str(tmp), driver_executable_path=driver_path, version_main=version
+    )
+    try:
+        driver.get("about:blank")
+    finally:
+        driver.quit()
+    for name in PROFILE_SKIP:
+        for found in tmp.rglob(name):
+            if found.is_dir() and not found.is_symlink():
+                shutil.rmtree(found, ignore_errors=True)
+            else:
+                found.unlink(missing_ok=True)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Another process got there first; its template is as good as ours.
+        shutil.rmtree(tmp, ignore_errors=True)
+    return path
+
+
+def clone_profile(template: Path) -> str:
+    """A private copy of the template for one browser, copy-on-write where the filesystem allows."""
+    target = tempfile.mkdtemp(prefix="scraper-profile-")
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        subprocess.run(["cp", "-a", "--reflink=auto", f"{template}/.", target], check=True)
+    else:
+        shutil.copytree(template, target, dirs_exist_ok=True)
+    return target
+
+
+class WarmCache:
+    """Patched driver and profile template for the installed Chrome, prepared on first use."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = False
+        self.version: Optional[int] = None
+        self.driver_path: Optional[str] = None
+        self.template: Optional[Path] = None
+
+    def prepare(self) -> bool:
+        """Fill the cache; False if Chrome's version is unknown and launches must stay cold."""
+        with self._lock:
+            if not self._ready:
+                self._ready = True
+                self.version = chrome_version()
+                if self.version:
+                    self.driver_path = patched_driver(self.version)
+                    self.template = profile_template(self.version, self.driver_path)
+            return self.template is not None
+
+
+_warm = WarmCache()
+
+
+def launch_cold() -> uc.Chrome:
+    return uc.Chrome(options=chrome_options())
+
+
+def launch_warm() -> uc.Chrome:
+    if not _warm.prepare():
+        return launch_cold()
+    profile = clone_profile(_warm.template)
+    try:
+        driver = uc.Chrome(
+            options=chrome_options(),
+            user_data_dir=profile,
+            driver_executable_path=_warm.driver_path,
+            version_main=_warm.version,
+        )
+    except Exception:
+        shutil.rmtree(profile, ignore_errors=True)
+        raise
+    driver.cloned_profile = profile
+    return driver
+
+
+def quit_browser(driver) -> None:
+    """Quit a browser and remove its cloned profile; uc keeps profiles it was given."""
+    try:
+        driver.quit()
+    finally:
+        profile = getattr(driver, "cloned_profile", None)
+        if profile:
+            shutil.rmtree(profile, ignore_errors=True)
+
+
+class StandbyPool:
+    """Browsers launched ahead of time in background threads."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._ready: "queue.Queue" = queue.Queue()
+        self._closed = False
+        for _ in range(size):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        threading.Thread(target=self._start_one, daemon=True, name="standby-browser").start()
+
+    def _start_one(self) -> None:
+        try:
+            driver = launch_warm()
+        except Exception as e:
+            print(f"  Standby browser failed to start: {e}")
+            self._ready.put(None)
+            return
+        if self._closed:
+            quit_browser(driver)
+        else:
+            self._ready.put(driver)
+
+    def take(self) -> Optional[uc.Chrome]:
+        """A started browser, waiting for one still starting; None if its launch failed."""
+        driver = self._ready.get()
+        if not self._closed:
+            self._spawn()
+        if driver is not None:
+            try:
+                driver.current_url  # a standby browser may have crashed while it waited
+            except Exception:
+                quit_browser(driver)
+                driver = None
+        return driver
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            if driver is not None:
+                quit_browser(driver)
+
+
+_pool: Optional[StandbyPool] = None
+_pool_lock = threading.Lock()
+
+
+def standby_pool() -> Optional[StandbyPool]:
+    """The process-wide pool, started on first use; None with SCRAPER_STANDBY_BROWSERS=0."""
+    global _pool
+    with _pool_lock:
+        if _pool is None and scraper_config.standby_browsers > 0:
+            _pool = StandbyPool(scraper_config.standby_browsers)
+            atexit.register(_pool.close)
+        return _pool
+
+
+def launch() -> uc.Chrome:
+    """A ready browser: from the standby pool if one is configured, else a warm or cold launch."""
+    if not scraper_config.warm_start:
+        return launch_cold()
+    pool = standby_pool()
+    driver = pool.take() if pool else None
+    return driver or launch_warm()
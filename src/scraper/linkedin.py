@@ -1,45 +1,28 @@
 import time
-from typing import List, Optional
+from typing import Optional
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 
 from src.config.settings import scraper_config
+from src.plan import PAGE_SIZES
 from src.scraper.base import BaseScraper
-from src.scraper.parser import ParsedJob, parse_location, parse_post_date
+from src.scraper.locations import normalize_location
+from src.scraper.parser import ParsedJob, parse_post_date
 
 
 class LinkedInScraper(BaseScraper):
-    
-    def scrape_jobs(self, keywords: str, location: str = "United States") -> List[ParsedJob]:
-        """Scrape LinkedIn job listings."""
-        jobs = []
-        
-        try:
-            self._init_driver()
-            
-            url = f"{scraper_config.base_url}?keywords={keywords}&location={location}"
-            self.driver.get(url)
-            time.sleep(3)
-            
-            self._scroll_page()
-            
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".base-card")
-            
-            for card in job_cards[:scraper_config.max_jobs]:
-                try:
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"Error parsing job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Scraping error: {e}")
-        finally:
-            self._close_driver()
-        
-        return jobs
+
+    source = "linkedin"
+    card_selector = ".base-card"
+    page_size = PAGE_SIZES["linkedin"]
+    blocked_url_patterns = ["*media.licdn.com*", "*px.ads.linkedin.com*", "*snap.licdn.com*"]
+    newest_first_params = "sortBy=DD&f_TPR=r86400"
+
+    def _page_url(self, keywords: str, location: str, page: int) -> str:
+        return f"{scraper_config.base_url}?keywords={keywords}&location={location}&start={page * self.page_size}"
+
+    def _prepare_page(self) -> None:
+        self._scroll_page()
 
     def _scroll_page(self, scrolls: int = 3) -> None:
         """Scroll page to load more jobs."""
@@ -60,18 +43,19 @@ class LinkedInScraper(BaseScraper):
             except NoSuchElementException:
                 date_str = ""
             
-            city, state, country = parse_location(location_str)
+            place = normalize_location(location_str)
             post_date = parse_post_date(date_str)
             
             return ParsedJob(
                 title=title,
                 company=company,
-                city=city,
-                state=state,
-                country=country,
+                city=place.city,
+                state=place.state,
+                country=place.country,
                 description="",
                 skills=[],
-                post_date=post_date
+                post_date=post_date,
+                work_mode=place.work_mode
             )
         except Exception as e:
             print(f"Parse error: {e}")
@@ -0,0 +1,166 @@
+"""
+Location normalisation against a bundled gazetteer.
+
+Job boards describe the same place many ways: "New York, NY (Hybrid)",
+"Remote in New York, NY 10001", "New York City Metropolitan Area",
+"New York, New York, United States". normalize_location maps each of
+them to one canonical (city, state, country) plus a work mode, so the
+locations table holds one row per real place and location searches can
+use equality instead of LIKE scans.
+
+The gazetteer (data/gazetteer.tsv: US states, the larger US cities,
+metro-area aliases and country names) is loaded once into a few dicts
+of interned strings. Results are memoised per raw string, since a crawl
+sees the same few hundred location strings over and over. Strings the
+gazetteer does not know keep the old comma-split behaviour, with state
+names still folded to their abbreviation.
+"""
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.tsv"
+CACHE_SIZE = 8192
+
+UNKNOWN = "Unknown"
+DEFAULT_COUNTRY = "USA"
+WORK_MODES = ("remote", "hybrid", "onsite")
+
+# Checked in this order: "Hybrid remote" is hybrid.
+MODE_PATTERNS = [
+    ("hybrid", re.compile(r"\bhybrid\b", re.IGNORECASE)),
+    ("remote", re.compile(r"\bremote\b|\bwork from home\b|\bwfh\b|\btelecommute\b", re.IGNORECASE)),
+    ("onsite", re.compile(r"\bon[- ]?site\b|\bin[- ]office\b|\bin[- ]person\b", re.IGNORECASE)),
+]
+
+# Noise around the place itself: work-mode phrases, "(...)", ZIP codes, "+3 locations", bullets.
+NOISE = re.compile(
+    r"\([^)]*\)"
+    r"|\b(?:hybrid|remote)(?:\s+(?:work|remote))?(?:\s+in\b)?"
+    r"|\b(?:work from home|wfh|telecommute|on[- ]?site|in[- ]office|in[- ]person)\b"
+    r"|\b\d{5}(?:-\d{4})?\b"
+    r"|\+\s*\d+\s+locations?\b"
+    r"|[•·|]",
+    re.IGNORECASE,
+)
+# "Greater Denver Area", "Denver Metropolitan Area", "Denver Metro" -> "Denver".
+METRO = re.compile(r"^(?:greater|metro)\s+|\s+(?:metropolitan area|metro area|metroplex|metro|bay area|area)$")
+
+
+class Place(NamedTuple):
+    city: str
+    state: str
+    country: str
+    work_mode: Optional[str] = None
+
+
+def _fold(text: str) -> str:
+    return " ".join(text.lower().replace(".", "").split())
+
+
+class Gazetteer:
+    """In-memory index over the gazetteer file, keyed by folded names."""
+
+    def __init__(self, path: Path = GAZETTEER_PATH):
+        self.states: Dict[str, str] = {}  # name or abbreviation -> abbreviation
+        self.cities: Dict[Tuple[str, str], str] = {}  # (city, abbreviation) -> canonical city
+        self.largest: Dict[str, Tuple[str, str]] = {}  # city -> (canonical city, abbreviation) of the largest
+        self.aliases: Dict[str, Tuple[str, str]] = {}
+        self.countries: Dict[str, str] = {}
+
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if not line or line.startswith("#"):
+                continue
+            kind, *fields = [sys.intern(field) for field in line.split("\t")]
+            if kind == "state":
+                abbreviation, name = fields
+                self.states[_fold(abbreviation)] = self.states[_fold(name)] = abbreviation
+            elif kind == "city":
+                name, state = fields
+                self.cities[(_fold(name), state)] = name
+                self.largest.setdefault(_fold(name), (name, state))
+            elif kind == "alias":
+                alias, city, state = fields
+                self.aliases[_fold(alias)] = (city, state)
+            elif kind == "country":
+                for name in fields:
+                    self.countries[_fold(name)] = fields[0]
+
+    def city(self, name: str, state: str) -> str:
+        """Canonical spelling of a city in a known state ("saint louis" -> "St. Louis")."""
+        folded = _fold(name)
+        alias = self.aliases.get(folded)
+        if alias and alias[1] == state:
+            return alias[0]
+        return self.cities.get((folded, state), name)
+
+    def place(self, name: str) -> Optional[Tuple[str, str]]:
+        """(city, state) for a bare city, alias or metro-area name."""
+        folded = _fold(name)
+        found = self.aliases.get(folded) or self.largest.get(folded)
+        if found is None:
+            bare = METRO.sub("", folded)
+            if bare != folded:
+                found = self.aliases.get(bare) or self.largest.get(bare)
+        return found
+
+
+@lru_cache(maxsize=1)
+def gazetteer() -> Gazetteer:
+    return Gazetteer()
+
+
+def normalize_state(name: str) -> str:
+    """Abbreviation for a US state name ("California" -> "CA"); other values are upper-cased."""
+    return gazetteer().states.get(_fold(name), name.strip().upper())
+
+
+def work_mode(raw: str) -> Optional[str]:
+    for mode, pattern in MODE_PATTERNS:
+        if pattern.search(raw):
+            return mode
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_location(raw: Optional[str]) -> Place:
+    """Canonical place and work mode ("remote", "hybrid", "onsite" or None) for a raw location string."""
+    if not raw or not raw.strip():
+        return Place(UNKNOWN, UNKNOWN, DEFAULT_COUNTRY)
+    mode = work_mode(raw)
+    city, state, country = _resolve(NOISE.sub(" ", raw), gazetteer())
+    return Place(sys.intern(city), sys.intern(state), sys.intern(country), mode)
+
+
+def _resolve(text: str, places: Gazetteer) -> Tuple[str, str, str]:
+    parts = [" ".join(part.split()).strip(" -–:/") for part in re.split(r"[,;]", text)]
+    parts = [part for part in parts if part]
+    country = DEFAULT_COUNTRY
+    if parts and _fold(parts[-1]) in places.countries:
+        country = places.countries[_fold(parts.pop())]
+
+    if not parts:
+        return UNKNOWN, UNKNOWN, country
+    if country != DEFAULT_COUNTRY:
+        # Not a US place: keep what the board gave us, as parse_location always did.
+        return parts[0], parts[1] if len(parts) > 1 else UNKNOWN, country
+
+    state = places.states.get(_fold(parts[-1]))
+    if len(parts) > 1:
+        if state:
+            return places.city(parts[0], state), state, country
+        return parts[0], parts[1], country
+
+    # A single name: an alias ("NYC", "New York") wins over a state, a state over a city.
+    name = parts[0]
+    alias = places.aliases.get(_fold(name))
+    if alias:
+        return alias[0], alias[1], country
+    if state:
+        return UNKNOWN, state, country
+    found = places.place(name)
+    if found:
+        return found[0], found[1], country
+    return name, UNKNOWN, country
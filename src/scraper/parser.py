@@ -1,34 +1,82 @@
+import hashlib
 import re
-from dataclasses import dataclass
+import sys
 from datetime import date, timedelta
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
+
+from src.scraper.locations import normalize_location
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
 
 
-@dataclass
 class ParsedJob:
-    title: str
-    company: str
-    city: str
-    state: str
-    country: str
-    description: str
-    skills: List[str]
-    post_date: Optional[date] = None
+    """A scraped job posting.
+
+    Uses __slots__ and interns company, location and skill strings, which
+    repeat across thousands of postings, so each distinct value is stored once.
+    """
+
+    __slots__ = ("title", "company", "city", "state", "country", "description", "skills", "post_date", "work_mode")
+
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        city: str,
+        state: str,
+        country: str,
+        description: str,
+        skills: Iterable[str],
+        post_date: Optional[date] = None,
+        work_mode: Optional[str] = None,
+    ):
+        self.title = title
+        self.company = _intern(company)
+        # Oracle stores '' as NULL, which would never match in lookups.
+        self.city = _intern(city or "Unknown")
+        self.state = _intern(state or "Unknown")
+        self.country = _intern(country or "USA")
+        self.description = description
+        self.skills: Tuple[str, ...] = tuple(sys.intern(skill) for skill in skills)
+        self.post_date = post_date
+        self.work_mode = work_mode  # "remote", "hybrid", "onsite" or None if the posting doesn't say
+
+    def set_description(self, description: str) -> None:
+        """Attach a description fetched after the card was read, and the skills found in it."""
+        self.description = description
+        self.skills = tuple(sys.intern(skill) for skill in extract_skills(description))
+
+    @property
+    def key(self) -> str:
+        return job_key(self.title, self.company, self.city, self.state, self.country)
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParsedJob":
+        return cls(**data)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParsedJob):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"ParsedJob(title={self.title!r}, company={self.company!r}, city={self.city!r}, state={self.state!r})"
+
+
+def job_key(title: str, company: str, city: str, state: str, country: str) -> str:
+    """Stable identity of a posting across runs; mirrored by the job_key backfill in models.py."""
+    parts = (title, company, city, state, country)
+    return hashlib.sha1("|".join((part or "").lower() for part in parts).encode("utf-8")).hexdigest()
 
 
 def parse_location(location_str: str) -> tuple[str, str, str]:
-    """Parse location string into (city, state, country)."""
-    if not location_str:
-        return "Unknown", "Unknown", "USA"
-    
-    parts = [p.strip() for p in location_str.split(",")]
-    
-    if len(parts) >= 3:
-        return parts[0], parts[1], parts[2]
-    elif len(parts) == 2:
-        return parts[0], parts[1], "USA"
-    else:
-        return parts[0], "Unknown", "USA"
+    """Parse location string into canonical (city, state, country); see normalize_location."""
+    return normalize_location(location_str)[:3]
 
 
 def parse_post_date(date_str: str) -> Optional[date]:
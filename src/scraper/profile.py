@@ -0,0 +1,127 @@
+import json
+from dataclasses import dataclass
+from typing import List
+
+from src.config.settings import scraper_config
+
+# Content settings: 2 = block. Images are also blocked by URL below so they show up in the stats.
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+    "profile.default_content_setting_values.plugins": 2,
+    "profile.password_manager_enabled": False,
+    "credentials_enable_service": False,
+    "translate.enabled": False,
+}
+
+LEAN_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--autoplay-policy=user-gesture-required",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2",
+]
+
+# Network.setBlockedURLs patterns; '*' is the only wildcard.
+RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+]
+
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*adservice.google.com*",
+    "*connect.facebook.net*",
+    "*bat.bing.com*",
+    "*hotjar.com*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*criteo.com*",
+    "*optimizely.com*",
+    "*segment.io*",
+    "*nr-data.net*",
+    "*js-agent.newrelic.com*",
+]
+
+# Rough median transfer size per blocked request, used to estimate bytes saved.
+AVERAGE_BYTES = {
+    "Image": 20_000,
+    "Font": 35_000,
+    "Media": 250_000,
+    "Script": 25_000,
+    "XHR": 2_000,
+    "Fetch": 2_000,
+    "Other": 5_000,
+}
+
+
+@dataclass
+class TrafficStats:
+    pages: int = 0
+    requests: int = 0
+    bytes: int = 0
+    blocked: int = 0
+    saved_bytes: int = 0
+
+    def add(self, other: "TrafficStats") -> None:
+        self.pages += other.pages
+        self.requests += other.requests
+        self.bytes += other.bytes
+        self.blocked += other.blocked
+        self.saved_bytes += other.saved_bytes
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.bytes / 1024:.0f} KB loaded, "
+            f"{self.blocked} blocked (~{self.saved_bytes / 1024:.0f} KB saved)"
+        )
+
+
+def apply_lean_options(options) -> None:
+    """Add the lean preferences and switches to ChromeOptions before launch."""
+    options.add_experimental_option("prefs", LEAN_PREFS)
+    for arg in LEAN_ARGS:
+        options.add_argument(arg)
+    options.add_argument(f"--js-flags=--max-old-space-size={scraper_config.renderer_memory_mb}")
+    # Performance log carries the Network.* events read by collect_traffic.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def block_urls(driver, source_patterns: List[str]) -> None:
+    """Install the URL blocklist on a running driver via CDP."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd(
+        "Network.setBlockedURLs",
+        {"urls": RESOURCE_PATTERNS + TRACKER_PATTERNS + source_patterns},
+    )
+
+
+def collect_traffic(driver) -> TrafficStats:
+    """Drain the performance log and total the traffic since the last call."""
+    stats = TrafficStats(pages=1)
+    types = {}
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            stats.requests += 1
+            types[params.get("requestId")] = params.get("type", "Other")
+        elif method == "Network.loadingFinished":
+            stats.bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            stats.blocked += 1
+            resource_type = params.get("type") or types.get(params.get("requestId"), "Other")
+            stats.saved_bytes += AVERAGE_BYTES.get(resource_type, AVERAGE_BYTES["Other"])
+    return stats
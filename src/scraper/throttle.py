@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+from typing import Dict
+
+from src.config.settings import scraper_config
+
+
+class BlockedError(Exception):
+    """Raised when a source keeps serving block pages after every retry."""
+
+
+class RateLimiter:
+    """Token bucket whose refill rate adapts AIMD-style to how the source responds.
+
+    Fast, clean responses add a fixed amount to the rate; slow responses and
+    block signals cut it multiplicatively.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        burst: float = 2.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        target_latency: float = 5.0,
+    ):
+        self.rate = rate  # tokens per second
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self.requests = 0
+        self.blocks = 0
+        self.waited = 0.0
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Wait for a token. Returns the number of seconds spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the token up front so concurrent callers queue behind us.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.requests += 1
+            self.waited += wait
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self, latency: float) -> None:
+        with self._lock:
+            if latency > self.target_latency:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_block(self) -> None:
+        with self._lock:
+            self.blocks += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.blocks} blocks, "
+            f"{self.waited:.1f}s waited, now {self.rate * 60:.1f}/min"
+        )
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with equal jitter for the given retry attempt (0-based)."""
+    ceiling = min(scraper_config.backoff_cap, scraper_config.backoff_base * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(source: str) -> RateLimiter:
+    """Return the shared limiter for a source, creating it on first use."""
+    with _limiters_lock:
+        if source not in _limiters:
+            _limiters[source] = RateLimiter(
+                rate=scraper_config.requests_per_minute / 60,
+                min_rate=scraper_config.min_requests_per_minute / 60,
+                max_rate=scraper_config.max_requests_per_minute / 60,
+                target_latency=scraper_config.target_latency,
+            )
+        return _limiters[source]
@@ -0,0 +1,321 @@
+"""
+Similar jobs and skill co-occurrence over a sparse job x skill matrix.
+
+The binary matrix B (one row per job with skills, one column per
+skill) is kept in CSR and CSC form. Job similarity is cosine over
+TF-IDF rows; since rows are binary, the score of job i against job j
+is sum(idf[s]^2 for shared skills s) / (norm[i] * norm[j]), so a lookup
+only touches the columns of j's skills. Co-occurrence is C = B.T @ B.
+
+Both are saved to <cache_dir>/similarity.npz together with the
+job_skills, skills and job_rewrites data versions they were built under
+and the database time of that build. update() does nothing while the
+versions match. Saving postings only adds skill links, so after a save
+it reads the pairs of jobs above the highest job_id held plus those of
+jobs whose last_seen moved since the previous update, and replaces the
+rows (and their share of C) of the jobs whose skills differ. Any other
+change advances job_rewrites and it rebuilds from scratch. idf and
+norms are recomputed from the column counts, which is O(nnz) and
+vectorised. The new arrays are built without holding the lookup lock
+and swapped in. rebuild() forces a full build.
+
+The shared engine rewrites the cache file at most every SAVE_INTERVAL
+seconds while it keeps changing, and once more on exit.
+"""
+import atexit
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from src.config.settings import analytics_config
+from src.db.connection import Database
+from src.db.versions import REWRITES
+
+VERSION_TABLES = ("job_skills", "skills", REWRITES)
+
+# As in src.job_index: re-seen jobs are those with last_seen >= previous update - margin.
+RESEEN_MARGIN = timedelta(minutes=10)
+SAVE_INTERVAL = 300.0
+
+NEW_PAIRS = "SELECT job_id, skill_id FROM job_skills WHERE job_id > :after ORDER BY job_id"
+RESEEN_PAIRS = """
+    SELECT js.job_id, js.skill_id
+    FROM job_skills js JOIN jobs j ON j.job_id = js.job_id
+    WHERE j.job_id <= :after AND j.last_seen >= :since
+    ORDER BY js.job_id
+"""
+
+
+def _pairs(cursor) -> np.ndarray:
+    return np.array(cursor.fetchall(), dtype=np.int64).reshape(-1, 2)
+
+
+def _weights(matrix: sparse.csr_matrix) -> Tuple[sparse.csc_matrix, np.ndarray, np.ndarray]:
+    """The CSC copy, idf and inverse row norms of a matrix."""
+    columns = matrix.tocsc()
+    df = np.diff(columns.indptr).astype(np.float64)
+    count = max(matrix.shape[0], 1)
+    idf = (np.log((1 + count) / (1 + df)) + 1).astype(np.float32)
+    norms = np.sqrt(matrix @ (idf ** 2)).astype(np.float32)
+    norms[norms == 0] = 1
+    return columns, idf, 1 / norms
+
+
+class SimilarityEngine:
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or Path(analytics_config.cache_dir) / "similarity.npz")
+        self.job_ids = np.empty(0, dtype=np.int64)
+        self.skill_ids = np.empty(0, dtype=np.int64)  # column -> skill_id
+        self.skill_names: List[str] = []
+        self.matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.cooccurrence = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self.versions: Optional[Tuple[int, ...]] = None  # VERSION_TABLES versions at the last update
+        self.loaded_at = None  # database SYSDATE of the last update
+        self.unsaved = False  # changed since the last save
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()  # guards the arrays; held only to read or swap them
+        self._updating = threading.Lock()
+        self._derive()
+
+    @property
+    def max_job_id(self) -> int:
+        return int(self.job_ids[-1]) if len(self.job_ids) else 0
+
+    # Persistence
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "SimilarityEngine":
+        """Engine from the on-disk cache (empty if there is none), topped up from the database."""
+        engine = cls(path)
+        if engine.path.exists():
+            with np.load(engine.path, allow_pickle=False) as data:
+                engine.job_ids = data["job_ids"]
+                engine.skill_ids = data["skill_ids"]
+                engine.skill_names = data["skill_names"].tolist()
+                shape = (len(engine.job_ids), len(engine.skill_ids))
+                engine.matrix = sparse.csr_matrix(
+                    (np.ones(len(data["indices"]), dtype=np.float32), data["indices"], data["indptr"]), shape=shape
+                )
+                engine.cooccurrence = sparse.csr_matrix(
+                    (data["cooc_data"], data["cooc_indices"], data["cooc_indptr"]), shape=(shape[1], shape[1])
+                )
+                # Files written before loaded_at was stored leave versions unset, so update() rebuilds.
+                if "loaded_at" in data.files:
+                    engine.versions = tuple(data["versions"].tolist())
+                    engine.loaded_at = data["loaded_at"].item()
+            engine._derive()
+        if engine.update():
+            engine.save()
+        return engine
+
+    def save(self) -> None:
+        with self._lock:
+            arrays = dict(
+                job_ids=self.job_ids,
+                skill_ids=self.skill_ids,
+                skill_names=np.array(self.skill_names, dtype=str),
+                indptr=self.matrix.indptr,
+                indices=self.matrix.indices,
+                cooc_data=self.cooccurrence.data,
+                cooc_indices=self.cooccurrence.indices,
+                cooc_indptr=self.cooccurrence.indptr,
+                versions=np.array(self.versions or (), dtype=np.int64),
+            )
+            if self.loaded_at is not None:
+                arrays["loaded_at"] = np.array(self.loaded_at, dtype="datetime64[s]")
+            self.unsaved = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp.npz")
+        np.savez(tmp, **arrays)
+        tmp.replace(self.path)
+        self._saved_at = time.monotonic()
+
+    def save_pending(self, interval: float = 0) -> None:
+        """Save if the engine changed since the last save and that save is at least `interval` seconds old."""
+        if self.unsaved and time.monotonic() - self._saved_at >= interval:
+            self.save()
+
+    # Incremental build
+
+    def update(self, wait: bool = True) -> bool:
+        """Bring the engine up to date with job_skills. Returns whether anything changed (save it then).
+
+        With wait=False an update already running in another thread is not waited for, and False returned.
+        """
+        if not self._updating.acquire(blocking=wait):
+            return False
+        try:
+            return self._load(full=False)
+        finally:
+            self._updating.release()
+
+    def rebuild(self) -> None:
+        """Rebuild from every job_skills row and save, whatever the cache holds."""
+        with self._updating:
+            self._load(full=True)
+        self.save()
+
+    def _load(self, full: bool) -> bool:
+        with Database.get_cursor() as cursor:
+            # Versions and pairs all from one snapshot.
+            cursor.execute("SET TRANSACTION READ ONLY")
+            cursor.execute(
+                "SELECT table_name, version FROM data_versions WHERE table_name IN (:1, :2, :3)", VERSION_TABLES
+            )
+            found = dict(cursor.fetchall())
+            versions = tuple(found.get(table, 0) for table in VERSION_TABLES)
+            if not full and versions == self.versions:
+                return False
+            if self.versions is None or versions[-1] != self.versions[-1]:
+                full = True  # links in the matrix changed other than by a save
+
+            cursor.execute("SELECT SYSDATE FROM dual")
+            (loaded_at,) = cursor.fetchone()
+            cursor.arraysize = 10000
+            after = 0 if full else self.max_job_id
+            cursor.execute(NEW_PAIRS, {"after": after})
+            pairs = _pairs(cursor)
+            if after:
+                cursor.execute(RESEEN_PAIRS, {"after": after, "since": self.loaded_at - RESEEN_MARGIN})
+                pairs = np.concatenate([self._changed(_pairs(cursor)), pairs])
+            names = {}
+            if len(pairs):
+                cursor.execute("SELECT skill_id, skill_name FROM skills")
+                names = dict(cursor.fetchall())
+
+        target = self if after else SimilarityEngine(str(self.path))
+        if len(pairs):
+            target.append(pairs[:, 0], pairs[:, 1], names)
+        with self._lock:
+            if target is not self:
+                for name in ("job_ids", "skill_ids", "skill_names", "matrix", "cooccurrence",
+                             "_columns", "idf", "inverse_norms"):
+                    setattr(self, name, getattr(target, name))
+            self.versions, self.loaded_at = versions, loaded_at
+            self.unsaved = True
+        return True
+
+    def _changed(self, pairs: np.ndarray) -> np.ndarray:
+        """The pairs, sorted by job_id, of the jobs whose skills are not those of their row (if any)."""
+        if not len(pairs):
+            return pairs
+        job_ids, starts = np.unique(pairs[:, 0], return_index=True)
+        changed = []
+        for job_id, skills in zip(job_ids, np.split(pairs[:, 1], starts[1:])):
+            row = np.searchsorted(self.job_ids, job_id)
+            if row < len(self.job_ids) and self.job_ids[row] == job_id:
+                held = self.skill_ids[self.matrix.indices[self.matrix.indptr[row]:self.matrix.indptr[row + 1]]]
+                if set(held.tolist()) == set(skills.tolist()):
+                    continue
+            changed.append(job_id)
+        return pairs[np.isin(pairs[:, 0], changed)]
+
+    def append(self, job_ids: np.ndarray, skill_ids: np.ndarray, names: Dict[int, str]) -> int:
+        """Add (job_id, skill_id) pairs sorted by job_id; jobs already held get their row replaced."""
+        new_skills = sorted(set(np.unique(skill_ids).tolist()) - set(self.skill_ids.tolist()))
+        all_skill_ids = np.concatenate([self.skill_ids, np.array(new_skills, dtype=np.int64)])
+        skill_names = self.skill_names + [names.get(skill_id, str(skill_id)) for skill_id in new_skills]
+        width = len(all_skill_ids)
+
+        order = np.argsort(all_skill_ids)
+        columns = order[np.searchsorted(all_skill_ids, skill_ids, sorter=order)]
+        rows_ids, rows = np.unique(job_ids, return_inverse=True)
+        block = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, columns)), shape=(len(rows_ids), width)
+        )
+        block.data[:] = 1  # duplicate pairs would otherwise sum
+
+        # Built from a widened view and a copy, so lookups can keep using the current arrays.
+        matrix = sparse.csr_matrix(
+            (self.matrix.data, self.matrix.indices, self.matrix.indptr), shape=(self.matrix.shape[0], width)
+        )
+        cooccurrence = self.cooccurrence.copy()
+        cooccurrence.resize((width, width))
+        cooccurrence = cooccurrence + (block.T @ block).astype(np.int64)
+        all_job_ids = self.job_ids
+        held = np.isin(all_job_ids, rows_ids)
+        if held.any():
+            old = matrix[held]
+            cooccurrence = cooccurrence - (old.T @ old).astype(np.int64)
+            matrix, all_job_ids = matrix[~held], all_job_ids[~held]
+        matrix = sparse.vstack([matrix, block], format="csr")
+        all_job_ids = np.concatenate([all_job_ids, rows_ids])
+        if (np.diff(all_job_ids) < 0).any():
+            order = np.argsort(all_job_ids, kind="stable")
+            matrix, all_job_ids = matrix[order], all_job_ids[order]
+        cooccurrence = cooccurrence.tocsr()
+        cooccurrence.eliminate_zeros()
+        weights = _weights(matrix)
+
+        with self._lock:
+            self.skill_ids, self.skill_names = all_skill_ids, skill_names
+            self.job_ids, self.matrix, self.cooccurrence = all_job_ids, matrix, cooccurrence
+            self._columns, self.idf, self.inverse_norms = weights
+        return len(rows_ids)
+
+    def _derive(self) -> None:
+        """Recompute the CSC copy, idf and inverse row norms after the matrix changed."""
+        self._columns, self.idf, self.inverse_norms = _weights(self.matrix)
+
+    # Lookups
+
+    def similar_jobs(self, job_id: int, limit: int = 10) -> List[Tuple[int, float]]:
+        """(job_id, cosine score) of the jobs whose skills best match job_id's."""
+        with self._lock:
+            row = np.searchsorted(self.job_ids, job_id)
+            if row >= len(self.job_ids) or self.job_ids[row] != job_id:
+                return []
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            skills = self.matrix.indices[start:end]
+            if not len(skills):
+                return []
+            weights = self.idf[skills] ** 2
+            scores = self._columns[:, skills] @ weights
+            scores *= self.inverse_norms * self.inverse_norms[row]
+            scores[row] = 0
+            limit = min(limit, len(scores) - 1)
+            if limit <= 0:
+                return []
+            top = np.argpartition(scores, len(scores) - limit)[-limit:]
+            top = top[np.argsort(-scores[top])]
+            return [(int(self.job_ids[i]), float(scores[i])) for i in top if scores[i] > 0]
+
+    def co_skills(self, skill_name: str, limit: int = 10) -> List[Tuple[str, int, float]]:
+        """(skill, jobs with both, share of skill_name's jobs that also list it), most frequent first."""
+        with self._lock:
+            lowered = [name.lower() for name in self.skill_names]
+            if skill_name.lower() not in lowered:
+                return []
+            column = lowered.index(skill_name.lower())
+            row = self.cooccurrence.getrow(column).toarray().ravel()
+            total = row[column]
+            row[column] = 0
+            top = np.argsort(-row)[:limit]
+            return [(self.skill_names[i], int(row[i]), float(row[i] / total)) for i in top if row[i] > 0]
+
+
+_shared: Optional[SimilarityEngine] = None
+_shared_lock = threading.Lock()
+
+
+def shared_engine() -> SimilarityEngine:
+    """Process-wide engine, loaded from disk on first use and brought up to date on every call.
+
+    Only the first load makes other callers wait; while an update runs they
+    get the engine as it stands.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            engine = SimilarityEngine.load()
+            atexit.register(engine.save_pending)
+            _shared = engine
+            return _shared
+    if _shared.update(wait=False):
+        _shared.save_pending(SAVE_INTERVAL)
+    return _shared
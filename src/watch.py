@@ -0,0 +1,169 @@
+"""
+Watch mode: poll every query of a plan for postings newer than the last poll.
+
+Each poll asks the source for results sorted by date from the past 24
+hours and pages only until a run of WATCH_KNOWN_STREAK postings already
+in the database (BaseScraper.scrape_new), so a poll costs about one
+results page plus the new postings rather than a walk over the whole
+result set, and a pinned posting that was saved long ago does not end it.
+
+Each query gets its own interval, learned from how fast new postings
+appear: the smoothed rate of new postings per second is turned into the
+interval that should find about WATCH_TARGET_NEW of them per poll,
+between WATCH_MIN_INTERVAL and WATCH_MAX_INTERVAL. A busy query is
+polled every few minutes, a quiet one a few times a day. A poll that
+runs out of pages before it reaches known postings may have missed
+some, so its query drops back to the minimum interval.
+
+Intervals are kept in <CHECKPOINT_DIR>/watch-<plan>.json, so a restarted
+watcher carries on where it left off instead of relearning them.
+"""
+import json
+import math
+import os
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.config.settings import scraper_config
+from src.db.repository import JobRepository
+from src.pipeline import save_jobs, scraper_class
+from src.plan import PlanQuery, load_plan
+from src.scraper.filters import CardFilter, load_filters
+
+# Weight of the latest poll in the smoothed rate of new postings.
+SMOOTHING = 0.3
+# Interval growth after a poll that found nothing, before any posting was ever found.
+IDLE_GROWTH = 2.0
+# Browsers are closed while the next poll is further away than this (seconds).
+IDLE_CLOSE = 60.0
+
+
+@dataclass
+class WatchState:
+    """Schedule of one query; times are wall-clock seconds so they survive restarts."""
+
+    interval: float
+    due: float = 0.0
+    last_poll: Optional[float] = None
+    rate: Optional[float] = None  # new postings per second, smoothed
+    polls: int = 0
+    found: int = 0
+
+    def record(self, new: int, caught_up: bool, now: float) -> None:
+        """Update the rate and interval after a poll that found `new` postings."""
+        low, high = scraper_config.watch_min_interval, scraper_config.watch_max_interval
+        if self.last_poll is not None:
+            # The first poll finds the whole 24-hour backlog, which says nothing about the rate.
+            sample = new / max(now - self.last_poll, 1.0)
+            self.rate = sample if self.rate is None else SMOOTHING * sample + (1 - SMOOTHING) * self.rate
+        if not caught_up:
+            self.interval = low
+        elif self.rate:
+            self.interval = scraper_config.watch_target_new / self.rate
+        elif self.last_poll is not None:
+            self.interval *= IDLE_GROWTH
+        self.interval = min(max(self.interval, low), high)
+        self.last_poll = now
+        self.due = now + self.interval
+        self.polls += 1
+        self.found += new
+
+
+def state_path(plan_path: str) -> Path:
+    return Path(scraper_config.checkpoint_dir) / f"watch-{Path(plan_path).stem}.json"
+
+
+def load_states(path: Path, queries: List[PlanQuery]) -> Dict[tuple, WatchState]:
+    """Saved schedules for the plan's queries; new queries start due now at the minimum interval."""
+    saved = {}
+    if path.exists():
+        for entry in json.loads(path.read_text()):
+            key = tuple(entry.pop("key"))
+            saved[key] = WatchState(**entry)
+    return {
+        query.key: saved.get(query.key) or WatchState(interval=scraper_config.watch_min_interval)
+        for query in queries
+    }
+
+
+def save_states(path: Path, states: Dict[tuple, WatchState]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps([{"key": list(key), **asdict(state)} for key, state in states.items()], indent=1))
+    os.replace(tmp, path)
+
+
+def _describe(seconds: float) -> str:
+    return f"{seconds / 3600:.1f}h" if seconds >= 3600 else f"{seconds / 60:.0f}m"
+
+
+def run_watch(
+    path: str,
+    max_polls: Optional[int] = None,
+    scraper_factory: Callable[[str], type] = scraper_class,
+    known_keys: Callable[[List[str]], set] = JobRepository.existing_keys,
+    touch_keys: Callable[[List[str]], int] = JobRepository.touch,
+) -> int:
+    """Poll the plan's queries until interrupted or after max_polls polls. Returns postings saved.
+
+    A query's max_jobs caps the pages one poll may read. Postings a poll
+    passes over as already saved get last_seen refreshed in one batched
+    UPDATE, so close-stale does not close postings the watcher keeps
+    seeing. One scraper per source is kept for the watcher's lifetime;
+    its browser is closed while the next poll is more than IDLE_CLOSE
+    seconds away.
+    """
+    queries = load_plan(path)
+    filters = load_filters(path)
+    states_file = state_path(path)
+    states = load_states(states_file, queries)
+    print(f"Watching {len(queries)} queries from {path}")
+
+    polls = total = 0
+    with ExitStack() as stack:
+        scrapers = {}
+        try:
+            while max_polls is None or polls < max_polls:
+                query = min(queries, key=lambda q: states[q.key].due)
+                state = states[query.key]
+                wait = state.due - time.time()
+                if wait > 0:
+                    if wait > IDLE_CLOSE:
+                        for scraper in scrapers.values():
+                            scraper._close_driver()
+                    time.sleep(wait)
+
+                scraper = scrapers.get(query.source)
+                if scraper is None:
+                    scraper = scrapers[query.source] = stack.enter_context(scraper_factory(query.source)())
+                    scraper.card_filter = CardFilter.from_dict(filters)
+
+                label = f"{query.source} '{query.keywords}' in {query.location}"
+                max_pages = max(1, math.ceil(query.max_jobs / scraper.page_size))
+                try:
+                    jobs = list(scraper.scrape_new(query.keywords, query.location, known_keys, max_pages))
+                    saved = save_jobs(jobs) if jobs else 0
+                    touch_keys(scraper.known_seen)
+                except Exception as e:
+                    # A fresh browser next time; retry this query after its usual interval.
+                    scraper._close_driver()
+                    state.due = time.time() + state.interval
+                    print(f"{label}: failed, retrying in {_describe(state.interval)}: {e}")
+                else:
+                    state.record(len(jobs), scraper.caught_up, time.time())
+                    total += saved
+                    note = "" if scraper.caught_up else f", no run of known postings within {max_pages} pages"
+                    print(f"{label}: {len(jobs)} new, saved {saved}{note}; next poll in {_describe(state.interval)}")
+                save_states(states_file, states)
+                polls += 1
+        except KeyboardInterrupt:
+            print("Stopping")
+
+        for source, scraper in scrapers.items():
+            for line in scraper.summary():
+                print(f"  {source} {line}")
+    print(f"Watch finished after {polls} polls, saved {total} postings")
+    return total
@@ -0,0 +1,70 @@
+"""
+Queue worker: claims scrape tasks, scrapes one results page each and saves its jobs.
+
+Run as many as you like, on one machine or several, against the same
+database; see src.db.task_queue for how tasks are shared out.
+"""
+import time
+from contextlib import ExitStack
+from typing import Callable, Optional
+
+from src.db.task_queue import TaskQueue
+from src.pipeline import save_jobs, scraper_class
+from src.scraper.filters import CardFilter
+
+
+def run_worker(
+    max_tasks: Optional[int] = None,
+    idle_exit: Optional[float] = None,
+    poll_interval: float = 5.0,
+    scraper_factory: Callable[[str], type] = scraper_class,
+    queue: Optional[TaskQueue] = None,
+    filters: Optional[dict] = None,
+) -> int:
+    """Process tasks until max_tasks are done or the queue stayed empty for idle_exit seconds.
+
+    One scraper (and browser) per source is kept open for the worker's
+    lifetime. `filters` is a plan file's filters section, applied to
+    every page. Returns the number of tasks processed.
+    """
+    queue = queue or TaskQueue()
+    print(f"Worker {queue.worker} started")
+    processed = 0
+    idle_since = time.monotonic()
+
+    with ExitStack() as stack:
+        scrapers = {}
+        while max_tasks is None or processed < max_tasks:
+            task = queue.claim()
+            if task is None:
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            scraper = scrapers.get(task.source)
+            if scraper is None:
+                scraper = scrapers[task.source] = stack.enter_context(scraper_factory(task.source)())
+                scraper.card_filter = CardFilter.from_dict(filters)
+
+            print(f"Task {task.task_id}: {task.source} '{task.keywords}' in {task.location}, page {task.page}")
+            with queue.heartbeat(task):
+                try:
+                    jobs, more = scraper.scrape_page(task.keywords, task.location, task.page)
+                    saved = save_jobs(jobs)
+                except Exception as e:
+                    # A fresh browser for the next task; this one may be stuck or flagged.
+                    scraper._close_driver()
+                    retry = queue.fail(task, e)
+                    print(f"  Failed ({'will retry' if retry else 'giving up'}): {e}")
+                else:
+                    queue.complete(task, saved, more)
+                    print(f"  Saved {saved} jobs")
+            processed += 1
+            idle_since = time.monotonic()
+
+        for source, scraper in scrapers.items():
+            for line in scraper.summary():
+                print(f"  {source} {line}")
+    print(f"Worker {queue.worker} finished {processed} tasks")
+    return processed
@@ -0,0 +1,33 @@
+"""Stand-ins shared by the tests: data versions without a database, and index builders."""
+from typing import Dict
+
+from src.db.versions import VersionStamp
+from src.job_index import JobIndex
+
+
+class FakeStamp(VersionStamp):
+    """Versions held in a dict instead of read from data_versions."""
+
+    def __init__(self):
+        super().__init__(ttl=0)
+        self.versions: Dict[str, int] = {}
+
+    def current(self) -> Dict[str, int]:
+        return dict(self.versions)
+
+    def bump(self, table: str) -> None:
+        self.versions[table] = self.versions.get(table, 0) + 1
+
+
+def build(jobs):
+    """Index over (job_id, company_id, state, posted, open, skills) tuples."""
+    index = JobIndex()
+    index.append(
+        [job[0] for job in jobs],
+        [job[1] for job in jobs],
+        [job[2] for job in jobs],
+        [job[3] for job in jobs],
+        [job[4] for job in jobs],
+        [(job[0], skill) for job in jobs for skill in job[5]],
+    )
+    return index
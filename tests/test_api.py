@@ -0,0 +1,127 @@
+import gzip
+import http.client
+import json
+import threading
+from datetime import date
+
+import pytest
+
+from src.api import ApiError, ApiServer, JobApi
+from tests.fakes import FakeStamp, build
+
+JOBS = [(job_id, 1, "CA", date(2026, 1, job_id), True, ["Python"] if job_id % 2 else ["Java"])
+        for job_id in range(1, 8)]
+
+
+class FakeApi(JobApi):
+    """JobApi over an in-memory index; job rows are just their ids."""
+
+    def __init__(self, stamp):
+        super().__init__(stamp=stamp)
+        self.fake_index = build(JOBS)
+        self.deleted = set()
+        self.fetched = []
+
+    def index(self):
+        return self.fake_index
+
+    def _jobs_by_id(self, job_ids):
+        self.fetched.append(job_ids)
+        return [{"job_id": job_id} for job_id in job_ids if job_id not in self.deleted]
+
+
+@pytest.fixture
+def api():
+    return FakeApi(FakeStamp())
+
+
+def page(api, **query):
+    body = json.loads("".join(api.jobs({name: [str(value)] for name, value in query.items()})))
+    return [item["job_id"] for item in body["items"]], body["next"], body["matches"]
+
+
+def test_keyset_pages_run_newest_first_without_overlap(api):
+    assert page(api, limit=3) == ([7, 6, 5], 5, 7)
+    assert page(api, limit=3, after=5) == ([4, 3, 2], 2, 7)
+    assert page(api, limit=3, after=2) == ([1], None, 7)
+
+
+def test_paging_applies_filters(api):
+    assert page(api, limit=2, skill="python") == ([7, 5], 5, 4)
+    assert page(api, limit=2, skill="python", after=5) == ([3, 1], None, 4)
+
+
+def test_last_full_page_has_no_next_cursor(api):
+    assert page(api, limit=7) == ([7, 6, 5, 4, 3, 2, 1], None, 7)
+
+
+def test_rows_deleted_since_the_index_refresh_are_skipped_and_the_page_filled(api):
+    api.deleted = {6, 5}
+    assert page(api, limit=3) == ([7, 4, 3], 3, 7)
+    assert api.fetched == [[7, 6, 5], [4, 3]]
+
+
+@pytest.mark.parametrize("query", [{"limit": ["-1"]}, {"limit": ["501"]}, {"after": ["x"]}, {"company": ["acme"]}])
+def test_bad_parameters_are_400(api, query):
+    with pytest.raises(ApiError) as error:
+        api.jobs(query)
+    assert error.value.status == 400
+
+
+@pytest.fixture
+def server(api):
+    server = ApiServer(("127.0.0.1", 0), api=api)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_conditional_get_is_answered_from_the_data_versions(server, api):
+    response, body = get(server, "/jobs?limit=2")
+    etag = response.getheader("ETag")
+    assert response.status == 200 and etag.startswith('W/"')
+    assert json.loads(body)["items"] == [{"job_id": 7}, {"job_id": 6}]
+    calls = len(api.fetched)
+
+    response, body = get(server, "/jobs?limit=2", {"If-None-Match": etag})
+    assert response.status == 304 and body == b""
+    assert len(api.fetched) == calls  # the endpoint never ran
+
+    response, _ = get(server, "/jobs?limit=3", {"If-None-Match": etag})
+    assert response.status == 200
+
+    api.stamp.bump("skills")
+    response, _ = get(server, "/jobs?limit=2", {"If-None-Match": etag})
+    assert response.status == 200
+    assert response.getheader("ETag") != etag
+
+
+def test_etag_ignores_tables_the_route_does_not_read(server, api):
+    response, _ = get(server, "/jobs")
+    etag = response.getheader("ETag")
+    api.stamp.bump("descriptions")  # read by /jobs/<id> only
+    response, _ = get(server, "/jobs", {"If-None-Match": etag})
+    assert response.status == 304
+
+
+def test_responses_are_gzipped_on_request(server):
+    response, body = get(server, "/jobs?limit=1", {"Accept-Encoding": "gzip"})
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert json.loads(gzip.decompress(body))["items"] == [{"job_id": 7}]
+
+
+def test_unknown_endpoint_is_404(server):
+    response, body = get(server, "/nope")
+    assert response.status == 404
+    assert "no such endpoint" in json.loads(body)["error"]
@@ -0,0 +1,66 @@
+from src.checkpoint import CheckpointStore
+from src.scraper.parser import ParsedJob
+
+
+def job(title: str) -> ParsedJob:
+    return ParsedJob(title, "Acme", "Austin", "TX", "USA", "desc", ["Python"])
+
+
+def test_resume_replays_cards_pages_and_pending_jobs(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with CheckpointStore(str(path)) as store:
+        progress = store.query("linkedin", "Software  Engineer", "Austin")
+        progress.record_card(0, 0, job("a"))
+        progress.record_card(0, 1, job("b"))
+        progress.mark_saved((0, 0))
+        progress.finish_page(0)
+        progress.record_card(1, 0, None)
+        progress.record_card(1, 1, job("c"))
+        store.query("indeed", "python", "Remote").finish()
+
+    with CheckpointStore(str(path), resume=True) as store:
+        # Queries are identified by their normalised keywords and location.
+        progress = store.query("linkedin", "software engineer", "austin")
+        assert progress.page_done(0) and not progress.page_done(1)
+        assert progress.cards_done(0) == 2
+        assert progress.cards_done(1) == 2
+        assert [(position, pending.title) for position, pending in progress.pending_jobs()] == [
+            ((0, 1), "b"), ((1, 1), "c"),
+        ]
+        assert progress.pending_jobs()[0][1] == job("b")
+        assert not progress.done
+        assert store.query("indeed", "python", "remote").done
+
+
+def test_resume_survives_compaction(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with CheckpointStore(str(path)) as store:
+        progress = store.query("linkedin", "python", "Austin")
+        for card in range(5):
+            progress.record_card(0, card, job(str(card)))
+            progress.mark_saved((0, card))
+    CheckpointStore(str(path), resume=True).close()  # rewrites the log in compact form
+
+    with CheckpointStore(str(path), resume=True) as store:
+        progress = store.query("linkedin", "python", "Austin")
+        assert progress.cards_done(0) == 5
+        assert progress.pending_jobs() == []
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with CheckpointStore(str(path)) as store:
+        store.query("linkedin", "python", "Austin").record_card(0, 0, None)
+    with open(path, "a") as f:
+        f.write('{"e": "card", "page": 0, "ca')
+
+    with CheckpointStore(str(path), resume=True) as store:
+        assert store.query("linkedin", "python", "Austin").cards_done(0) == 1
+
+
+def test_without_resume_the_log_starts_empty(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with CheckpointStore(str(path)) as store:
+        store.query("linkedin", "python", "Austin").finish()
+    with CheckpointStore(str(path)) as store:
+        assert not store.query("linkedin", "python", "Austin").done
@@ -0,0 +1,69 @@
+import pytest
+
+from src.scraper.filters import CardFilter
+from src.scraper.parser import ParsedJob
+
+
+def card(title="Backend Engineer", company="Acme", city="Austin", state="TX", work_mode=None) -> ParsedJob:
+    return ParsedJob(title, company, city, state, "USA", "", [], work_mode=work_mode)
+
+
+def test_no_rules_keeps_every_complete_card():
+    assert CardFilter().reject(card()) is None
+    assert CardFilter().reject(card(title="")) == "missing title or company"
+    assert CardFilter().reject(card(company="")) == "missing title or company"
+
+
+def test_title_rules_are_case_insensitive_regexes():
+    rules = CardFilter(title_include=["engineer", "developer"], title_exclude=[r"\bintern\b"])
+    assert rules.reject(card(title="Senior ENGINEER")) is None
+    assert rules.reject(card(title="Sales Manager")) == "title"
+    assert rules.reject(card(title="Software Engineer Intern")) == "title"
+    assert rules.reject(card(title="Internal Tools Developer")) is None
+
+
+def test_company_blocklist_matches_whole_names_ignoring_case_and_spacing():
+    rules = CardFilter(company_blocklist="Acme  Staffing")
+    assert rules.reject(card(company="acme staffing")) == "company"
+    assert rules.reject(card(company="Acme Staffing Group")) is None
+
+
+def test_locations_match_place_and_work_mode():
+    rules = CardFilter(locations=["remote", ", NY,"])
+    assert rules.reject(card(city="New York", state="NY")) is None
+    assert rules.reject(card(work_mode="remote")) is None
+    assert rules.reject(card()) == "location"
+
+
+def test_from_dict_rejects_unknown_keys():
+    assert CardFilter.from_dict(None).reject(card()) is None
+    assert CardFilter.from_dict({"skip_seen": True}).skip_seen
+    with pytest.raises(ValueError, match="title_includes"):
+        CardFilter.from_dict({"title_includes": ["engineer"]})
+
+
+def test_prime_looks_up_a_page_of_keys_once():
+    saved, lookups = card(title="Saved"), []
+
+    def known_keys(keys):
+        lookups.append(keys)
+        return {saved.key}
+
+    rules = CardFilter(skip_seen=True, known_keys=known_keys)
+    rules.prime([saved, None, card()])
+    assert lookups == [[saved.key, card().key]]
+    assert rules.seen(saved)
+    assert not rules.seen(card())
+
+
+def test_prime_without_skip_seen_does_no_lookup():
+    rules = CardFilter(known_keys=lambda keys: pytest.fail("looked up keys"))
+    rules.prime([card()])
+    assert not rules.seen(card())
+
+
+def test_summary_counts_fetches_and_skips():
+    rules = CardFilter()
+    for reason in [None, "title", "title", "company", None]:
+        rules.count(reason)
+    assert rules.summary() == "2 detail fetches, 3 skipped (title 2, company 1)"
@@ -0,0 +1,154 @@
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src import job_index
+from src.db.versions import REWRITES
+from src.job_index import JobIndex
+from tests.fakes import build
+
+
+JOBS = [
+    (1, 10, "CA", date(2026, 1, 1), True, ["Python", "AWS"]),
+    (2, 10, "NY", date(2026, 1, 5), True, ["Python", "Java"]),
+    (3, 20, "ca", date(2026, 2, 1), False, ["Go"]),
+    (4, 30, None, date(2026, 2, 3), True, ["python"]),
+]
+
+
+def test_query_combines_skill_state_company_date_and_status_filters():
+    index = build(JOBS)
+    assert index.query(all_skills=["python"]).tolist() == [1, 2, 4]
+    assert index.query(all_skills=["Python", "aws"]).tolist() == [1]
+    assert index.query(any_skills=["AWS", "go"]).tolist() == [1, 3]
+    assert index.query(all_skills=["python"], not_skills=["java"]).tolist() == [1, 4]
+    assert index.query(states=["CA"]).tolist() == [1, 3]
+    assert index.query(company_ids=[10, 30]).tolist() == [1, 2, 4]
+    assert index.query(posted_since=date(2026, 1, 5), posted_before=date(2026, 2, 3)).tolist() == [2, 3]
+    assert index.query(active_only=True).tolist() == [1, 2, 4]
+    assert index.query().tolist() == [1, 2, 3, 4]
+
+
+def test_unknown_skills_and_states_match_nothing():
+    index = build(JOBS)
+    assert index.query(all_skills=["cobol"]).tolist() == []
+    assert index.query(states=["TX"]).tolist() == []
+    assert index.query(not_skills=["cobol"]).tolist() == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("split", [1, 3, 8, 9])
+def test_appending_in_batches_matches_one_build(split):
+    jobs = [(i, i % 3, "CA" if i % 2 else "NY", date(2026, 1, 1), True, ["Python"] if i % 3 else ["Rust"])
+            for i in range(1, 20)]
+    whole, parts = build(jobs), build(jobs[:split])
+    rest = build(jobs[split:])
+    parts.append(rest.job_ids, rest.company_ids, ["CA" if i % 2 else "NY" for i in rest.job_ids],
+                 [date(2026, 1, 1)] * len(rest), rest.open,
+                 [(i, "Python" if i % 3 else "Rust") for i in rest.job_ids.tolist()])
+    for skill in ["python", "rust"]:
+        assert parts.query(all_skills=[skill]).tolist() == whole.query(all_skills=[skill]).tolist()
+    assert parts.query(states=["NY"]).tolist() == whole.query(states=["NY"]).tolist()
+
+
+def test_skill_counts():
+    index = build(JOBS)
+    counts = index.skill_counts()
+    assert counts[0] == ("python", 3)
+    assert dict(counts) == {"python": 3, "aws": 1, "java": 1, "go": 1}
+    assert dict(index.skill_counts(index.query(states=["CA"]))) == {"python": 1, "aws": 1, "go": 1}
+
+
+class FakeJobs:
+    """Just enough of jobs, job_skills and data_versions to answer the index's queries."""
+
+    def __init__(self):
+        self.now = datetime(2026, 3, 1)
+        self.jobs = {}  # job_id -> [company_id, state, posted, status, last_seen]
+        self.skills = set()
+        self.versions = {"jobs": 0, "job_skills": 0, REWRITES: 0}
+        self.statements = []
+
+    def save(self, job_id, skills=(), state="CA"):
+        row = self.jobs.setdefault(job_id, [1, state, date(2026, 3, 1), "OPEN", self.now])
+        row[3], row[4] = "OPEN", self.now
+        self.skills.update((job_id, skill) for skill in skills)
+        self.versions["jobs"] += 1
+        self.versions["job_skills"] += 1
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def execute(self, sql, binds=None):
+        self.statements.append(sql)
+        if sql.startswith("SET TRANSACTION"):
+            return
+        if "data_versions" in sql:
+            self.rows = list(self.versions.items())
+        elif "SYSDATE" in sql:
+            self.rows = [(self.now,)]
+        else:
+            since = binds.get("since")
+            wanted = {
+                job_id for job_id, row in self.jobs.items()
+                if (job_id <= binds["after"] and row[4] >= since if since else job_id > binds["after"])
+            }
+            if "skill_name" in sql:
+                self.rows = sorted(pair for pair in self.skills if pair[0] in wanted)
+            else:
+                self.rows = [(job_id, *self.jobs[job_id][:4]) for job_id in sorted(wanted)]
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeJobs()
+    monkeypatch.setattr(job_index.Database, "get_cursor", fake.cursor)
+    return fake
+
+
+def test_refresh_appends_new_and_applies_reseen_jobs(db):
+    for job_id in range(1, 6):
+        db.save(job_id, ["Python"])
+    index = JobIndex()
+    assert index.refresh() == 5
+    assert index.refresh() == 0
+
+    db.now += timedelta(hours=1)
+    db.jobs[2][3] = "CLOSED"
+    db.versions[REWRITES] += 1  # as close_stale does
+    assert index.refresh() == 5
+    assert index.query(active_only=True).tolist() == [1, 3, 4, 5]
+
+    db.now += timedelta(hours=1)
+    db.save(2, ["Rust"])  # seen again: reopened, with a new skill
+    db.save(9, ["Rust"])
+    assert index.refresh() == 1
+    assert index.query(all_skills=["rust"]).tolist() == [2, 9]
+    assert index.query(all_skills=["python", "rust"], active_only=True).tolist() == [2]
+
+
+def test_refresh_rebuilds_when_a_lower_id_commits_late(db):
+    db.save(1)
+    db.save(5)
+    index = JobIndex()
+    index.refresh()
+    db.now += timedelta(hours=1)
+    db.save(3, ["Go"])
+    assert index.refresh() == 3
+    assert index.query(all_skills=["go"]).tolist() == [3]
+
+
+def test_unchanged_versions_cost_one_read(db):
+    db.save(1)
+    index = JobIndex()
+    index.refresh()
+    db.statements.clear()
+    index.refresh()
+    assert len(db.statements) == 2  # SET TRANSACTION and the data_versions read
@@ -0,0 +1,30 @@
+import pytest
+
+from src.scraper.locations import Place, normalize_location, normalize_state
+
+
+@pytest.mark.parametrize("raw, place", [
+    ("New York, NY (Hybrid)", Place("New York", "NY", "USA", "hybrid")),
+    ("Remote in New York, NY 10001", Place("New York", "NY", "USA", "remote")),
+    ("New York City Metropolitan Area", Place("New York", "NY", "USA")),
+    ("New York, New York, United States", Place("New York", "NY", "USA")),
+    ("NYC", Place("New York", "NY", "USA")),
+    ("Greater Denver Area", Place("Denver", "CO", "USA")),
+    ("saint louis, MO", Place("St. Louis", "MO", "USA")),
+    ("California", Place("Unknown", "CA", "USA")),
+    ("Toronto, ON, Canada", Place("Toronto", "ON", "Canada")),
+    ("", Place("Unknown", "Unknown", "USA")),
+    (None, Place("Unknown", "Unknown", "USA")),
+])
+def test_normalize_location(raw, place):
+    assert normalize_location(raw) == place
+
+
+def test_unknown_places_keep_the_comma_split():
+    assert normalize_location("Smallville, Kansas") == Place("Smallville", "KS", "USA")
+    assert normalize_location("Atlantis, Ocean") == Place("Atlantis", "Ocean", "USA")
+
+
+@pytest.mark.parametrize("raw, state", [("California", "CA"), ("ca", "CA"), (" new york ", "NY"), ("Bavaria", "BAVARIA")])
+def test_normalize_state(raw, state):
+    assert normalize_state(raw) == state
@@ -0,0 +1,80 @@
+import pytest
+
+from src.query_cache import QueryCache
+from tests.fakes import FakeStamp
+
+
+@pytest.fixture
+def stamp():
+    return FakeStamp()
+
+
+def counting(result):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return result
+
+    return compute, calls
+
+
+def test_hit_until_a_read_table_changes(stamp):
+    cache = QueryCache(max_entries=10, max_mb=1, stamp=stamp)
+    compute, calls = counting(["row"])
+    assert cache.get("jobs", (1,), ["jobs", "companies"], compute) == ["row"]
+    assert cache.get("jobs", (1,), ["jobs", "companies"], compute) == ["row"]
+    assert len(calls) == 1
+
+    stamp.bump("companies")
+    cache.get("jobs", (1,), ["jobs", "companies"], compute)
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_writes_to_other_tables_keep_the_entry(stamp):
+    cache = QueryCache(max_entries=10, max_mb=1, stamp=stamp)
+    compute, calls = counting(1)
+    cache.get("skills", (), ["skills"], compute)
+    stamp.bump("jobs")
+    cache.get("skills", (), ["skills"], compute)
+    assert len(calls) == 1
+
+
+def test_parameters_are_part_of_the_key(stamp):
+    cache = QueryCache(max_entries=10, max_mb=1, stamp=stamp)
+    assert cache.get("jobs", (1,), ["jobs"], lambda: "one") == "one"
+    assert cache.get("jobs", (2,), ["jobs"], lambda: "two") == "two"
+    assert cache.get("jobs", (1,), ["jobs"], lambda: "recomputed") == "one"
+
+
+def test_unversioned_tables_are_refused(stamp):
+    cache = QueryCache(max_entries=10, max_mb=1, stamp=stamp)
+    with pytest.raises(ValueError, match="scrape_tasks"):
+        cache.get("tasks", (), ["jobs", "scrape_tasks"], lambda: [])
+    with pytest.raises(ValueError, match="job_rewrites"):
+        cache.get("rewrites", (), ["job_rewrites"], lambda: [])
+
+
+def test_least_recently_used_entries_are_evicted(stamp):
+    cache = QueryCache(max_entries=2, max_mb=1, stamp=stamp)
+    cache.get("a", (), ["jobs"], lambda: "a")
+    cache.get("b", (), ["jobs"], lambda: "b")
+    cache.get("a", (), ["jobs"], lambda: "a2")
+    cache.get("c", (), ["jobs"], lambda: "c")
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("a", (), ["jobs"], lambda: "a3") == "a"
+    assert cache.get("b", (), ["jobs"], lambda: "b2") == "b2"
+
+
+def test_persisted_entries_stay_tagged_with_their_versions(stamp, tmp_path):
+    path = str(tmp_path / "cache.pickle")
+    cache = QueryCache(max_entries=10, max_mb=1, path=path, stamp=stamp)
+    cache.get("jobs", (), ["jobs"], lambda: "saved")
+    cache.get("skills", (), ["skills"], lambda: "saved")
+    cache.save()
+
+    stamp.bump("jobs")
+    reloaded = QueryCache(max_entries=10, max_mb=1, path=path, stamp=stamp)
+    assert reloaded.get("jobs", (), ["jobs"], lambda: "fresh") == "fresh"
+    assert reloaded.get("skills", (), ["skills"], lambda: "fresh") == "saved"
@@ -0,0 +1,80 @@
+import pytest
+
+from src.scraper import throttle
+from src.scraper.throttle import RateLimiter, backoff_delay
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances monotonic()."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(throttle, "time", fake)
+    return fake
+
+
+def test_burst_is_free_then_requests_are_spaced(clock):
+    limiter = RateLimiter(rate=2.0, min_rate=0.5, max_rate=4.0, burst=2.0)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert clock.slept == [pytest.approx(0.5)]
+    assert limiter.requests == 3
+    assert limiter.waited == pytest.approx(0.5)
+
+
+def test_tokens_refill_with_time_up_to_burst(clock):
+    limiter = RateLimiter(rate=1.0, min_rate=0.5, max_rate=4.0, burst=2.0)
+    limiter.acquire()
+    limiter.acquire()
+    clock.now += 60
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(1.0)
+
+
+def test_fast_responses_raise_the_rate_additively_up_to_max(clock):
+    limiter = RateLimiter(rate=1.0, min_rate=0.5, max_rate=1.1, increase=0.05, target_latency=5.0)
+    limiter.on_success(1.0)
+    assert limiter.rate == pytest.approx(1.05)
+    limiter.on_success(1.0)
+    limiter.on_success(1.0)
+    assert limiter.rate == pytest.approx(1.1)
+
+
+def test_slow_responses_cut_the_rate_down_to_min(clock):
+    limiter = RateLimiter(rate=1.0, min_rate=0.3, max_rate=2.0, decrease=0.5, target_latency=5.0)
+    limiter.on_success(6.0)
+    assert limiter.rate == pytest.approx(0.5)
+    limiter.on_success(6.0)
+    assert limiter.rate == pytest.approx(0.3)
+
+
+def test_block_cuts_the_rate_and_drains_the_bucket(clock):
+    limiter = RateLimiter(rate=2.0, min_rate=0.1, max_rate=4.0, burst=2.0, decrease=0.5)
+    limiter.on_block()
+    assert limiter.blocks == 1
+    assert limiter.rate == pytest.approx(1.0)
+    assert limiter.acquire() == pytest.approx(1.0)
+
+
+def test_backoff_doubles_within_equal_jitter_and_is_capped(monkeypatch):
+    monkeypatch.setattr(throttle.scraper_config, "backoff_base", 5.0)
+    monkeypatch.setattr(throttle.scraper_config, "backoff_cap", 120.0)
+    monkeypatch.setattr(throttle.random, "uniform", lambda low, high: high)
+    assert [backoff_delay(attempt) for attempt in range(6)] == [5, 10, 20, 40, 80, 120]
+    monkeypatch.setattr(throttle.random, "uniform", lambda low, high: low)
+    assert [backoff_delay(attempt) for attempt in range(6)] == [2.5, 5, 10, 20, 40, 60]